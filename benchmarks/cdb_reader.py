@@ -0,0 +1,491 @@
+"""
+CDB reader benchmarks
+---------------------
+
+Benchmark suite driving every loader and the hot accessors of ``SOFiSTiKCDBReader``
+through the in-memory backend, on synthetic models built by ``generate_model``. No
+SOFiSTiK installation is required.
+
+Run from the repository root::
+
+    python -m benchmarks.cdb_reader --records 10000 100000 1000000 --output results.json
+
+For each case and scale the results report the number of records read (loaders) or of
+calls (accessors), the wall time of each repetition, the throughput, the per-call latency
+percentiles (accessors) and the peak memory traced by :mod:`tracemalloc` during an
+additional, untimed run. Results are printed as JSON, or written to ``--output``.
+
+Some keys cannot reach the requested scale: there are at most 999 primary and 1000
+secondary groups, at most 99999 load cases and properties are loaded one at a time.
+Their scale is capped and the actual number of records is reported.
+"""
+# standard library imports
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from gc import collect
+from io import StringIO
+from json import dumps
+from pathlib import Path
+from platform import platform, python_version
+from statistics import median
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable
+
+# third party library imports
+import numpy
+from numpy import percentile
+from numpy.random import default_rng
+import pandas
+
+# local library specific imports
+from py_sofistik_utils import (
+    __version__,
+    generate_model,
+    MemoryCDB,
+    MemoryDll,
+    SOFiSTiKCDBReader
+)
+
+
+_N_STATIONS = 5
+
+
+class _Case:
+    """A benchmark case.
+
+    Parameters
+    ----------
+    name : str
+        Case name, e.g. ``"node_data.load"``
+    model : Callable[[int], dict[str, Any]]
+        Return the ``generate_model`` arguments for the requested scale
+    keys : list[tuple[int, int]]
+        Keys read by the case, used to count the records and to build the lazy
+        keys before timing
+    run : Callable[[SOFiSTiKCDBReader, dict[str, Any]], int | None]
+        The benchmarked code. Loaders return None, accessors return the number
+        of calls after recording their latencies through ``context``.
+    setup : Callable[[SOFiSTiKCDBReader, dict[str, Any]], None] | None
+        Untimed preparation, e.g. loading the data used by an accessor
+    """
+    def __init__(
+            self,
+            name: str,
+            model: Callable[[int], dict[str, Any]],
+            keys: list[tuple[int, int]],
+            run: Callable[[SOFiSTiKCDBReader, dict[str, Any]], int | None],
+            setup: Callable[[SOFiSTiKCDBReader, dict[str, Any]], None] | None = None
+    ) -> None:
+        self.name = name
+        self.model = model
+        self.keys = keys
+        self.run = run
+        self.setup = setup
+
+    @property
+    def is_accessor(self) -> bool:
+        """`True` if the case benchmarks an accessor rather than a loader.
+        """
+        return not self.name.endswith(".load") and not self.name.endswith("load_all")
+
+
+def _calls(
+        function: Callable[..., Any],
+        arguments: list[tuple[Any, ...]],
+        context: dict[str, Any]
+) -> int:
+    """Call ``function`` once per item of ``arguments`` and store the latencies
+    in ``context``.
+    """
+    latencies: list[float] = []
+    for args in arguments:
+        start_time = perf_counter()
+        function(*args)
+        latencies.append(perf_counter() - start_time)
+
+    context["latencies"] = latencies
+    return len(arguments)
+
+
+def _sample(ids: Any, context: dict[str, Any]) -> list[int]:
+    """Return a reproducible random sample of the given IDs.
+    """
+    rng = default_rng(0)
+    return [int(_) for _ in rng.choice(ids, size=context["calls"])]
+
+
+def _cases() -> list[_Case]:
+    """Return all the benchmark cases.
+    """
+    def elements(kind: str) -> Callable[[int], dict[str, Any]]:
+        return lambda scale: {"n_nodes": max(scale, 16), kind: scale}
+
+    def beams(scale: int) -> dict[str, Any]:
+        return {
+            "n_nodes": max(scale // _N_STATIONS, 16),
+            "n_beams": max(scale // _N_STATIONS, 1),
+            "n_stations": _N_STATIONS
+        }
+
+    def groups(scale: int) -> dict[str, Any]:
+        # each group holds one element of each type, i.e. 6 records per group
+        n_groups = max(1, min(999, scale // 6))
+        return {
+            "n_nodes": max(2 * n_groups, 16),
+            "n_beams": n_groups,
+            "n_trusses": n_groups,
+            "n_cables": n_groups,
+            "n_springs": n_groups,
+            "n_quads": n_groups,
+            "n_groups": n_groups
+        }
+
+    def secondary_groups(scale: int) -> dict[str, Any]:
+        return {**groups(scale), "n_secondary_groups": max(1, min(1000, scale // 6))}
+
+    def load_properties(reader: SOFiSTiKCDBReader, context: dict[str, Any]) -> None:
+        for property_number in range(1, context["n_properties"] + 1):
+            reader.properties.load(property_number)
+
+    def load_ids(
+            table: str,
+            column: str,
+            load_case: int | None = None
+    ) -> Callable[[SOFiSTiKCDBReader, dict[str, Any]], None]:
+        # setup of the accessors: load the table and keep its IDs for sampling
+        def setup(reader: SOFiSTiKCDBReader, context: dict[str, Any]) -> None:
+            reader.load_table(table, load_case)
+            context["ids"] = reader.table_data(table)[column]
+        return setup
+
+    cases = [
+        _Case(
+            "node_data.load",
+            lambda scale: {"n_nodes": max(scale, 16)},
+            [(20, 0)],
+            lambda reader, _: reader.nodes.data.load()
+        ),
+        _Case(
+            "node_results.load",
+            lambda scale: {"n_nodes": max(scale, 16)},
+            [(24, 1)],
+            lambda reader, _: reader.nodes.results.load(1)
+        ),
+        _Case(
+            "beam_data.load",
+            beams,
+            [(100, 0)],
+            lambda reader, _: reader.beam_geo.load()
+        ),
+        _Case(
+            "beam_load.load",
+            elements("n_beams"),
+            [(101, 1)],
+            lambda reader, _: reader.beam_load.load(1)
+        ),
+        _Case(
+            "beam_results.load",
+            beams,
+            [(102, 1)],
+            lambda reader, _: reader.beam_res.load(1)
+        ),
+        _Case(
+            "beam_stress.load",
+            beams,
+            [(105, 1)],
+            lambda reader, _: reader.beam_stress.load(1)
+        ),
+        _Case(
+            "cable_data.load",
+            elements("n_cables"),
+            [(160, 0)],
+            lambda reader, _: reader.cable.data.load()
+        ),
+        _Case(
+            "cable_load.load",
+            elements("n_cables"),
+            [(161, 1)],
+            lambda reader, _: reader.cable.load.load(1)
+        ),
+        _Case(
+            "cable_result.load",
+            elements("n_cables"),
+            [(162, 1)],
+            lambda reader, _: reader.cable.result.load(1)
+        ),
+        _Case(
+            "truss_data.load",
+            elements("n_trusses"),
+            [(150, 0)],
+            lambda reader, _: reader.truss.data.load()
+        ),
+        _Case(
+            "truss_load.load",
+            elements("n_trusses"),
+            [(151, 1)],
+            lambda reader, _: reader.truss.load.load(1)
+        ),
+        _Case(
+            "truss_result.load",
+            elements("n_trusses"),
+            [(152, 1)],
+            lambda reader, _: reader.truss.result.load(1)
+        ),
+        _Case(
+            "spring_data.load",
+            elements("n_springs"),
+            [(170, 0)],
+            lambda reader, _: reader.spring.data.load()
+        ),
+        _Case(
+            "spring_result.load",
+            elements("n_springs"),
+            [(170, 1)],
+            lambda reader, _: reader.spring.result.load(1)
+        ),
+        _Case(
+            "group_data.load",
+            groups,
+            [(11, 0)],
+            lambda reader, _: reader.grp_data.load()
+        ),
+        _Case(
+            "group_lc_data.load",
+            groups,
+            [(11, 1)],
+            lambda reader, _: reader.grp_lc_data.load(1)
+        ),
+        _Case(
+            "sec_group_lc_data.load",
+            secondary_groups,
+            [(11, 1)],
+            lambda reader, _: reader.sec_grp_lc_data.load(1)
+        ),
+        _Case(
+            "load_cases.load_all",
+            lambda scale: {"n_nodes": 16, "load_cases": max(1, min(99999, scale))},
+            [],
+            lambda reader, _: reader.load_case.load_all()
+        ),
+        _Case(
+            "plate_data.load",
+            elements("n_quads"),
+            [(200, 0)],
+            lambda reader, _: reader.plate_data.load()
+        ),
+        _Case(
+            "property.load",
+            lambda scale: {"n_nodes": 16, "n_properties": max(1, min(1000, scale // 2))},
+            [],
+            load_properties
+        ),
+        _Case(
+            "cable_data.get",
+            elements("n_cables"),
+            [(160, 0)],
+            lambda reader, context: _calls(
+                reader.cable.data.get,
+                [(_, "L0") for _ in _sample(context["ids"], context)],
+                context
+            ),
+            load_ids("cable_data", "ELEM_ID")
+        ),
+        _Case(
+            "cable_result.get",
+            elements("n_cables"),
+            [(162, 1)],
+            lambda reader, context: _calls(
+                reader.cable.result.get,
+                [(_, 1) for _ in _sample(context["ids"], context)],
+                context
+            ),
+            load_ids("cable_result", "ELEM_ID", 1)
+        ),
+        _Case(
+            "node_results.get_displacements",
+            lambda scale: {"n_nodes": max(scale, 16)},
+            [(24, 1)],
+            lambda reader, context: _calls(
+                reader.nodes.results.get_displacements,
+                [(1, _) for _ in _sample(context["ids"], context)],
+                context
+            ),
+            load_ids("node_result", "ID", 1)
+        ),
+        _Case(
+            "beam_data.get_element_connectivity",
+            beams,
+            [(100, 0)],
+            lambda reader, context: _calls(
+                reader.beam_geo.get_element_connectivity,
+                [(_,) for _ in _sample(context["ids"], context)],
+                context
+            ),
+            load_ids("beam_data", "ELEM_ID")
+        ),
+        _Case(
+            "plate_data.get_element_connectivity",
+            elements("n_quads"),
+            [(200, 0)],
+            lambda reader, context: _calls(
+                reader.plate_data.get_element_connectivity,
+                [(_,) for _ in _sample(context["ids"], context)],
+                context
+            ),
+            load_ids("plate_data", "ELEM_ID")
+        )
+    ]
+    return cases
+
+
+def _count_records(cdb: MemoryCDB, keys: list[tuple[int, int]]) -> int:
+    """Return the number of records of the given keys, building the lazy ones.
+    """
+    if not keys:
+        keys = cdb.keys()
+    return sum(cdb.records(*_)[1].size - 1 for _ in keys)
+
+
+def run_case(case: _Case, scale: int, repeat: int = 3, calls: int = 1000) -> dict[str, Any]:
+    """Run ``case`` at the given ``scale`` and return its results.
+    """
+    arguments = case.model(scale)
+    cdb = generate_model(cache_size=1024, **arguments)
+    context: dict[str, Any] = {"calls": calls, **arguments}
+    if case.name == "load_cases.load_all":
+        keys = [_ for _ in cdb.keys() if _[0] == 12]
+    elif case.name == "property.load":
+        keys = [_ for _ in cdb.keys() if _[0] == 9]
+    else:
+        keys = case.keys
+
+    result: dict[str, Any] = {
+        "case": case.name,
+        "kind": "accessor" if case.is_accessor else "loader",
+        "scale": scale,
+        "records": _count_records(cdb, keys),
+        "status": "ok"
+    }
+
+    def execute() -> int | None:
+        reader = SOFiSTiKCDBReader("", "BENCHMARK", "", dll=MemoryDll(cdb))
+        reader.initialize()
+        try:
+            if case.setup is not None:
+                case.setup(reader, context)
+            collect()
+            start_time = perf_counter()
+            n_calls = case.run(reader, context)
+            context["elapsed"] = perf_counter() - start_time
+            return n_calls
+        finally:
+            with redirect_stdout(StringIO()):
+                reader.close()
+
+    try:
+        times: list[float] = []
+        latencies: list[float] = []
+        n_calls = None
+        for _ in range(repeat):
+            n_calls = execute()
+            times.append(context["elapsed"])
+            latencies.extend(context.get("latencies", []))
+
+        start()
+        try:
+            execute()
+            result["peak_memory"] = get_traced_memory()[1]
+        finally:
+            stop()
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        result["status"] = f"error: {type(e).__name__}: {e}"
+        return result
+
+    result["times"] = times
+    result["time_min"] = min(times)
+    result["time_median"] = median(times)
+    if n_calls is None:
+        result["throughput"] = result["records"] / result["time_min"]
+        result["throughput_unit"] = "records/s"
+    else:
+        result["calls"] = n_calls
+        result["throughput"] = n_calls / result["time_min"]
+        result["throughput_unit"] = "calls/s"
+        result["latency_mean"] = sum(latencies) / len(latencies)
+        result["latency_p50"] = float(percentile(latencies, 50))
+        result["latency_p95"] = float(percentile(latencies, 95))
+        result["latency_max"] = max(latencies)
+
+    return result
+
+
+def run(
+        scales: list[int],
+        cases: list[str] | None = None,
+        repeat: int = 3,
+        calls: int = 1000
+) -> dict[str, Any]:
+    """Run the selected ``cases`` (all of them when None) at every scale and
+    return the results together with the environment metadata.
+    """
+    selected = [_ for _ in _cases() if cases is None or _.name in cases]
+    results = [
+        run_case(case, scale, repeat, calls)
+        for scale in scales
+        for case in selected
+    ]
+
+    return {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "platform": platform(),
+            "python": python_version(),
+            "numpy": numpy.__version__,
+            "pandas": pandas.__version__,
+            "py_sofistik_utils": __version__,
+            "repeat": repeat,
+            "calls": calls
+        },
+        "results": results
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point.
+    """
+    parser = ArgumentParser(description=__doc__.split("\n")[4])
+    parser.add_argument(
+        "--records",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="number of records of each benchmarked key"
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        default=None,
+        help="run only the given cases, see --list"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed repetitions")
+    parser.add_argument("--calls", type=int, default=1000, help="calls per accessor")
+    parser.add_argument("--output", default=None, help="JSON output file")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(_.name for _ in _cases()))
+        return
+
+    output = dumps(run(args.records, args.cases, args.repeat, args.calls), indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        Path(args.output).write_text(output, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Benchmark comparison
+--------------------
+
+Performance regression gate for the results of :mod:`benchmarks.cdb_reader`.
+
+Baselines are stored per scenario, i.e. per case and scale, in a versioned JSON file.
+A new run is compared against them and the gate fails, with exit code 1, when the
+throughput of a scenario drops or its peak memory grows beyond the given tolerances.
+
+The reference baseline, recorded at 10000 and 100000 records on the machine and with
+the versions listed in its ``metadata``, is ``benchmarks/baselines.json``. Throughputs
+depend on the machine: record a baseline on the machine running the gate::
+
+    python -m benchmarks.cdb_reader --records 10000 100000 --output results.json
+    python -m benchmarks.compare results.json --baseline baselines.json --update
+
+Check a new run against it::
+
+    python -m benchmarks.compare results.json --baseline baselines.json --throughput 0.15
+
+Tolerances are relative to the baseline and exclusive: ``--throughput 0.15`` fails a
+scenario whose throughput is lower than 85% of the baseline one, and ``--memory 0.25``
+one whose peak memory is higher than 125% of the baseline one. Faster or leaner runs
+always pass. The tolerances given on the command line can be overridden per
+scenario through the ``tolerances`` entry of the baseline file, e.g.::
+
+    "tolerances": {"node_results.get_displacements@1000000": {"throughput": 0.30}}
+
+Scenarios missing from either file and scenarios that failed are reported, but only
+the latter fail the gate.
+"""
+# standard library imports
+from argparse import ArgumentParser
+from json import dumps, loads
+from pathlib import Path
+from sys import exit as sys_exit
+from typing import Any
+
+# third party library imports
+
+# local library specific imports
+
+
+BASELINE_FORMAT = 1
+
+
+def _scenario(result: dict[str, Any]) -> str:
+    """Return the scenario name of a benchmark result, e.g. ``"cable_result.load@10000"``.
+    """
+    return f"{result['case']}@{result['scale']}"
+
+
+def make_baseline(
+        run: dict[str, Any],
+        previous: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Return the baseline built from the results of a benchmark ``run``.
+
+    The scenarios of the ``previous`` baseline that are not part of ``run`` are
+    kept, as well as its ``tolerances``. Failed scenarios are not stored.
+    """
+    previous = previous or {}
+    scenarios = dict(previous.get("scenarios", {}))
+    for result in run["results"]:
+        if result["status"] != "ok":
+            continue
+
+        scenarios[_scenario(result)] = {
+            "records": result["records"],
+            "throughput": result["throughput"],
+            "throughput_unit": result["throughput_unit"],
+            "peak_memory": result["peak_memory"]
+        }
+
+    return {
+        "format": BASELINE_FORMAT,
+        "metadata": run["metadata"],
+        "tolerances": previous.get("tolerances", {}),
+        "scenarios": dict(sorted(scenarios.items()))
+    }
+
+
+def compare(
+        run: dict[str, Any],
+        baseline: dict[str, Any],
+        throughput: float = 0.15,
+        memory: float = 0.25
+) -> list[dict[str, Any]]:
+    """Compare the results of a benchmark ``run`` against a ``baseline``.
+
+    Parameters
+    ----------
+    run : dict[str, Any]
+        Output of :func:`benchmarks.cdb_reader.run`
+    baseline : dict[str, Any]
+        Baseline, see :func:`make_baseline`
+    throughput : float, default 0.15
+        Maximum relative drop of the throughput
+    memory : float, default 0.25
+        Maximum relative growth of the peak memory
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One entry per scenario, with its ``status``: ``"ok"``, ``"regression"``,
+        ``"error"``, ``"new"`` (not in the baseline) or ``"missing"`` (not in
+        the run).
+
+    Raises
+    ------
+    RuntimeError
+        If the format of ``baseline`` is not supported.
+    """
+    if baseline.get("format") != BASELINE_FORMAT:
+        raise RuntimeError(
+            f"Unsupported baseline format {baseline.get('format')}, "
+            f"expected {BASELINE_FORMAT}!"
+        )
+
+    scenarios = baseline["scenarios"]
+    comparison: list[dict[str, Any]] = []
+    for result in run["results"]:
+        name = _scenario(result)
+        entry: dict[str, Any] = {"scenario": name, "messages": []}
+        comparison.append(entry)
+
+        if result["status"] != "ok":
+            entry["status"] = "error"
+            entry["messages"].append(result["status"])
+            continue
+
+        if name not in scenarios:
+            entry["status"] = "new"
+            continue
+
+        reference = scenarios[name]
+        tolerances = {
+            "throughput": throughput,
+            "memory": memory,
+            **baseline.get("tolerances", {}).get(name, {})
+        }
+
+        entry["throughput_ratio"] = result["throughput"] / reference["throughput"]
+        entry["memory_ratio"] = result["peak_memory"] / max(reference["peak_memory"], 1)
+
+        if entry["throughput_ratio"] < 1.0 - tolerances["throughput"]:
+            entry["messages"].append(
+                f"throughput dropped by {1.0 - entry['throughput_ratio']:.1%} "
+                f"(tolerance {tolerances['throughput']:.1%})"
+            )
+
+        if entry["memory_ratio"] > 1.0 + tolerances["memory"]:
+            entry["messages"].append(
+                f"peak memory grew by {entry['memory_ratio'] - 1.0:.1%} "
+                f"(tolerance {tolerances['memory']:.1%})"
+            )
+
+        entry["status"] = "regression" if entry["messages"] else "ok"
+
+    executed = {_["scenario"] for _ in comparison}
+    comparison.extend(
+        {"scenario": _, "status": "missing", "messages": []}
+        for _ in scenarios
+        if _ not in executed
+    )
+
+    return comparison
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point, return the exit code.
+    """
+    parser = ArgumentParser(description=__doc__.split("\n")[4])
+    parser.add_argument("results", help="JSON output of benchmarks.cdb_reader")
+    parser.add_argument("--baseline", required=True, help="baseline JSON file")
+    parser.add_argument(
+        "--throughput",
+        type=float,
+        default=0.15,
+        help="maximum relative throughput drop"
+    )
+    parser.add_argument(
+        "--memory",
+        type=float,
+        default=0.25,
+        help="maximum relative peak memory growth"
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="store the results in the baseline instead of comparing"
+    )
+    args = parser.parse_args(argv)
+
+    run = loads(Path(args.results).read_text(encoding="utf-8"))
+    baseline_path = Path(args.baseline)
+
+    if args.update:
+        previous = None
+        if baseline_path.exists():
+            previous = loads(baseline_path.read_text(encoding="utf-8"))
+        baseline = make_baseline(run, previous)
+        baseline_path.write_text(dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline {baseline_path} updated.")
+        return 0
+
+    baseline = loads(baseline_path.read_text(encoding="utf-8"))
+    comparison = compare(run, baseline, args.throughput, args.memory)
+
+    for entry in comparison:
+        ratios = ""
+        if "throughput_ratio" in entry:
+            ratios = (
+                f" throughput x{entry['throughput_ratio']:.2f},"
+                f" memory x{entry['memory_ratio']:.2f}"
+            )
+        print(f"{entry['status']:>10}  {entry['scenario']}{ratios}")
+        for message in entry["messages"]:
+            print(f"{'':>12}{message}")
+
+    failed = [_ for _ in comparison if _["status"] in ("regression", "error")]
+    if failed:
+        print(f"{len(failed)} scenario(s) failed!")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys_exit(main())
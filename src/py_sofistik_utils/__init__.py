@@ -2,19 +2,68 @@
 The Studio W Python utilities for the SOFiSTiK finite element analysis software.
 """
 # standard library imports
+from importlib import import_module
 from sys import version_info
+from typing import Any, TYPE_CHECKING
 if version_info < (3, 12):
     raise ImportError("py-sofistik-utils does not support Python < 3.12!")
 
 # third party library imports
 
 # local library specific imports
-from py_sofistik_utils.cdb_reader import SOFiSTiKCDBReader
+if TYPE_CHECKING:
+    from py_sofistik_utils.cdb_reader import (
+        batch_extract,
+        CancellationToken,
+        diff_frames,
+        diff_tables,
+        ExtractionPlan,
+        generate_model,
+        LoadHook,
+        MemoryCDB,
+        MemoryDll,
+        QueryService,
+        serve,
+        SharedTable,
+        SharedTableHandle,
+        SOFiSTiKCDBReader,
+        TableDiff
+    )
 
 
 __version__ = "0.0.1-dev1"
 
 __all__ = (
     "__version__",
-    "SOFiSTiKCDBReader"
+    "batch_extract",
+    "CancellationToken",
+    "diff_frames",
+    "diff_tables",
+    "ExtractionPlan",
+    "generate_model",
+    "LoadHook",
+    "MemoryCDB",
+    "MemoryDll",
+    "QueryService",
+    "serve",
+    "SharedTable",
+    "SharedTableHandle",
+    "SOFiSTiKCDBReader",
+    "TableDiff"
 )
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public names from ``py_sofistik_utils.cdb_reader`` on first
+    access, so that importing the package stays cheap.
+    """
+    if name not in __all__ or name == "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module("py_sofistik_utils.cdb_reader"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
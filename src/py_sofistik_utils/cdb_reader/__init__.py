@@ -1,37 +1,145 @@
-from . _internals.beam_data import _BeamData
-from . _internals.beam_load import _BeamLoad
-from . _internals.beam_results import _BeamResults
-from . _internals.beam_stresses import _BeamStress
-from . _internals.cable import Cables
-from . _internals.cable_data import CableData
-from . _internals.cable_load import CableLoad
-from . _internals.cable_result import CableResult
-from . _internals.group_data import _GroupData
-from . _internals.group_lc_data import _GroupLCData
-from . _internals.load_cases import _LoadCases
-from . _internals.nodes import _Nodes
-from . _internals.node_data import _NodeData
-from . _internals.node_residuals import _NodeResiduals
-from . _internals.node_results import _NodeResults
-from . _internals.plate_data import _PlateData
-from . _internals.property import _PropertyData
-from . _internals.sec_group_lc_data import _SecondaryGroupLCData
-from . _internals.spring import _Spring
-from . _internals.spring_data import _SpringData
-from . _internals.spring_result import _SpringResult
-from . _internals.truss import _Truss
-from . _internals.truss_data import _TrussData
-from . _internals.truss_load import _TrussLoad
-from . _internals.truss_result import _TrussResult
-
-from . reader import SOFiSTiKCDBReader
+"""
+The ``cdb_reader`` package. Its names are imported lazily on first access, so that
+importing the package does not import pandas, numpy and the loaders until needed.
+"""
+# standard library imports
+from importlib import import_module
+from typing import Any, TYPE_CHECKING
+
+# third party library imports
+
+# local library specific imports
+if TYPE_CHECKING:
+    from . _internals.beam_data import _BeamData
+    from . _internals.beam_geometry import _BeamGeometry
+    from . _internals.beam_load import _BeamLoad
+    from . _internals.beam_results import _BeamResults
+    from . _internals.beam_stresses import _BeamStress
+    from . _internals.beam_tensor import _BeamResultTensor
+    from . _internals.cable import Cables
+    from . _internals.cable_data import CableData
+    from . _internals.cable_load import CableLoad
+    from . _internals.cable_result import CableResult
+    from . _internals.group_data import _GroupData
+    from . _internals.group_lc_data import _GroupLCData
+    from . _internals.load_cases import _LoadCases
+    from . _internals.nodes import _Nodes
+    from . _internals.node_data import _NodeData
+    from . _internals.node_index import _NodeIndex
+    from . _internals.node_residuals import _NodeResiduals
+    from . _internals.node_results import _NodeResults
+    from . _internals.plate_data import _PlateData
+    from . _internals.plate_geometry import _PlateGeometry
+    from . _internals.property import _PropertyData
+    from . _internals.sec_group_lc_data import _SecondaryGroupLCData
+    from . _internals.spring import _Spring
+    from . _internals.spring_data import _SpringData
+    from . _internals.spring_result import _SpringResult
+    from . _internals.truss import _Truss
+    from . _internals.truss_data import _TrussData
+    from . _internals.truss_load import _TrussLoad
+    from . _internals.truss_result import _TrussResult
+
+    from . reader import SOFiSTiKCDBReader
+    from . batch import batch_extract, ExtractionPlan
+    from . diff import diff_frames, diff_tables, TableDiff
+    from . hooks import CancellationToken, LoadHook
+    from . memory_backend import MemoryCDB, MemoryDll
+    from . service import QueryService, serve
+    from . shared_tables import SharedTable, SharedTableHandle, SharedTableView
+    from . synthetic import generate_model
+
+
+# name -> module, relative to this package
+_LAZY_NAMES: dict[str, str] = {
+    "_BeamData":             "_internals.beam_data",
+    "_BeamGeometry":         "_internals.beam_geometry",
+    "_BeamLoad":             "_internals.beam_load",
+    "_BeamResults":          "_internals.beam_results",
+    "_BeamStress":           "_internals.beam_stresses",
+    "_BeamResultTensor":     "_internals.beam_tensor",
+    "Cables":                "_internals.cable",
+    "CableData":             "_internals.cable_data",
+    "CableLoad":             "_internals.cable_load",
+    "CableResult":           "_internals.cable_result",
+    "_GroupData":            "_internals.group_data",
+    "_GroupLCData":          "_internals.group_lc_data",
+    "_LoadCases":            "_internals.load_cases",
+    "_Nodes":                "_internals.nodes",
+    "_NodeData":             "_internals.node_data",
+    "_NodeIndex":            "_internals.node_index",
+    "_NodeResiduals":        "_internals.node_residuals",
+    "_NodeResults":          "_internals.node_results",
+    "_PlateData":            "_internals.plate_data",
+    "_PlateGeometry":        "_internals.plate_geometry",
+    "_PropertyData":         "_internals.property",
+    "_SecondaryGroupLCData": "_internals.sec_group_lc_data",
+    "_Spring":               "_internals.spring",
+    "_SpringData":           "_internals.spring_data",
+    "_SpringResult":         "_internals.spring_result",
+    "_Truss":                "_internals.truss",
+    "_TrussData":            "_internals.truss_data",
+    "_TrussLoad":            "_internals.truss_load",
+    "_TrussResult":          "_internals.truss_result",
+    "SOFiSTiKCDBReader":     "reader",
+    "batch_extract":         "batch",
+    "ExtractionPlan":        "batch",
+    "diff_frames":           "diff",
+    "diff_tables":           "diff",
+    "TableDiff":             "diff",
+    "CancellationToken":     "hooks",
+    "LoadHook":              "hooks",
+    "MemoryCDB":             "memory_backend",
+    "MemoryDll":             "memory_backend",
+    "QueryService":          "service",
+    "serve":                 "service",
+    "SharedTable":           "shared_tables",
+    "SharedTableHandle":     "shared_tables",
+    "SharedTableView":       "shared_tables",
+    "generate_model":        "synthetic",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import ``name`` from its module on first access and cache it.
+    """
+    try:
+        module = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_NAMES])
+
 
 __all__ = [
     "SOFiSTiKCDBReader",
+    "batch_extract",
+    "ExtractionPlan",
+    "diff_frames",
+    "diff_tables",
+    "TableDiff",
+    "CancellationToken",
+    "LoadHook",
+    "MemoryCDB",
+    "MemoryDll",
+    "QueryService",
+    "serve",
+    "SharedTable",
+    "SharedTableHandle",
+    "SharedTableView",
+    "generate_model",
     "_BeamData",
+    "_BeamGeometry",
     "_BeamLoad",
     "_BeamResults",
     "_BeamStress",
+    "_BeamResultTensor",
     "Cables",
     "CableData",
     "CableLoad",
@@ -41,9 +149,11 @@ __all__ = [
     "_LoadCases",
     "_Nodes",
     "_NodeData",
+    "_NodeIndex",
     "_NodeResiduals",
     "_NodeResults",
     "_PlateData",
+    "_PlateGeometry",
     "_PropertyData",
     "_SecondaryGroupLCData",
     "_Spring",
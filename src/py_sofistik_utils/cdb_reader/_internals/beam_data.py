@@ -3,15 +3,16 @@ from ctypes import byref, c_int, sizeof
 from typing import Any
 
 # third party library imports
-from numpy import array, float64, uint64
-from numpy.typing import NDArray
-from pandas import DataFrame, Series
+from numpy import array, float64, int8, int64
+from numpy.typing import ArrayLike, NDArray
+from pandas import DataFrame
 
 # local library specific imports
+from . beam_geometry import _BeamGeometry
 from . group_data import _GroupData
 from . sofistik_dll import SofDll
 from . sofistik_classes import CBEAM, CBEAM_SCT
-from . sofistik_utilities import decode_beam_end_release
+from . sofistik_utilities import BEAM_END_RELEASES, decode_beam_end_releases
 
 
 class _BeamData:
@@ -29,11 +30,21 @@ class _BeamData:
     * ``STATION``: :class:`numpy.ndarray` defining the position of the output stations
     * ``ADIMENSIONAL_STATION``: :class:`numpy.ndarray` defining the position of the output
       station unitarized by the beam length
-    * ``CONNECTIVITY``: :class:`numpy.ndarray` containing the start end nodes of the beam
+    * ``LENGTH``: the beam length
+    * ``N1`` and ``N2``: the start and end nodes of the beam
     * ``TRANS_MATRIX``: the beam transformation matrix (3 x 3 :class:`numpy.ndarray`)
     * ``SPAR``: :class:`numpy.ndarray` with distances along a continuous beam or parameter
       values along the reference axis
-    * ``PROPERTIES``: :class:`list` containing the property number for each station
+    * ``PROP_END_1`` and ``PROP_END_2``: the property numbers at the start and end of
+      the beam
+    * ``RELEASES_END_1`` and ``RELEASES_END_2``: `int8` bit mask of the forces and
+      moments released at the start and end of the beam, see ``BEAM_END_RELEASES``.
+      Use :meth:`get_element_releases` and :meth:`get_released_elements` to decode and
+      query them
+
+    Rows are looked up by ``ELEM_ID`` through the index of :class:`_BeamGeometry`;
+    :meth:`get_connectivities`, :meth:`get_lengths` and :meth:`get_properties` answer
+    arrays of beam numbers in one call.
     """
     def __init__(self, dll: SofDll) -> None:
         """The initializer of the ``BeamData`` class.
@@ -56,14 +67,33 @@ class _BeamData:
             ]
         )
         self._dll = dll
+        self._geometry = _BeamGeometry.empty()
 
     def clear(self) -> None:
         """Clear all the loaded data.
         """
         self._data = self._data[0:0]
+        self._geometry = _BeamGeometry.empty()
 
-    def get_element_connectivity(self, element_number: int) -> NDArray[uint64]:
-        """Return a shallow copy of the beam connectivity for the given ``element_number``.
+    def get_connectivities(self, element_numbers: ArrayLike) -> NDArray[int64]:
+        """Return the start and end nodes of the beams ``element_numbers`` as an
+        ``(n, 2)`` array, in one call.
+
+        Parameters
+        ----------
+        ``element_numbers``: ArrayLike
+            The beam element numbers
+
+        Raises
+        ------
+        RuntimeError
+            If any of the given ``element_numbers`` is not found.
+        """
+        positions = self._geometry.get_positions(element_numbers)
+        return self._data[["N1", "N2"]].to_numpy(dtype=int64)[positions]
+
+    def get_element_connectivity(self, element_number: int) -> NDArray[int64]:
+        """Return the start and end nodes of the beam ``element_number``.
 
         Parameters
         ----------
@@ -75,15 +105,13 @@ class _BeamData:
         RuntimeError
             If the given ``element_number`` is not found.
         """
-        mask = self._data["ELEM_ID"] == element_number
-
-        if mask.eq(False).all():
-            raise RuntimeError(f"Element number {element_number} not found!")
-
-        return self._data.CONNECTIVITY[mask].copy(deep = True).item()  # type: ignore
+        position = self._geometry.get_position(element_number)
+        return array(
+            [self._data["N1"].iat[position], self._data["N2"].iat[position]], dtype=int64
+        )
 
     def get_element_length(self, element_number: int) -> float:
-        """Return a shallow copy of the beam length for the given ``element_number``.
+        """Return the beam length for the given ``element_number``.
 
         Parameters
         ----------
@@ -95,15 +123,31 @@ class _BeamData:
         RuntimeError
             If the given ``element_number`` is not found.
         """
-        mask = self._data["ELEM_ID"] == element_number
+        return float(self._geometry.lengths[self._geometry.get_position(element_number)])
 
-        if mask.eq(False).all():
-            raise RuntimeError(f"Element number {element_number} not found!")
+    def get_element_properties(self, element_number: int) -> list[int]:
+        """Return the property numbers at the start and end of the beam
+        ``element_number``.
+
+        Parameters
+        ----------
+        ``element_number``: int
+            The beam element number
 
-        return self._data.LENGTH[mask].copy(deep = True).item()  # type: ignore
+        Raises
+        ------
+        RuntimeError
+            If the given ``element_number`` is not found.
+        """
+        position = self._geometry.get_position(element_number)
+        return [
+            int(self._data["PROP_END_1"].iat[position]),
+            int(self._data["PROP_END_2"].iat[position])
+        ]
 
-    def get_element_properties(self, element_number: int) -> list[int]:
-        """Return a shallow copy of the beam properties for the given ``element_number``.
+    def get_element_releases(self, element_number: int) -> tuple[str, str]:
+        """Return the decoded releases at the start and end of the beam with the
+        given ``element_number``, e.g. ``("MYMZ", "")``.
 
         Parameters
         ----------
@@ -115,15 +159,61 @@ class _BeamData:
         RuntimeError
             If the given ``element_number`` is not found.
         """
-        mask = self._data["ELEM_ID"] == element_number
+        position = self._geometry.get_position(element_number)
+        releases = decode_beam_end_releases(
+            array(
+                [
+                    self._data["RELEASES_END_1"].iat[position],
+                    self._data["RELEASES_END_2"].iat[position]
+                ]
+            )
+        )
+        return releases[0], releases[1]
 
-        if mask.eq(False).all():
-            raise RuntimeError(f"Element number {element_number} not found!")
+    def get_released_elements(
+            self,
+            release: str,
+            end: int | None = None
+    ) -> NDArray[int64]:
+        """Return the numbers of the beams releasing ``release``, e.g. ``"MY"``,
+        at the given ``end``.
 
-        return self._data.PROPERTIES[mask].to_list()[0]  # type: ignore
+        Parameters
+        ----------
+        ``release``: str
+            One of ``"N"``, ``"VY"``, ``"VZ"``, ``"MT"``, ``"MY"``, ``"MZ"`` and
+            ``"MB"``
+        ``end``: int | None, default None
+            ``1`` for the start, ``2`` for the end of the beam. When None, beams
+            releasing ``release`` at either end are returned.
+
+        Raises
+        ------
+        LookupError
+            If the given ``release`` or ``end`` is unknown.
+        """
+        if release not in BEAM_END_RELEASES:
+            raise LookupError(f"Release \"{release}\" not found!")
+
+        if end not in (None, 1, 2):
+            raise LookupError(f"Beam end {end} not found!")
+
+        columns = ["RELEASES_END_1", "RELEASES_END_2"] if end is None else [
+            f"RELEASES_END_{end}"
+        ]
+        masks = self._data[columns].to_numpy(dtype=int64) & BEAM_END_RELEASES[release]
+        return self._data["ELEM_ID"].to_numpy(dtype=int64)[masks.any(axis=1)]
+
+    def get_geometry(self) -> _BeamGeometry:
+        """Return the columnar geometry of the loaded beams. The ``STATION``,
+        ``ADIMENSIONAL_STATION``, ``TRANS_MATRIX`` and ``SPAR`` columns hold views
+        on its arrays.
+        """
+        return self._geometry
 
-    def get_group_connectivity(self, group_number: int) -> "Series[type[object]]":
-        """Return the beam connectivities for the given ``group_number``.
+    def get_group_connectivity(self, group_number: int) -> DataFrame:
+        """Return the beam connectivities for the given ``group_number``, with the
+        ``ELEM_ID``, ``N1`` and ``N2`` columns.
 
         Parameters
         ----------
@@ -140,7 +230,39 @@ class _BeamData:
         if grp_mask.eq(False).all():
             raise RuntimeError(f"Group {group_number} not found!")
 
-        return self._data.CONNECTIVITY[grp_mask].copy(deep = True)
+        return self._data.loc[grp_mask, ["ELEM_ID", "N1", "N2"]].copy(deep = True)
+
+    def get_lengths(self, element_numbers: ArrayLike) -> NDArray[float64]:
+        """Return the lengths of the beams ``element_numbers``, in one call.
+
+        Parameters
+        ----------
+        ``element_numbers``: ArrayLike
+            The beam element numbers
+
+        Raises
+        ------
+        RuntimeError
+            If any of the given ``element_numbers`` is not found.
+        """
+        return self._geometry.lengths[self._geometry.get_positions(element_numbers)]
+
+    def get_properties(self, element_numbers: ArrayLike) -> NDArray[int64]:
+        """Return the property numbers at the start and end of the beams
+        ``element_numbers`` as an ``(n, 2)`` array, in one call.
+
+        Parameters
+        ----------
+        ``element_numbers``: ArrayLike
+            The beam element numbers
+
+        Raises
+        ------
+        RuntimeError
+            If any of the given ``element_numbers`` is not found.
+        """
+        positions = self._geometry.get_positions(element_numbers)
+        return self._data[["PROP_END_1", "PROP_END_2"]].to_numpy(dtype=int64)[positions]
 
     def load(self) -> None:
         """Load beam data.
@@ -156,85 +278,103 @@ class _BeamData:
 
             temp_container: list[list[Any]] = []
             count = 0
-            while return_value < 2:
-                return_value = self._dll.get(
-                    1,
-                    100,
-                    0,
-                    byref(beam),
-                    byref(rec_length),
-                    0 if count == 0 else 1
-                )
-
-                if return_value >= 2:
-                    break
-
-                if beam.m_nr != 0:
-                    temp_list: list[Any] = [0 for _ in range(14)]
-                    temp_list[1] = beam.m_nr
-                    temp_list[2] = []
-                    temp_list[4] = beam.m_dl
-                    temp_list[5] = beam.m_node[0]
-                    temp_list[6] = beam.m_node[1]
-                    temp_list[7] = array(beam.m_t, dtype=float64)
-                    temp_list[8] = array(beam.m_spar, dtype=float64)
-                    temp_list[9] = 0
-                    temp_list[10] = 0
-                    temp_list[11] = ""
-                    temp_list[12] = ""
-                    temp_container.append(temp_list)
-
-                else:
-                    self._dll.get(
-                        1,
+            with self._dll.phase(100, 0, "read"):
+                while return_value < 2:
+                    return_value = self._dll.get(
+                        self._dll.index,
                         100,
                         0,
-                        byref(beam_sct),
-                        byref(rec_length_sct),
-                        -1
+                        byref(beam),
+                        byref(rec_length),
+                        0 if count == 0 else 1
                     )
-                    temp_container[-1][2].append(beam_sct.m_x)
-                    # temporary workaround, here I assume that prop cannot be 0
-                    if temp_container[-1][9] == 0:
-                        temp_container[-1][9] = beam_sct.m_nq
-                    else:
-                        temp_container[-1][10] = beam_sct.m_nq
 
-                    if beam_sct.m_x == 0.:
-                        temp_container[-1][11] = decode_beam_end_release(beam_sct.m_itp2)
-                    else:
-                        temp_container[-1][12] = decode_beam_end_release(beam_sct.m_itp2)
-                    rec_length_sct = c_int(sizeof(beam_sct))
+                    if return_value >= 2:
+                        break
+
+                    if beam.m_nr != 0:
+                        temp_list: list[Any] = [0 for _ in range(14)]
+                        temp_list[1] = beam.m_nr
+                        temp_list[2] = []
+                        temp_list[4] = beam.m_dl
+                        temp_list[5] = beam.m_node[0]
+                        temp_list[6] = beam.m_node[1]
+                        temp_list[7] = bytes(beam.m_t)
+                        temp_list[8] = bytes(beam.m_spar)
+                        temp_list[9] = 0
+                        temp_list[10] = 0
+                        temp_list[11] = 0
+                        temp_list[12] = 0
+                        temp_container.append(temp_list)
 
-                rec_length = c_int(sizeof(beam))
-                count += 1
+                    else:
+                        self._dll.get(
+                            self._dll.index,
+                            100,
+                            0,
+                            byref(beam_sct),
+                            byref(rec_length_sct),
+                            -1
+                        )
+                        temp_container[-1][2].append(beam_sct.m_x)
+                        # temporary workaround, here I assume that prop cannot be 0
+                        if temp_container[-1][9] == 0:
+                            temp_container[-1][9] = beam_sct.m_nq
+                        else:
+                            temp_container[-1][10] = beam_sct.m_nq
+
+                        if beam_sct.m_x == 0.:
+                            temp_container[-1][11] = beam_sct.m_itp2 & 127
+                        else:
+                            temp_container[-1][12] = beam_sct.m_itp2 & 127
+                        rec_length_sct = c_int(sizeof(beam_sct))
+
+                    rec_length = c_int(sizeof(beam))
+                    count += 1
 
             # preparing data for conversion to a pandas DataFrame
-            conv_data: list[dict[str, Any]] = []
-            for item in temp_container:
-                conv_data.append({"GROUP":                  item[0],
-                                  "ELEM_ID":                item[1],
-                                  "STATION":                array(item[2]),
-                                  "ADIMENSIONAL_STATION":   item[3],
-                                  "LENGTH":                 item[4],
-                                  "N1":                     item[5],
-                                  "N2":                     item[6],
-                                  "TRANS_MATRIX":           item[7],
-                                  "SPAR":                   item[8],
-                                  "PROP_END_1":             item[9],
-                                  "PROP_END_2":             item[10],
-                                  "RELEASES_END_1":         item[11],
-                                  "RELEASES_END_2":         item[12]
-                                  })
-
-            self._data = DataFrame(conv_data)
+            with self._dll.phase(100, 0, "frame"):
+                self._geometry = _BeamGeometry.from_records(
+                    [_[1] for _ in temp_container],
+                    [_[4] for _ in temp_container],
+                    [_[7] for _ in temp_container],
+                    [_[8] for _ in temp_container],
+                    [_[2] for _ in temp_container]
+                )
+                geometry = self._geometry
+                stations = geometry.split_stations(geometry.station_values)
+                adimensional_stations = geometry.split_stations(
+                    geometry.adimensional_station_values()
+                )
 
-            # assigning groups
-            group_data = _GroupData(self._dll)
-            group_data.load()
+                self._data = DataFrame(
+                    {
+                        "GROUP":                [_[0] for _ in temp_container],
+                        "ELEM_ID":              geometry.elem_ids,
+                        "STATION":              stations,
+                        "ADIMENSIONAL_STATION": adimensional_stations,
+                        "LENGTH":               geometry.lengths,
+                        "N1":                   [_[5] for _ in temp_container],
+                        "N2":                   [_[6] for _ in temp_container],
+                        "TRANS_MATRIX":         list(geometry.trans_matrices),
+                        "SPAR":                 list(geometry.spar),
+                        "PROP_END_1":           [_[9] for _ in temp_container],
+                        "PROP_END_2":           [_[10] for _ in temp_container],
+                        "RELEASES_END_1":       array(
+                                                    [_[11] for _ in temp_container],
+                                                    dtype=int8
+                                                ),
+                        "RELEASES_END_2":       array(
+                                                    [_[12] for _ in temp_container],
+                                                    dtype=int8
+                                                )
+                    }
+                )
 
-            for grp, beam_range in group_data.iterator_beam():
-                self._data.loc[self._data.ELEM_ID.isin(beam_range), "GROUP"] = grp
+            # assigning groups
+            with self._dll.phase(100, 0, "group"):
+                group_data = _GroupData(self._dll)
+                group_data.load()
 
-            # calculating adimensional beam station X/L
-            self._data.ADIMENSIONAL_STATION = self._data.STATION / self._data.LENGTH
+                for grp, beam_range in group_data.iterator_beam():
+                    self._data.loc[self._data.ELEM_ID.isin(beam_range), "GROUP"] = grp
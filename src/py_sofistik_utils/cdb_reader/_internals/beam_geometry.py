@@ -0,0 +1,167 @@
+# standard library imports
+from typing import Any
+
+# third party library imports
+from numpy import (
+    argsort, array, asarray, bool_, concatenate, cumsum, diff, errstate, float32,
+    float64, frombuffer, int64, repeat, searchsorted, split, unique, zeros
+)
+from numpy.typing import ArrayLike, NDArray
+
+# local library specific imports
+
+
+class _BeamGeometry:
+    """
+    The ``_BeamGeometry`` class stores the geometry of the beams of key ``100/00`` in
+    contiguous arrays, one entry per beam in loading order:
+
+    * ``elem_ids``: the beam numbers, shape ``(n,)``
+    * ``lengths``: the beam lengths, shape ``(n,)``
+    * ``trans_matrices``: the beam transformation matrices, shape ``(n, 3, 3)``
+    * ``spar``: distances along a continuous beam or parameter values along the
+      reference axis, shape ``(n, 2)``
+    * ``station_values``: the positions of the output stations of all the beams, one
+      after the other, shape ``(m,)``
+    * ``station_offsets``: the stations of the ``i``-th beam are
+      ``station_values[station_offsets[i]:station_offsets[i + 1]]``, shape ``(n + 1,)``
+    """
+    def __init__(
+            self,
+            elem_ids: NDArray[int64],
+            lengths: NDArray[float64],
+            trans_matrices: NDArray[float64],
+            spar: NDArray[float64],
+            station_values: NDArray[float64],
+            station_offsets: NDArray[int64]
+    ) -> None:
+        """The initializer of the ``_BeamGeometry`` class.
+        """
+        self.elem_ids = elem_ids
+        self.lengths = lengths
+        self.trans_matrices = trans_matrices
+        self.spar = spar
+        self.station_values = station_values
+        self.station_offsets = station_offsets
+        self._positions: dict[int, int] | None = None
+        self._order: NDArray[int64] | None = None
+
+    def __len__(self) -> int:
+        return self.elem_ids.size
+
+    @classmethod
+    def empty(cls) -> "_BeamGeometry":
+        """Return a geometry without beams.
+        """
+        return cls(
+            zeros(0, dtype=int64),
+            zeros(0, dtype=float64),
+            zeros((0, 3, 3), dtype=float64),
+            zeros((0, 2), dtype=float64),
+            zeros(0, dtype=float64),
+            zeros(1, dtype=int64)
+        )
+
+    @classmethod
+    def from_records(
+            cls,
+            elem_ids: list[int],
+            lengths: list[float],
+            trans_matrices: list[bytes],
+            spar: list[bytes],
+            stations: list[list[float]]
+    ) -> "_BeamGeometry":
+        """Build the geometry from the values read beam by beam, with the raw
+        ``float`` buffers of the transformation matrices and ``spar``.
+        """
+        if not elem_ids:
+            return cls.empty()
+
+        counts = array([len(_) for _ in stations], dtype=int64)
+        return cls(
+            array(elem_ids, dtype=int64),
+            array(lengths, dtype=float64),
+            frombuffer(b"".join(trans_matrices), dtype=float32)
+            .reshape(-1, 3, 3).astype(float64),
+            frombuffer(b"".join(spar), dtype=float32).reshape(-1, 2).astype(float64),
+            array([x for _ in stations for x in _], dtype=float64),
+            concatenate([zeros(1, dtype=int64), cumsum(counts)])
+        )
+
+    def adimensional_station_values(self) -> NDArray[float64]:
+        """Return the positions of the output stations divided by the beam length,
+        aligned with ``station_values``.
+        """
+        with errstate(divide="ignore", invalid="ignore"):
+            return self.station_values / repeat(self.lengths, self.station_counts())
+
+    def get_position(self, element_number: int) -> int:
+        """Return the position of the beam ``element_number`` in the arrays.
+
+        Raises
+        ------
+        RuntimeError
+            If the given ``element_number`` is not found.
+        """
+        if self._positions is None:
+            self._positions = {
+                int(elem_id): position for position, elem_id in enumerate(self.elem_ids)
+            }
+
+        try:
+            return self._positions[element_number]
+        except KeyError:
+            raise RuntimeError(f"Element number {element_number} not found!") from None
+
+    def get_positions(self, element_numbers: ArrayLike) -> NDArray[int64]:
+        """Return the positions of the beams ``element_numbers`` in the arrays, found
+        with a binary search over the sorted beam numbers.
+
+        Raises
+        ------
+        RuntimeError
+            If any of the given ``element_numbers`` is not found.
+        """
+        element_numbers = asarray(element_numbers, dtype=int64)
+        if self._order is None:
+            self._order = argsort(self.elem_ids, kind="stable")
+
+        sorted_ids = self.elem_ids[self._order]
+        positions = searchsorted(sorted_ids, element_numbers)
+        positions = positions.clip(0, max(len(self) - 1, 0))
+        is_found = zeros(element_numbers.shape, dtype=bool_)
+        if len(self):
+            is_found = sorted_ids[positions] == element_numbers
+
+        if not is_found.all():
+            missing = unique(element_numbers[~is_found]).tolist()
+            raise RuntimeError(f"Element numbers {missing} not found!")
+
+        return self._order[positions]
+
+    def get_stations(self, element_number: int) -> NDArray[float64]:
+        """Return a view on the output stations of the beam ``element_number``.
+
+        Raises
+        ------
+        RuntimeError
+            If the given ``element_number`` is not found.
+        """
+        position = self.get_position(element_number)
+        return self.station_values[
+            self.station_offsets[position]:self.station_offsets[position + 1]
+        ]
+
+    def split_stations(self, values: NDArray[Any]) -> list[NDArray[Any]]:
+        """Split ``values``, aligned with ``station_values``, into one view per
+        beam.
+        """
+        if not len(self):
+            return []
+
+        return split(values, self.station_offsets[1:-1])
+
+    def station_counts(self) -> NDArray[int64]:
+        """Return the number of output stations of each beam.
+        """
+        return diff(self.station_offsets)
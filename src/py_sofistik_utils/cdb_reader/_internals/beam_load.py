@@ -103,24 +103,27 @@ class _BeamLoad:
                 self.clear(load_case)
 
                 # load data
-                data = DataFrame(self._load(load_case))
+                with self._dll.phase(101, load_case, "read"):
+                    data = DataFrame(self._load(load_case))
 
                 # merge data
-                if self._data.empty:
-                    self._data = data
-                else:
-                    self._data = concat([self._data, data], ignore_index=True)
+                with self._dll.phase(101, load_case, "merge"):
+                    if self._data.empty:
+                        self._data = data
+                    else:
+                        self._data = concat([self._data, data], ignore_index=True)
                 self._loaded_lc.add(load_case)
 
             else:
                 continue
 
         # assigning groups
-        group_data = _GroupData(self._dll)
-        group_data.load()
+        with self._dll.phase(101, -1, "group"):
+            group_data = _GroupData(self._dll)
+            group_data.load()
 
-        for grp, cable_range in group_data.iterator_beam():
-            self._data.loc[self._data.ELEM_ID.isin(cable_range), "GROUP"] = grp
+            for grp, cable_range in group_data.iterator_beam():
+                self._data.loc[self._data.ELEM_ID.isin(cable_range), "GROUP"] = grp
 
     def _load(self, load_case: int) -> list[dict[str, Any]]:
         """
@@ -133,7 +136,7 @@ class _BeamLoad:
         count = 0
         while return_value < 2:
             return_value = self._dll.get(
-                1,
+                self._dll.index,
                 101,
                 load_case,
                 byref(cabl),
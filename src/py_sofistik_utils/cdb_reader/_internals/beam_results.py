@@ -2,9 +2,13 @@
 from ctypes import byref, c_int, sizeof
 
 # third party library imports
+from numpy import asarray, broadcast_arrays, float64
+from numpy.typing import ArrayLike
 from pandas import concat, DataFrame
 
 # local library specific imports
+from . beam_data import _BeamData
+from . beam_tensor import _BeamResultTensor
 from . group_lc_data import _GroupLCData
 from . sofistik_dll import SofDll
 from . sofistik_classes import CBEAM_FOR
@@ -50,6 +54,9 @@ class _BeamResults:
                                                      "MT2"])
         self._dll = dll
         self._loaded_lc: set[int] = set()
+        # tensor of all the loaded results used by interpolate, rebuilt after any load
+        # or clear
+        self._tensor: _BeamResultTensor | None = None
 
     def clear(self, load_case: int) -> None:
         """Clear the results for the given ``load_case`` number.
@@ -59,6 +66,7 @@ class _BeamResults:
 
         self._data = self._data.loc[~(self._data["LOAD_CASE"] == load_case), :]
         self._loaded_lc.remove(load_case)
+        self._tensor = None
 
     def clear_all(self) -> None:
         """Clear all the results for all the load cases.
@@ -68,12 +76,141 @@ class _BeamResults:
 
         self._data = self._data[0:0]
         self._loaded_lc.clear()
+        self._tensor = None
 
     def get_data(self) -> DataFrame:
         """Return a deep copy of all the beam results.
         """
         return self._data.copy(deep = True)
 
+    def get_tensor(
+            self,
+            components: list[str] | None = None,
+            load_cases: list[int] | None = None
+    ) -> _BeamResultTensor:
+        """Return the loaded results as ``(load_case, beam, station)`` arrays, see
+        :class:`_BeamResultTensor`.
+
+        Parameters
+        ----------
+        components: list[str] | None, default None
+            Force components, e.g. ``["N", "MY"]``. When None, all of them.
+        load_cases: list[int] | None, default None
+            Load cases. When None, all the loaded ones.
+
+        Raises
+        ------
+        LookupError
+            If any of the ``components`` is unknown.
+        RuntimeError
+            If any of the ``load_cases`` is not loaded.
+        """
+        all_components = list(self._data.columns[4:])
+        if components is None:
+            components = all_components
+
+        unknown = [_ for _ in components if _ not in all_components]
+        if unknown:
+            raise LookupError(f"Components {unknown} not found!")
+
+        data = self._data
+        if load_cases is not None:
+            missing = [_ for _ in load_cases if _ not in self._loaded_lc]
+            if missing:
+                raise RuntimeError(f"Load cases {missing} not loaded!")
+
+            data = data[data["LOAD_CASE"].isin(load_cases)]
+
+        return _BeamResultTensor.from_frame(data, components)
+
+    def interpolate(
+            self,
+            beam_data: _BeamData,
+            elem_ids: ArrayLike,
+            x: ArrayLike,
+            load_cases: ArrayLike,
+            components: list[str] | None = None,
+            adimensional: bool = False
+    ) -> DataFrame:
+        """Return the beam forces at arbitrary positions, e.g. at bolt lines, for many
+        ``(elem_id, x, load_case)`` queries at once. Values are interpolated linearly
+        between the two surrounding output stations.
+
+        The tensor of all the loaded results is built on the first call and reused
+        until a load case is loaded or cleared.
+
+        Parameters
+        ----------
+        beam_data: _BeamData
+            The loaded beam geometry, used to check ``x`` against the beam lengths.
+        elem_ids: ArrayLike
+            Beam numbers.
+        x: ArrayLike
+            Positions along the beams, broadcast against ``elem_ids`` and
+            ``load_cases``.
+        load_cases: ArrayLike
+            Load case numbers.
+        components: list[str] | None, default None
+            Force components. When None, ``N``, ``VY``, ``VZ``, ``MT``, ``MY`` and
+            ``MZ``.
+        adimensional: bool, default False
+            If True, ``x`` is given as a fraction of the beam length.
+
+        Returns
+        -------
+        DataFrame
+            One row per query, with the ``ELEM_ID``, ``X`` and ``LOAD_CASE`` columns
+            followed by one column per component. ``X`` is always dimensional.
+
+        Raises
+        ------
+        LookupError
+            If any of the ``components`` is unknown or any of the ``elem_ids`` has no
+            results.
+        RuntimeError
+            If any of the ``load_cases`` is not loaded, any of the ``elem_ids`` is not
+            found in ``beam_data`` or any position lies outside its beam.
+        """
+        if components is None:
+            components = ["N", "VY", "VZ", "MT", "MY", "MZ"]
+
+        elem_ids, x, load_cases = (
+            _.ravel() for _ in broadcast_arrays(
+                asarray(elem_ids), asarray(x, dtype=float64), asarray(load_cases)
+            )
+        )
+
+        geometry = beam_data.get_geometry()
+        lengths = geometry.lengths[geometry.get_positions(elem_ids)]
+        if adimensional:
+            x = x * lengths
+
+        tolerance = 1E-6 * lengths
+        is_outside = (x < -tolerance) | (x > lengths + tolerance)
+        if is_outside.any():
+            outside = sorted(set(elem_ids[is_outside].tolist()))
+            raise RuntimeError(f"Positions outside the beams {outside}!")
+
+        missing = sorted(set(load_cases.tolist()) - self._loaded_lc)
+        if missing:
+            raise RuntimeError(f"Load cases {missing} not loaded!")
+
+        unknown = [_ for _ in components if _ not in self._data.columns[4:]]
+        if unknown:
+            raise LookupError(f"Components {unknown} not found!")
+
+        if self._tensor is None:
+            self._tensor = self.get_tensor()
+
+        tensor = self._tensor
+        interpolated = DataFrame({"ELEM_ID": elem_ids, "X": x, "LOAD_CASE": load_cases})
+        for component in components:
+            interpolated[component] = tensor.interpolate(
+                component, elem_ids, x, load_cases
+            )
+
+        return interpolated
+
     def load(self, load_case: int) -> None:
         """Load the results for the given ``load_case`` number.
 
@@ -95,48 +232,55 @@ class _BeamResults:
 
             temp_container = []
             count = 0
-            while return_value < 2:
-                return_value = self._dll.get(
-                    1,
-                    102,
-                    load_case,
-                    byref(beam),
-                    byref(record_length),
-                    0 if count == 0 else 1
-                )
-
-                if return_value >= 2:
-                    break
-
-                if beam.m_nr > 0:
-                    temp_container.append({"LOAD_CASE": load_case,
-                                           "GROUP": 0,
-                                           "ELEM_ID": beam.m_nr,
-                                           "STATION": beam.m_x,
-                                           "N": beam.m_n,
-                                           "VY": beam.m_vy,
-                                           "VZ": beam.m_vz,
-                                           "MT": beam.m_mt,
-                                           "MY": beam.m_my,
-                                           "MZ": beam.m_mz,
-                                           "MB": beam.m_mb,
-                                           "MT2": beam.m_mt2,
-                                           })
-
-                record_length = c_int(sizeof(beam))
-                count += 1
-
-            data = DataFrame(temp_container)
+            with self._dll.phase(102, load_case, "read"):
+                while return_value < 2:
+                    return_value = self._dll.get(
+                        self._dll.index,
+                        102,
+                        load_case,
+                        byref(beam),
+                        byref(record_length),
+                        0 if count == 0 else 1
+                    )
+
+                    if return_value >= 2:
+                        break
+
+                    if beam.m_nr > 0:
+                        temp_container.append({"LOAD_CASE": load_case,
+                                               "GROUP": 0,
+                                               "ELEM_ID": beam.m_nr,
+                                               "STATION": beam.m_x,
+                                               "N": beam.m_n,
+                                               "VY": beam.m_vy,
+                                               "VZ": beam.m_vz,
+                                               "MT": beam.m_mt,
+                                               "MY": beam.m_my,
+                                               "MZ": beam.m_mz,
+                                               "MB": beam.m_mb,
+                                               "MT2": beam.m_mt2,
+                                               })
+
+                    record_length = c_int(sizeof(beam))
+                    count += 1
+
+            with self._dll.phase(102, load_case, "frame"):
+                data = DataFrame(temp_container)
 
             # assigning groups
-            group_lc_data = _GroupLCData(self._dll)
-            group_lc_data.load(load_case)
+            with self._dll.phase(102, load_case, "group"):
+                group_lc_data = _GroupLCData(self._dll)
+                group_lc_data.load(load_case)
 
-            for grp, beam_range in group_lc_data.iterator_beam(load_case):
-                data.loc[data.ELEM_ID.isin(beam_range), "GROUP"] = grp
+                if not data.empty:
+                    data["GROUP"] = group_lc_data.get_element_groups(
+                        load_case, data["ELEM_ID"].to_numpy(), "beam"
+                    )
 
-            if self._data.empty:
-                self._data = data
-            else:
-                self._data = concat([self._data, data], ignore_index=True)
+            with self._dll.phase(102, load_case, "merge"):
+                if self._data.empty:
+                    self._data = data
+                else:
+                    self._data = concat([self._data, data], ignore_index=True)
             self._loaded_lc.add(load_case)
+            self._tensor = None
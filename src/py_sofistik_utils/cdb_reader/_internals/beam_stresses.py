@@ -76,46 +76,52 @@ class _BeamStress:
 
             temp_container = []
             count = 0
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    105,
-                    load_case,
-                    byref(beam_stress),
-                    byref(record_length),
-                    0 if count == 0 else 1
-                )
-
-                if return_value.value >= 2:
-                    break
-
-                if beam_stress.m_nr > 0:
-                    if (1024 & beam_stress.m_mnr) > 0 and beam_stress.m_mnr < 20000:
-                        temp_container.append({
-                            "LOAD_CASE": load_case,
-                            "GROUP": 0,
-                            "ELEM_ID": beam_stress.m_nr,
-                            "STATION": beam_stress.m_x,
-                            "SIG_C": beam_stress.m_sigc,
-                            "SIG_T": beam_stress.m_sigt,
-                            "TAU": beam_stress.m_tau,
-                            "SIG_VM": beam_stress.m_sigv
-                        })
-
-                record_length = c_int(sizeof(beam_stress))
-                count += 1
-
-            data = DataFrame(temp_container)
+            with self._dll.phase(105, load_case, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        105,
+                        load_case,
+                        byref(beam_stress),
+                        byref(record_length),
+                        0 if count == 0 else 1
+                    )
+
+                    if return_value.value >= 2:
+                        break
+
+                    if beam_stress.m_nr > 0:
+                        if (1024 & beam_stress.m_mnr) > 0 and beam_stress.m_mnr < 20000:
+                            temp_container.append({
+                                "LOAD_CASE": load_case,
+                                "GROUP": 0,
+                                "ELEM_ID": beam_stress.m_nr,
+                                "STATION": beam_stress.m_x,
+                                "SIG_C": beam_stress.m_sigc,
+                                "SIG_T": beam_stress.m_sigt,
+                                "TAU": beam_stress.m_tau,
+                                "SIG_VM": beam_stress.m_sigv
+                            })
+
+                    record_length = c_int(sizeof(beam_stress))
+                    count += 1
+
+            with self._dll.phase(105, load_case, "frame"):
+                data = DataFrame(temp_container)
 
             # assigning groups
-            group_lc_data = _GroupLCData(self._dll)
-            group_lc_data.load(load_case)
-
-            for grp, beam_stress_range in group_lc_data.iterator_beam(load_case):
-                data.loc[data.ELEM_ID.isin(beam_stress_range), "GROUP"] = grp
-
-            if self._data.empty:
-                self._data = data
-            else:
-                self._data = concat([self._data, data], ignore_index=True)
+            with self._dll.phase(105, load_case, "group"):
+                group_lc_data = _GroupLCData(self._dll)
+                group_lc_data.load(load_case)
+
+                if not data.empty:
+                    data["GROUP"] = group_lc_data.get_element_groups(
+                        load_case, data["ELEM_ID"].to_numpy(), "beam"
+                    )
+
+            with self._dll.phase(105, load_case, "merge"):
+                if self._data.empty:
+                    self._data = data
+                else:
+                    self._data = concat([self._data, data], ignore_index=True)
             self._loaded_lc.add(load_case)
@@ -0,0 +1,254 @@
+# standard library imports
+from typing import Any
+
+# third party library imports
+from numpy import (
+    arange, argmax, argsort, asarray, broadcast_arrays, clip, cumsum, diff, dtype, empty,
+    errstate, flatnonzero, float32, float64, full, int64, maximum, minimum, nan, repeat,
+    r_, searchsorted, take_along_axis, tensordot, unique, where, zeros
+)
+from numpy.typing import ArrayLike, NDArray
+from pandas import DataFrame
+
+# local library specific imports
+
+
+class _BeamResultTensor:
+    """
+    The ``_BeamResultTensor`` class holds beam results as dense arrays indexed by load
+    case, beam and station, to draw force diagrams and combine or envelope load cases
+    with array operations only.
+
+    Beams with fewer stations than the others are padded with NaN:
+
+    * ``load_cases``: the load case numbers, shape ``(l,)``
+    * ``elem_ids``: the beam numbers, shape ``(b,)``
+    * ``stations``: the positions of the output stations of each beam, the same for
+      all the load cases, shape ``(b, s)``
+    * ``mask``: `True` where a result exists, shape ``(l, b, s)``
+    * ``values``: one `float32` array of shape ``(l, b, s)`` per force component, e.g.
+      ``values["MY"]``
+    """
+    def __init__(
+            self,
+            load_cases: NDArray[int64],
+            elem_ids: NDArray[int64],
+            stations: NDArray[float64],
+            mask: NDArray[Any],
+            values: dict[str, NDArray[float32]]
+    ) -> None:
+        """The initializer of the ``_BeamResultTensor`` class.
+        """
+        self.load_cases = load_cases
+        self.elem_ids = elem_ids
+        self.stations = stations
+        self.mask = mask
+        self.values = values
+
+    @classmethod
+    def from_frame(cls, data: DataFrame, components: list[str]) -> "_BeamResultTensor":
+        """Build the tensor of the given ``components`` from beam results in long
+        format, with one row per load case, beam and station. Within each load
+        case and beam, stations keep the order of the rows.
+
+        Raises
+        ------
+        RuntimeError
+            If the load cases of a beam have different stations.
+        """
+        load_cases, lc_index = unique(data["LOAD_CASE"].to_numpy(), return_inverse=True)
+        elem_ids, elem_index = unique(data["ELEM_ID"].to_numpy(), return_inverse=True)
+
+        # position of each row within its load case and beam
+        key = lc_index * elem_ids.size + elem_index
+        order = argsort(key, kind="stable")
+        starts = r_[0, flatnonzero(diff(key[order])) + 1]
+        station_index = empty(key.size, dtype=int64)
+        station_index[order] = arange(key.size) - repeat(
+            starts, diff(r_[starts, key.size])
+        )
+
+        shape = (load_cases.size, elem_ids.size, int(station_index.max(initial=-1)) + 1)
+        index = (lc_index, elem_index, station_index)
+
+        positions = data["STATION"].to_numpy(dtype=float64)
+        stations = full(shape[1:], nan, dtype=float64)
+        stations[elem_index, station_index] = positions
+
+        # the stations are shared by the load cases, which must agree on them
+        is_different = stations[elem_index, station_index] != positions
+        if is_different.any():
+            raise RuntimeError(
+                f"Elements {unique(elem_ids[elem_index[is_different]]).tolist()} have "
+                "different stations in different load cases!"
+            )
+
+        mask = zeros(shape, dtype=dtype(bool))
+        mask[index] = True
+
+        values: dict[str, NDArray[float32]] = {}
+        for component in components:
+            values[component] = full(shape, nan, dtype=float32)
+            values[component][index] = data[component].to_numpy(dtype=float32)
+
+        return cls(load_cases, elem_ids, stations, mask, values)
+
+    def combine(self, component: str, factors: dict[int, float]) -> NDArray[float32]:
+        """Return the linear combination ``sum(factor * load case)`` of the given
+        ``component``, shape ``(b, s)``. Missing results count as zero, padded
+        stations are NaN.
+
+        Raises
+        ------
+        LookupError
+            If ``component`` or any load case of ``factors`` is not found.
+        """
+        values = self.get_component(component)
+        weights = zeros(self.load_cases.size, dtype=float32)
+        for load_case, factor in factors.items():
+            weights[self._get_lc_position(load_case)] = factor
+
+        combination = tensordot(weights, where(self.mask, values, 0.0), axes=1)
+        combination[~self.mask.any(axis=0)] = nan
+        return combination  # type: ignore[no-any-return]
+
+    def envelope(self, component: str) -> tuple[NDArray[float32], NDArray[float32]]:
+        """Return the minimum and maximum of the given ``component`` over the load
+        cases, both with shape ``(b, s)``. Padded stations are NaN.
+
+        Raises
+        ------
+        LookupError
+            If ``component`` is not found.
+        """
+        values = self.get_component(component)
+        is_station = self.mask.any(axis=0)
+        minimum = full(values.shape[1:], nan, dtype=float32)
+        maximum = full(values.shape[1:], nan, dtype=float32)
+        if values.size:
+            values.min(axis=0, initial=float("inf"), where=self.mask, out=minimum)
+            values.max(axis=0, initial=float("-inf"), where=self.mask, out=maximum)
+            minimum[~is_station] = nan
+            maximum[~is_station] = nan
+
+        return minimum, maximum
+
+    def get_component(self, component: str) -> NDArray[float32]:
+        """Return the ``(l, b, s)`` array of the given ``component``.
+
+        Raises
+        ------
+        LookupError
+            If ``component`` is not found.
+        """
+        try:
+            return self.values[component]
+        except KeyError:
+            raise LookupError(f"Component \"{component}\" not found!") from None
+
+    def get_diagram(
+            self,
+            component: str,
+            load_case: int,
+            element_number: int
+    ) -> tuple[NDArray[float64], NDArray[float32]]:
+        """Return the stations and the values of ``component`` of a beam, without
+        padding, e.g. to draw its force diagram.
+
+        Raises
+        ------
+        LookupError
+            If ``component``, ``load_case`` or ``element_number`` is not found.
+        """
+        values = self.get_component(component)
+        lc_position = self._get_lc_position(load_case)
+
+        positions = flatnonzero(self.elem_ids == element_number)
+        if not positions.size:
+            raise LookupError(f"Element number {element_number} not found!")
+
+        is_result = self.mask[lc_position, positions[0]]
+        return (
+            self.stations[positions[0]][is_result],
+            values[lc_position, positions[0]][is_result]
+        )
+
+    def interpolate(
+            self,
+            component: str,
+            elem_ids: ArrayLike,
+            x: ArrayLike,
+            load_cases: ArrayLike
+    ) -> NDArray[float64]:
+        """Return the values of ``component`` at the positions ``x`` along the beams
+        ``elem_ids`` for the ``load_cases``, interpolated linearly between the two
+        surrounding stations. All the arguments are broadcast together.
+
+        Positions beyond the first or last station are extrapolated from the nearest
+        two stations with a result, and queries without results return NaN. Stations
+        without a result are skipped. When two stations share the same position, e.g.
+        at a point load, the value after the discontinuity is returned.
+
+        Raises
+        ------
+        LookupError
+            If ``component``, any of the ``elem_ids`` or of the ``load_cases`` is not
+            found.
+        """
+        values = self.get_component(component)
+        elem_ids, x, load_cases = broadcast_arrays(
+            asarray(elem_ids), asarray(x, dtype=float64), asarray(load_cases)
+        )
+        beams = self._get_positions(self.elem_ids, elem_ids, "Element numbers")
+        lcs = self._get_positions(self.load_cases, load_cases, "Load cases")
+
+        stations = self.stations[beams]
+        is_result = self.mask[lcs, beams]
+        counts = is_result.sum(axis=-1)
+
+        # ranks of the stations with a result, which may leave holes in the row, and
+        # the ranks of the last one not after x and of the next one
+        ranks = cumsum(is_result, axis=-1) - 1
+        j_rank = ((stations <= x[..., None]) & is_result).sum(axis=-1) - 1
+        j_rank = clip(j_rank, 0, maximum(counts - 2, 0))
+        k_rank = minimum(j_rank + 1, maximum(counts - 1, 0))
+        j = argmax(is_result & (ranks == j_rank[..., None]), axis=-1)
+        k = argmax(is_result & (ranks == k_rank[..., None]), axis=-1)
+
+        x_j = take_along_axis(stations, j[..., None], axis=-1)[..., 0]
+        x_k = take_along_axis(stations, k[..., None], axis=-1)[..., 0]
+        row = values[lcs, beams].astype(float64)
+        v_j = take_along_axis(row, j[..., None], axis=-1)[..., 0]
+        v_k = take_along_axis(row, k[..., None], axis=-1)[..., 0]
+
+        span = x_k - x_j
+        with errstate(divide="ignore", invalid="ignore"):
+            t = where(span > 0, (x - x_j) / span, 0.0)
+
+        interpolated = where(counts > 0, v_j + t * (v_k - v_j), nan)
+        return interpolated  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _get_positions(
+            values: NDArray[int64],
+            queries: NDArray[Any],
+            name: str
+    ) -> NDArray[int64]:
+        """Return the positions of ``queries`` in the sorted array ``values``.
+        """
+        positions = searchsorted(values, queries)
+        positions = minimum(positions, max(values.size - 1, 0))
+        is_found = values[positions] == queries if values.size else queries != queries
+        if not is_found.all():
+            raise LookupError(f"{name} {unique(queries[~is_found]).tolist()} not found!")
+
+        return positions  # type: ignore[no-any-return]
+
+    def _get_lc_position(self, load_case: int) -> int:
+        """Return the position of ``load_case`` along the first axis.
+        """
+        positions = flatnonzero(self.load_cases == load_case)
+        if not positions.size:
+            raise LookupError(f"Load case {load_case} not found!")
+
+        return int(positions[0])
@@ -1,13 +1,17 @@
 # standard library imports
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 # third party library imports
 
 # local library specific imports
-from . cable_data import CableData
-from . cable_load import CableLoad
-from . cable_result import CableResult
 from . sofistik_dll import SofDll
 
+if TYPE_CHECKING:
+    from . cable_data import CableData
+    from . cable_load import CableLoad
+    from . cable_result import CableResult
+
 
 class Cables:
     """
@@ -18,11 +22,20 @@ class Cables:
     provides a structured entry point for reading, manipulating and evaluating
     cable definitions, applied loads, and analysis results.
     """
-    data: CableData
-    load: CableLoad
-    result: CableResult
-
     def __init__(self, dll: SofDll) -> None:
-        self.data = CableData(dll)
-        self.load = CableLoad(dll)
-        self.result = CableResult(dll)
+        self._dll = dll
+
+    @cached_property
+    def data(self) -> "CableData":
+        from . cable_data import CableData
+        return CableData(self._dll)
+
+    @cached_property
+    def load(self) -> "CableLoad":
+        from . cable_load import CableLoad
+        return CableLoad(self._dll)
+
+    @cached_property
+    def result(self) -> "CableResult":
+        from . cable_result import CableResult
+        return CableResult(self._dll)
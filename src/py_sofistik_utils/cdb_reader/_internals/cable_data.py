@@ -138,52 +138,57 @@ class CableData:
 
             data: list[dict[str, float | int]] = []
             first_call = True
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    160,
-                    0,
-                    byref(cabl),
-                    byref(record_length),
-                    0 if first_call else 1
-                )
-
-                record_length = c_int(sizeof(cabl))
-                first_call = False
-                if return_value.value >= 2:
-                    break
-
-                data.append(
-                    {
-                        "GROUP":    0,
-                        "ELEM_ID":  cabl.m_nr,
-                        "N1":       cabl.m_node[0],
-                        "N2":       cabl.m_node[1],
-                        "L0":       cabl.m_dl,
-                        "PROPERTY": cabl.m_nrq
-                    }
-                )
+            with self._dll.phase(160, 0, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        160,
+                        0,
+                        byref(cabl),
+                        byref(record_length),
+                        0 if first_call else 1
+                    )
+
+                    record_length = c_int(sizeof(cabl))
+                    first_call = False
+                    if return_value.value >= 2:
+                        break
+
+                    data.append(
+                        {
+                            "GROUP":    0,
+                            "ELEM_ID":  cabl.m_nr,
+                            "N1":       cabl.m_node[0],
+                            "N2":       cabl.m_node[1],
+                            "L0":       cabl.m_dl,
+                            "PROPERTY": cabl.m_nrq
+                        }
+                    )
+
+            with self._dll.phase(160, 0, "frame"):
+                df = DataFrame(data).sort_values("ELEM_ID", kind="mergesort")
+                elem_ids = df["ELEM_ID"]
 
             # assigning groups
-            group_data = _GroupData(self._dll)
-            group_data.load()
+            with self._dll.phase(160, 0, "group"):
+                group_data = _GroupData(self._dll)
+                group_data.load()
 
-            df = DataFrame(data).sort_values("ELEM_ID", kind="mergesort")
-            elem_ids = df["ELEM_ID"]
+                for grp, grp_range in group_data.iterator_cable():
+                    if grp_range.stop == 0:
+                        continue
 
-            for grp, grp_range in group_data.iterator_cable():
-                if grp_range.stop == 0:
-                    continue
-
-                left = elem_ids.searchsorted(grp_range.start, side="left")
-                right = elem_ids.searchsorted(grp_range.stop - 1, side="right")
-                df.loc[df.index[left:right], "GROUP"] = grp
+                    left = elem_ids.searchsorted(grp_range.start, side="left")
+                    right = elem_ids.searchsorted(grp_range.stop - 1, side="right")
+                    df.loc[df.index[left:right], "GROUP"] = grp
 
             # set indices for fast lookup
-            df = df.set_index(["ELEM_ID"], drop=False)
+            with self._dll.phase(160, 0, "frame"):
+                df = df.set_index(["ELEM_ID"], drop=False)
 
             # merge data
-            if self._data.empty:
-                self._data = df
-            else:
-                self._data = concat([self._data, df])
+            with self._dll.phase(160, 0, "merge"):
+                if self._data.empty:
+                    self._data = df
+                else:
+                    self._data = concat([self._data, df])
@@ -197,31 +197,36 @@ class CableLoad:
         for load_case in load_cases:
             if self._dll.key_exist(161, load_case):
                 self.clear(load_case)
-                data.extend(self._load(load_case))
+                with self._dll.phase(161, load_case, "read"):
+                    data.extend(self._load(load_case))
 
-        # assigning groups
-        group_data = _GroupData(self._dll)
-        group_data.load()
+        with self._dll.phase(161, -1, "frame"):
+            df = DataFrame(data).sort_values("ELEM_ID", kind="mergesort")
+            elem_ids = df["ELEM_ID"]
 
-        df = DataFrame(data).sort_values("ELEM_ID", kind="mergesort")
-        elem_ids = df["ELEM_ID"]
+        # assigning groups
+        with self._dll.phase(161, -1, "group"):
+            group_data = _GroupData(self._dll)
+            group_data.load()
 
-        for grp, grp_range in group_data.iterator_cable():
-            if grp_range.stop == 0:
-                continue
+            for grp, grp_range in group_data.iterator_cable():
+                if grp_range.stop == 0:
+                    continue
 
-            left = elem_ids.searchsorted(grp_range.start, side="left")
-            right = elem_ids.searchsorted(grp_range.stop - 1, side="right")
-            df.loc[df.index[left:right], "GROUP"] = grp
+                left = elem_ids.searchsorted(grp_range.start, side="left")
+                right = elem_ids.searchsorted(grp_range.stop - 1, side="right")
+                df.loc[df.index[left:right], "GROUP"] = grp
 
         # set indices for fast lookup
-        df = df.set_index(["ELEM_ID", "LOAD_CASE", "TYPE"], drop=False)
+        with self._dll.phase(161, -1, "frame"):
+            df = df.set_index(["ELEM_ID", "LOAD_CASE", "TYPE"], drop=False)
 
         # merge data
-        if self._data.empty:
-            self._data = df
-        else:
-            self._data = concat([self._data, df])
+        with self._dll.phase(161, -1, "merge"):
+            if self._data.empty:
+                self._data = df
+            else:
+                self._data = concat([self._data, df])
         self._loaded_lc.update(load_cases)
 
     def set_echo_level(self, echo_level: int) -> None:
@@ -245,7 +250,7 @@ class CableLoad:
         first_call = True
         while return_value.value < 2:
             return_value.value = self._dll.get(
-                1,
+                self._dll.index,
                 161,
                 load_case,
                 byref(cabl),
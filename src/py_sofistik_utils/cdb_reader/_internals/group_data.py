@@ -8,7 +8,7 @@ from pandas import concat, DataFrame
 # local library specific imports
 from . sofistik_dll import SofDll
 from . sofistik_classes import CGRP
-from . sofistik_utilities import long_to_str
+from . sofistik_utilities import longs_to_str
 
 
 class _GroupData:
@@ -284,79 +284,87 @@ class _GroupData:
 
             self.clear()
 
-            temp_container: list[list[Any]] = []
+            # group number -> row
+            temp_container: dict[int, list[Any]] = {}
             count = 0
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    11,
-                    0,
-                    byref(g_data),
-                    byref(rec_length),
-                    0 if count == 0 else 1
-                )
-
-                rec_length = c_int(sizeof(g_data))
-                count += 1
-
-                if return_value.value >= 2:
-                    break
-
-                temp_list: list[Any] = [0 for _ in range(17)]
-
-                if g_data.m_typ == 0:
-                    temp_list[0] = g_data.m_ng
-                    g_name = "".join(long_to_str(g_data.m_text[_]) for _ in range(17))
-                    temp_list[1] = g_name.upper()
-                    temp_container.append(temp_list)
-
-                else:
-                    useful_data = True
-                    match g_data.m_typ:
-                        case 100:
-                            type_index = 2
-                        case 150:
-                            type_index = 5
-                        case 160:
-                            type_index = 8
-                        case 170:
-                            type_index = 11
-                        case 200:
-                            type_index = 14
-                        case _:
-                            useful_data = False
-
-                    if useful_data:
-                        grp_index = [_[0] for _ in temp_container].index(g_data.m_ng)
-                        temp_container[grp_index][type_index + 0] = g_data.m_min
-                        temp_container[grp_index][type_index + 1] = g_data.m_max
-                        temp_container[grp_index][type_index + 2] = g_data.m_num
+            with self._dll.phase(11, 0, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        11,
+                        0,
+                        byref(g_data),
+                        byref(rec_length),
+                        0 if count == 0 else 1
+                    )
+
+                    rec_length = c_int(sizeof(g_data))
+                    count += 1
+
+                    if return_value.value >= 2:
+                        break
+
+                    temp_list: list[Any] = [0 for _ in range(17)]
+
+                    if g_data.m_typ == 0:
+                        temp_list[0] = g_data.m_ng
+                        # decoded at once in the frame phase
+                        temp_list[1] = g_data.m_text[:]
+                        temp_container[g_data.m_ng] = temp_list
+
+                    else:
+                        useful_data = True
+                        match g_data.m_typ:
+                            case 100:
+                                type_index = 2
+                            case 150:
+                                type_index = 5
+                            case 160:
+                                type_index = 8
+                            case 170:
+                                type_index = 11
+                            case 200:
+                                type_index = 14
+                            case _:
+                                useful_data = False
+
+                        if useful_data:
+                            grp_list = temp_container[g_data.m_ng]
+                            grp_list[type_index + 0] = g_data.m_min
+                            grp_list[type_index + 1] = g_data.m_max
+                            grp_list[type_index + 2] = g_data.m_num
 
             # preparing data for conversion to a pandas DataFrame
-            conv_data: list[dict[str, Any]] = []
-            for item in temp_container:
-                conv_data.append({"GROUP":             item[0],
-                                  "GROUP_NAME":        item[1],
-                                  "BEAM_MIN_ID":       item[2],
-                                  "BEAM_MAX_ID":       item[3],
-                                  "NUMBER_OF_BEAMS":   item[4],
-                                  "TRUSS_MIN_ID":      item[5],
-                                  "TRUSS_MAX_ID":      item[6],
-                                  "NUMBER_OF_TRUSSES": item[7],
-                                  "CABLE_MIN_ID":      item[8],
-                                  "CABLE_MAX_ID":      item[9],
-                                  "NUMBER_OF_CABLES":  item[10],
-                                  "SPRING_MIN_ID":     item[11],
-                                  "SPRING_MAX_ID":     item[12],
-                                  "NUMBER_OF_SPRINGS": item[13],
-                                  "QUAD_MIN_ID":       item[14],
-                                  "QUAD_MAX_ID":       item[15],
-                                  "NUMBER_OF_QUADS":    item[16]})
-
-            if self._data.empty:
-                self._data = DataFrame(conv_data)
-            else:
-                self._data = concat(
-                    [self._data, DataFrame(conv_data)],
-                    ignore_index=True
-                )
+            with self._dll.phase(11, 0, "frame"):
+                names = longs_to_str([_[1] for _ in temp_container.values()])
+                for item, name in zip(temp_container.values(), names):
+                    item[1] = name.upper()
+
+                conv_data: list[dict[str, Any]] = []
+                for item in temp_container.values():
+                    conv_data.append({"GROUP":             item[0],
+                                      "GROUP_NAME":        item[1],
+                                      "BEAM_MIN_ID":       item[2],
+                                      "BEAM_MAX_ID":       item[3],
+                                      "NUMBER_OF_BEAMS":   item[4],
+                                      "TRUSS_MIN_ID":      item[5],
+                                      "TRUSS_MAX_ID":      item[6],
+                                      "NUMBER_OF_TRUSSES": item[7],
+                                      "CABLE_MIN_ID":      item[8],
+                                      "CABLE_MAX_ID":      item[9],
+                                      "NUMBER_OF_CABLES":  item[10],
+                                      "SPRING_MIN_ID":     item[11],
+                                      "SPRING_MAX_ID":     item[12],
+                                      "NUMBER_OF_SPRINGS": item[13],
+                                      "QUAD_MIN_ID":       item[14],
+                                      "QUAD_MAX_ID":       item[15],
+                                      "NUMBER_OF_QUADS":    item[16]})
+
+            with self._dll.phase(11, 0, "merge"):
+                if self._data.empty:
+                    self._data = DataFrame(conv_data)
+                else:
+                    self._data = concat(
+                        [self._data, DataFrame(conv_data)],
+                        ignore_index=True
+                    )
@@ -3,6 +3,10 @@ from ctypes import byref, c_int, sizeof
 from typing import Any, Generator
 
 # third party library imports
+from numpy import (
+    argsort, array, asarray, full, int64, maximum, searchsorted, where
+)
+from numpy.typing import ArrayLike, NDArray
 from pandas import concat, DataFrame
 
 # local library specific imports
@@ -45,6 +49,8 @@ class _GroupLCData:
         )
         self._dll = dll
         self._loaded_lc: set[int] = set()
+        # load case -> group number -> row, see load
+        self._groups: dict[int, dict[int, list[Any]]] = {}
 
     def clear(self, load_case: int) -> None:
         """Clear the results for the given ``load_case`` number.
@@ -54,12 +60,14 @@ class _GroupLCData:
 
         self._data = self._data.drop(self._data[self._data.LOAD_CASE == load_case].index)
         self._loaded_lc.remove(load_case)
+        del self._groups[load_case]
 
     def clear_all(self) -> None:
         """Clear all group data.
         """
         self._data = self._data[0:0]
         self._loaded_lc.clear()
+        self._groups.clear()
 
     def get_active_groups(self, load_case: int) -> list[int]:
         """For the given ``load_case``, return the `list` of active groups.
@@ -74,13 +82,7 @@ class _GroupLCData:
         RuntimeError
             If the given ``load_case`` is not found.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        active_mask = self._data["IS_ACTIVE"] == True
-
-        return self._data.GROUP[lc_mask & active_mask].to_list()
+        return [grp for grp, row in self._get_groups(load_case).items() if row[-1]]
 
     def get_beam_id_range(self, load_case: int, group_number: int) -> range:
         """For the given ``load_case``, return a `range` starting from the minimum beam
@@ -102,23 +104,7 @@ class _GroupLCData:
         RuntimeError
             If the given ``load_case`` or ``group_number`` are not found.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_number
-
-        if grp_mask.eq(False).all():
-            err_msg = f"Group {group_number} not found in load case {load_case}!"
-            raise RuntimeError(err_msg)
-
-        if self._data.NUMBER_OF_BEAMS[lc_mask & grp_mask].item() == 0:
-            return range(0)
-
-        max_id = self._data.BEAM_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.BEAM_MIN_ID[lc_mask & grp_mask].item()
-
-        return range(min_id, max_id + 1, 1)
+        return self._get_id_range(load_case, group_number, "beam")
 
     def get_cable_id_range(self, load_case: int, group_number: int) -> range:
         """For the given ``load_case``, return a `range` starting from the minimum cable
@@ -140,23 +126,7 @@ class _GroupLCData:
         RuntimeError
             If the given ``load_case`` or ``group_number`` are not found.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_number
-
-        if grp_mask.eq(False).all():
-            err_msg = f"Group {group_number} not found in load case {load_case}!"
-            raise RuntimeError(err_msg)
-
-        if self._data.NUMBER_OF_CABLES[lc_mask & grp_mask].item() == 0:
-            return range(0)
-
-        max_id = self._data.CABLE_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.CABLE_MIN_ID[lc_mask & grp_mask].item()
-
-        return range(min_id, max_id + 1, 1)
+        return self._get_id_range(load_case, group_number, "cable")
 
     def get_quad_id_range(self, load_case: int, group_number: int) -> range:
         """For the given ``load_case``, return a `range` starting from the minimum quad
@@ -178,23 +148,7 @@ class _GroupLCData:
         RuntimeError
             If the given ``load_case`` or ``group_number`` are not found.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_number
-
-        if grp_mask.eq(False).all():
-            err_msg = f"Group {group_number} not found in load case {load_case}!"
-            raise RuntimeError(err_msg)
-
-        if self._data.NUMBER_OF_QUADS[lc_mask & grp_mask].item() == 0:
-            return range(0)
-
-        max_id = self._data.QUAD_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.QUAD_MIN_ID[lc_mask & grp_mask].item()
-
-        return range(min_id, max_id + 1, 1)
+        return self._get_id_range(load_case, group_number, "quad")
 
     def get_spring_id_range(self, load_case: int, group_number: int) -> range:
         """For the given ``load_case``, return a `range` starting from the minimum spring
@@ -216,23 +170,7 @@ class _GroupLCData:
         RuntimeError
             If the given ``load_case`` or ``group_number`` are not found.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_number
-
-        if grp_mask.eq(False).all():
-            err_msg = f"Group {group_number} not found in load case {load_case}!"
-            raise RuntimeError(err_msg)
-
-        if self._data.NUMBER_OF_SPRINGS[lc_mask & grp_mask].item() == 0:
-            return range(0)
-
-        max_id = self._data.SPRING_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.SPRING_MIN_ID[lc_mask & grp_mask].item()
-
-        return range(min_id, max_id + 1, 1)
+        return self._get_id_range(load_case, group_number, "spring")
 
     def get_truss_id_range(self, load_case: int, group_number: int) -> range:
         """For the given ``load_case``, return a `range` starting from the minimum truss
@@ -254,23 +192,39 @@ class _GroupLCData:
         RuntimeError
             If the given ``load_case`` or ``group_number`` are not found.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_number
+        return self._get_id_range(load_case, group_number, "truss")
+
+    def get_element_groups(
+            self,
+            load_case: int,
+            element_ids: ArrayLike,
+            element_type: str,
+            default: int = 0
+    ) -> NDArray[Any]:
+        """For the given ``load_case``, return the active group of each element of
+        ``element_ids``, or ``default`` if none.
 
-        if grp_mask.eq(False).all():
-            err_msg = f"Group {group_number} not found in load case {load_case}!"
-            raise RuntimeError(err_msg)
-
-        if self._data.NUMBER_OF_TRUSSES[lc_mask & grp_mask].item() == 0:
-            return range(0)
-
-        max_id = self._data.TRUSS_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.TRUSS_MIN_ID[lc_mask & grp_mask].item()
+        Parameters
+        ----------
+        load_case: int
+            The load_case number
+        element_ids: ArrayLike
+            The element numbers
+        element_type: str
+            One of ``"beam"``, ``"cable"``, ``"quad"``, ``"spring"`` and ``"truss"``
+        default: int, default 0
+            Group of the elements not found in any active group
 
-        return range(min_id, max_id + 1, 1)
+        Raises
+        ------
+        LookupError
+            If the given ``element_type`` is unknown.
+        RuntimeError
+            If the given ``load_case`` is not found.
+        """
+        return map_element_groups(
+            self._get_groups(load_case), element_ids, element_type, default
+        )
 
     def group_is_active(self, load_case: int, group_number: int) -> bool:
         """Return `True` if the given ``group_number`` is active in the given ``load_case``.
@@ -288,17 +242,7 @@ class _GroupLCData:
         RuntimeError
             If the given ``load_case`` or ``group_number`` are not found.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_number
-
-        if grp_mask.eq(False).all():
-            err_msg = f"Group {group_number} not found in load case {load_case}!"
-            raise RuntimeError(err_msg)
-
-        return bool(self._data.IS_ACTIVE[lc_mask & grp_mask].item())
+        return bool(self._get_group(load_case, group_number)[-1])
 
     def iterator_beam(self, load_case: int) -> Generator[tuple[int, range], None, None]:
         """Yield a tuple containing the group number and the beam ID range for the given
@@ -345,81 +289,172 @@ class _GroupLCData:
 
             self.clear(load_case)
 
-            temp_container: list[list[Any]] = []
+            # group number -> row
+            temp_container: dict[int, list[Any]] = {}
             count = 0
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    11,
-                    load_case,
-                    byref(g_data),
-                    byref(rec_length),
-                    0 if count == 0 else 1
-                )
-
-                rec_length = c_int(sizeof(g_data))
-                count += 1
-
-                if return_value.value >= 2 or g_data.m_ng > 999:
-                    break
-
-                temp_list: list[Any] = [0 for _ in range(18)]
-
-                if g_data.m_typ == 0:
-                    temp_list[0] = load_case
-                    temp_list[1] = g_data.m_ng
-                    temp_list[-1] = (2 & g_data.m_inf) > 0
-                    temp_container.append(temp_list)
-
-                else:
-                    useful_data = True
-                    match g_data.m_typ:
-                        case 100:
-                            type_index = 2
-                        case 150:
-                            type_index = 5
-                        case 160:
-                            type_index = 8
-                        case 170:
-                            type_index = 11
-                        case 200:
-                            type_index = 14
-                        case _:
-                            useful_data = False
-
-                    if useful_data:
-                        grp_index = [_[1] for _ in temp_container].index(g_data.m_ng)
-                        temp_container[grp_index][type_index + 0] = g_data.m_min
-                        temp_container[grp_index][type_index + 1] = g_data.m_max
-                        temp_container[grp_index][type_index + 2] = g_data.m_num
+            with self._dll.phase(11, load_case, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        11,
+                        load_case,
+                        byref(g_data),
+                        byref(rec_length),
+                        0 if count == 0 else 1
+                    )
+
+                    rec_length = c_int(sizeof(g_data))
+                    count += 1
+
+                    if return_value.value >= 2 or g_data.m_ng > 999:
+                        break
+
+                    temp_list: list[Any] = [0 for _ in range(18)]
+
+                    if g_data.m_typ == 0:
+                        temp_list[0] = load_case
+                        temp_list[1] = g_data.m_ng
+                        temp_list[-1] = (2 & g_data.m_inf) > 0
+                        temp_container[g_data.m_ng] = temp_list
+
+                    else:
+                        useful_data = True
+                        match g_data.m_typ:
+                            case 100:
+                                type_index = 2
+                            case 150:
+                                type_index = 5
+                            case 160:
+                                type_index = 8
+                            case 170:
+                                type_index = 11
+                            case 200:
+                                type_index = 14
+                            case _:
+                                useful_data = False
+
+                        if useful_data:
+                            grp_list = temp_container[g_data.m_ng]
+                            grp_list[type_index + 0] = g_data.m_min
+                            grp_list[type_index + 1] = g_data.m_max
+                            grp_list[type_index + 2] = g_data.m_num
 
             # preparing data for conversion to a pandas DataFrame
-            conv_data: list[dict[str, Any]] = []
-            for item in temp_container:
-                conv_data.append({"LOAD_CASE":          item[0],
-                                  "GROUP":              item[1],
-                                  "BEAM_MIN_ID":        item[2],
-                                  "BEAM_MAX_ID":        item[3],
-                                  "NUMBER_OF_BEAMS":    item[4],
-                                  "TRUSS_MIN_ID":       item[5],
-                                  "TRUSS_MAX_ID":       item[6],
-                                  "NUMBER_OF_TRUSSES":  item[7],
-                                  "CABLE_MIN_ID":       item[8],
-                                  "CABLE_MAX_ID":       item[9],
-                                  "NUMBER_OF_CABLES":   item[10],
-                                  "SPRING_MIN_ID":      item[11],
-                                  "SPRING_MAX_ID":      item[12],
-                                  "NUMBER_OF_SPRINGS":  item[13],
-                                  "QUAD_MIN_ID":        item[14],
-                                  "QUAD_MAX_ID":        item[15],
-                                  "NUMBER_OF_QUADS":     item[16],
-                                  "IS_ACTIVE":          item[17]})
-
-            if self._data.empty:
-                self._data = DataFrame(conv_data)
-            else:
-                self._data = concat(
-                    [self._data, DataFrame(conv_data)],
-                    ignore_index=True
-                )
+            with self._dll.phase(11, load_case, "frame"):
+                conv_data: list[dict[str, Any]] = []
+                for item in temp_container.values():
+                    conv_data.append({"LOAD_CASE":          item[0],
+                                      "GROUP":              item[1],
+                                      "BEAM_MIN_ID":        item[2],
+                                      "BEAM_MAX_ID":        item[3],
+                                      "NUMBER_OF_BEAMS":    item[4],
+                                      "TRUSS_MIN_ID":       item[5],
+                                      "TRUSS_MAX_ID":       item[6],
+                                      "NUMBER_OF_TRUSSES":  item[7],
+                                      "CABLE_MIN_ID":       item[8],
+                                      "CABLE_MAX_ID":       item[9],
+                                      "NUMBER_OF_CABLES":   item[10],
+                                      "SPRING_MIN_ID":      item[11],
+                                      "SPRING_MAX_ID":      item[12],
+                                      "NUMBER_OF_SPRINGS":  item[13],
+                                      "QUAD_MIN_ID":        item[14],
+                                      "QUAD_MAX_ID":        item[15],
+                                      "NUMBER_OF_QUADS":     item[16],
+                                      "IS_ACTIVE":          item[17]})
+
+            with self._dll.phase(11, load_case, "merge"):
+                if self._data.empty:
+                    self._data = DataFrame(conv_data)
+                else:
+                    self._data = concat(
+                        [self._data, DataFrame(conv_data)],
+                        ignore_index=True
+                    )
+            self._groups[load_case] = temp_container
             self._loaded_lc.add(load_case)
+
+    def _get_group(self, load_case: int, group_number: int) -> list[Any]:
+        """Return the row of ``group_number`` in the lookup table of ``load_case``.
+        """
+        try:
+            return self._get_groups(load_case)[group_number]
+        except KeyError:
+            err_msg = f"Group {group_number} not found in load case {load_case}!"
+            raise RuntimeError(err_msg) from None
+
+    def _get_groups(self, load_case: int) -> dict[int, list[Any]]:
+        """Return the lookup table ``group -> row`` of ``load_case``.
+        """
+        try:
+            return self._groups[load_case]
+        except KeyError:
+            raise RuntimeError(f"Load case {load_case} not found!") from None
+
+    def _get_id_range(
+            self,
+            load_case: int,
+            group_number: int,
+            element_type: str
+    ) -> range:
+        """Return the ID range of the ``element_type`` elements of ``group_number``.
+        """
+        row = self._get_group(load_case, group_number)
+        index = ELEMENT_TYPES[element_type]
+
+        if row[index + 2] == 0:
+            return range(0)
+
+        return range(row[index], row[index + 1] + 1, 1)
+
+
+# element type -> index of its minimum ID in the rows of the group tables, followed by
+# the maximum ID and the number of elements
+ELEMENT_TYPES = {"beam": 2, "truss": 5, "cable": 8, "spring": 11, "quad": 14}
+
+
+def map_element_groups(
+        groups: dict[Any, list[Any]],
+        element_ids: ArrayLike,
+        element_type: str,
+        default: Any
+) -> NDArray[Any]:
+    """Return the active group of each element of ``element_ids``, given the rows
+    ``group -> row`` of a load case, or ``default`` if none. Groups later in
+    ``groups`` take precedence when their ID ranges overlap.
+
+    Raises
+    ------
+    LookupError
+        If the given ``element_type`` is unknown.
+    """
+    if element_type not in ELEMENT_TYPES:
+        raise LookupError(f"Element type \"{element_type}\" not found!")
+
+    index = ELEMENT_TYPES[element_type]
+    ids = asarray(element_ids)
+    rows = [
+        (grp, row[index], row[index + 1]) for grp, row in groups.items()
+        if row[-1] and row[index + 2] > 0
+    ]
+    if not rows:
+        return full(ids.shape, default)
+
+    # the last entry is the default group of the elements not found
+    names = array([_[0] for _ in rows] + [default])
+
+    min_ids = array([_[1] for _ in rows], dtype=int64)
+    max_ids = array([_[2] for _ in rows], dtype=int64)
+    order = argsort(min_ids, kind="stable")
+
+    if (min_ids[order][1:] > max_ids[order][:-1]).all():
+        # disjoint ranges: find the candidate range of each ID with a binary search
+        position = searchsorted(min_ids[order], ids, side="right") - 1
+        candidate = order[maximum(position, 0)]
+        found = (position >= 0) & (ids <= max_ids[candidate])
+        selected = where(found, candidate, len(rows))
+    else:
+        selected = full(ids.shape, len(rows), dtype=int64)
+        for position, (min_id, max_id) in enumerate(zip(min_ids, max_ids)):
+            selected[(ids >= min_id) & (ids <= max_id)] = position
+
+    return names[selected]  # type: ignore[no-any-return]
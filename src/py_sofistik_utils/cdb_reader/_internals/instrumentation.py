@@ -0,0 +1,258 @@
+"""
+Instrumentation
+---------------
+
+The `Instrumentation` module collects extraction statistics for each CDB key: number of
+calls to ``sof_cdb_get``, records and bytes read, and the wall time spent in each phase
+of a load.
+
+Phases are:
+
+* ``FFI``: time spent inside ``sof_cdb_get``;
+* ``DECODE``: time spent reading the fields of the ctypes structures and building the
+  intermediate containers, i.e. the ``read`` phase of a loader minus ``FFI``;
+* ``GROUP``: group assignment, including the load of the group keys ``11/00`` or
+  ``11/LC`` (which are also reported on their own rows);
+* ``FRAME``: construction, sorting and indexing of the :class:`pandas.DataFrame`;
+* ``MERGE``: concatenation with the previously loaded data.
+
+Phases that process several load cases at once are reported with ``KWL = -1``.
+
+When memory profiling is enabled, each phase is also tracked with :mod:`tracemalloc`:
+its peak memory is the highest traced memory reached during the phase, relative to the
+traced memory at its start, and its retained memory is the traced memory still allocated
+when the phase ends. Memory profiling slows down the loads significantly and is meant for
+diagnostics only, e.g. to size batch workers.
+"""
+# standard library imports
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from tracemalloc import get_traced_memory, is_tracing, reset_peak, start, stop
+from typing import Any, ContextManager, Generator, TYPE_CHECKING
+
+# third party library imports
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+# local library specific imports
+
+
+_NULL_CONTEXT = nullcontext()
+
+_PHASES = ("read", "group", "frame", "merge")
+
+
+class _Instrumentation:
+    """Collect extraction statistics per CDB key. When disabled, :meth:`phase`
+    returns a shared no-op context manager and ``sof_cdb_get`` is not wrapped,
+    so the overhead is limited to one method call per phase.
+    """
+    def __init__(self) -> None:
+        self._enabled = False
+        # (kwh, kwl) -> [get calls, records, bytes, ffi, read, group, frame, merge]
+        self._stats: dict[tuple[int, int], list[float]] = {}
+
+        self._memory = False
+        self._started_tracing = False
+        # (kwh, kwl) -> [read, group, frame and merge peak, retained, peak]
+        self._memory_stats: dict[tuple[int, int], list[int]] = {}
+        # [traced memory at start, peak so far] of the running phases, outermost first
+        self._memory_frames: list[list[int]] = []
+
+    def add_get(
+            self,
+            kwh: int,
+            kwl: int,
+            return_value: int,
+            n_bytes: int,
+            elapsed: float
+    ) -> None:
+        """Record a single call to ``sof_cdb_get``.
+        """
+        stats = self._get_stats(kwh, kwl)
+        stats[0] += 1
+        stats[3] += elapsed
+        if return_value < 2:
+            stats[1] += 1
+            stats[2] += n_bytes
+
+    def clear(self) -> None:
+        """Clear all the collected statistics.
+        """
+        self._stats.clear()
+        self._memory_stats.clear()
+
+    def is_enabled(self) -> bool:
+        """Return `True` if statistics are being collected.
+        """
+        return self._enabled
+
+    def is_memory_enabled(self) -> bool:
+        """Return `True` if the memory is being profiled.
+        """
+        return self._enabled and self._memory
+
+    def phase(self, kwh: int, kwl: int, name: str) -> ContextManager[Any]:
+        """Return a context manager measuring the wall time, and the memory if
+        enabled, of the phase ``name`` for key ``kwh/kwl``.
+        """
+        if not self._enabled:
+            return _NULL_CONTEXT
+
+        if self._memory:
+            return self._profiler(kwh, kwl, _PHASES.index(name))
+
+        return self._timer(kwh, kwl, 4 + _PHASES.index(name))
+
+    def report(self) -> "DataFrame":
+        """Return the collected statistics as a :class:`pandas.DataFrame` with
+        one row per key and the following columns:
+
+        * ``KWH`` and ``KWL``: the key
+        * ``GET_CALLS``: number of calls to ``sof_cdb_get``
+        * ``RECORDS``: number of records read
+        * ``BYTES``: number of bytes read
+        * ``FFI_TIME``, ``DECODE_TIME``, ``GROUP_TIME``, ``FRAME_TIME`` and
+          ``MERGE_TIME``: wall time in seconds spent in each phase
+        * ``TOTAL_TIME``: sum of the phase times
+        * ``READ_PEAK_MEMORY``, ``GROUP_PEAK_MEMORY``, ``FRAME_PEAK_MEMORY`` and
+          ``MERGE_PEAK_MEMORY``: highest peak memory in bytes of each phase
+        * ``PEAK_MEMORY``: highest memory in bytes reached while loading the
+          key, relative to the memory before its first phase
+        * ``RETAINED_MEMORY``: memory in bytes still allocated after the phases
+
+        Memory columns are zero unless memory profiling is enabled.
+        """
+        from pandas import DataFrame
+
+        rows: list[dict[str, float | int]] = []
+        for (kwh, kwl), stats in sorted(self._stats.items()):
+            decode = max(stats[4] - stats[3], 0.0)
+            memory = self._memory_stats.get((kwh, kwl), [0] * 6)
+            rows.append(
+                {
+                    "KWH":          kwh,
+                    "KWL":          kwl,
+                    "GET_CALLS":    int(stats[0]),
+                    "RECORDS":      int(stats[1]),
+                    "BYTES":        int(stats[2]),
+                    "FFI_TIME":     stats[3],
+                    "DECODE_TIME":  decode,
+                    "GROUP_TIME":   stats[5],
+                    "FRAME_TIME":   stats[6],
+                    "MERGE_TIME":   stats[7],
+                    "TOTAL_TIME":   stats[3] + decode + sum(stats[5:8]),
+                    "READ_PEAK_MEMORY":     memory[0],
+                    "GROUP_PEAK_MEMORY":    memory[1],
+                    "FRAME_PEAK_MEMORY":    memory[2],
+                    "MERGE_PEAK_MEMORY":    memory[3],
+                    "PEAK_MEMORY":          memory[5],
+                    "RETAINED_MEMORY":      memory[4]
+                }
+            )
+
+        return DataFrame(
+            rows,
+            columns=[
+                "KWH",
+                "KWL",
+                "GET_CALLS",
+                "RECORDS",
+                "BYTES",
+                "FFI_TIME",
+                "DECODE_TIME",
+                "GROUP_TIME",
+                "FRAME_TIME",
+                "MERGE_TIME",
+                "TOTAL_TIME",
+                "READ_PEAK_MEMORY",
+                "GROUP_PEAK_MEMORY",
+                "FRAME_PEAK_MEMORY",
+                "MERGE_PEAK_MEMORY",
+                "PEAK_MEMORY",
+                "RETAINED_MEMORY"
+            ]
+        )
+
+    def set_enabled(self, enabled: bool, memory: bool = False) -> None:
+        """Enable or disable the collection of statistics, including the memory
+        profiling if ``memory`` is `True`. :mod:`tracemalloc` is started if
+        needed, and stopped when the profiling is disabled if it was started
+        here.
+        """
+        self._enabled = enabled
+        self._memory = enabled and memory
+
+        if self._memory and not is_tracing():
+            start()
+            self._started_tracing = True
+        elif not self._memory and self._started_tracing:
+            stop()
+            self._started_tracing = False
+
+    def _add_memory(
+            self,
+            kwh: int,
+            kwl: int,
+            phase: int,
+            peak: int,
+            retained: int
+    ) -> None:
+        """Record the ``peak`` and ``retained`` memory of a single phase.
+        """
+        stats = self._memory_stats.setdefault((kwh, kwl), [0] * 6)
+        stats[phase] = max(stats[phase], peak)
+        # peak of the key: memory retained by its previous phases plus this one
+        stats[5] = max(stats[5], stats[4] + peak)
+        stats[4] += retained
+
+    def _get_stats(self, kwh: int, kwl: int) -> list[float]:
+        """Return the statistics of the given key, creating them if needed.
+        """
+        try:
+            return self._stats[(kwh, kwl)]
+        except KeyError:
+            stats = self._stats[(kwh, kwl)] = [0, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            return stats
+
+    @contextmanager
+    def _profiler(
+            self,
+            kwh: int,
+            kwl: int,
+            phase: int
+    ) -> Generator[None, None, None]:
+        """Add the wall time and the memory usage of the managed block to the
+        statistics of the given ``phase``.
+        """
+        current, peak = get_traced_memory()
+        # the peak is reset for this phase, running outer phases keep their own
+        for frame in self._memory_frames:
+            frame[1] = max(frame[1], peak)
+        reset_peak()
+
+        frame = [current, current]
+        self._memory_frames.append(frame)
+        try:
+            with self._timer(kwh, kwl, 4 + phase):
+                yield
+        finally:
+            self._memory_frames.pop()
+            current, peak = get_traced_memory()
+            self._add_memory(
+                kwh,
+                kwl,
+                phase,
+                max(frame[1], peak) - frame[0],
+                current - frame[0]
+            )
+
+    @contextmanager
+    def _timer(self, kwh: int, kwl: int, slot: int) -> Generator[None, None, None]:
+        """Add the wall time of the managed block to the given ``slot``.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._get_stats(kwh, kwl)[slot] += perf_counter() - start
@@ -130,70 +130,71 @@ class _LoadCases:
             if lc_nmb in self._loaded_lc:
                 self.clear(lc_nmb)
 
-            return_value.value = self._dll.get(
-                1,
-                12,
-                lc_nmb,
-                byref(lc),
-                byref(rec_length),
-                0
-            )
-
-            self._dll.to_string(byref(lc.m_rtex),
-                                byref(name),
-                                sizeof(name))
-
-            match lc.m_kind:
-                case 0:
-                    kind = "LINEAR LOAD CASE"
-                case 1:
-                    kind = "NON-LINEAR LOAD CASE"
-                case 2:
-                    kind = "SUPERPOSITION LOAD CASE"
-                case 3:
-                    kind = "INFLUENCE LINE"
-                case 4:
-                    kind = "DYNAMIC EIGENMODE"
-                case 5:
-                    kind = "BUCKLING MODE"
-                case 6:
-                    kind = "DESIGN CASE"
-                case 7:
-                    kind = "TRAIN LOAD DEFINITION"
-                case 8:
-                    kind = "TRANSIENT FUNCTION"
-                case _:
-                    kind = "ILLEGAL LOAD CASE"
-
-            match lc.m_theo:
-                case 0:
-                    theory = "1ST ORDER THEORY"
-                case 1:
-                    theory = "2ND ORDER THEORY"
-                case 2:
-                    theory = "TOTAL LAGRANGIAN"
-                case 3:
-                    theory = "UPDATED LAGRANGIAN"
-                case _:
-                    err_msg = f"Unknown error in theory of load case {lc_nmb}"
-                    raise RuntimeError(err_msg)
-
-            # dirty fix
-            temp_values = (c_int * 5)(*[lc.m_name[_] for _ in range(0, 5)])
-            temp_cast = cast(temp_values, c_char_p).value.decode("latin-1").rstrip().split(" ")  # type: ignore[union-attr]
-            designation = "".join(_ + " " for _ in temp_cast[:2]).rstrip()
-            self._designation[lc_nmb] = designation
-
-            self._factors[lc_nmb] = array(
-                [lc.m_fact, lc.m_facx, lc.m_facy, lc.m_facz], dtype = float64
-            )
-            self._kind[lc_nmb] = kind
-            self._name[lc_nmb] = name.value.decode()
-            self._plc[lc_nmb] = lc.m_plc
-            self._reaction_sum[lc_nmb] = array(
-                [lc.m_rx, lc.m_ry, lc.m_rz], dtype = float64
-            )
-            self._theory[lc_nmb] = theory
+            with self._dll.phase(12, lc_nmb, "read"):
+                return_value.value = self._dll.get(
+                    self._dll.index,
+                    12,
+                    lc_nmb,
+                    byref(lc),
+                    byref(rec_length),
+                    0
+                )
+
+                self._dll.to_string(byref(lc.m_rtex),
+                                    byref(name),
+                                    sizeof(name))
+
+                match lc.m_kind:
+                    case 0:
+                        kind = "LINEAR LOAD CASE"
+                    case 1:
+                        kind = "NON-LINEAR LOAD CASE"
+                    case 2:
+                        kind = "SUPERPOSITION LOAD CASE"
+                    case 3:
+                        kind = "INFLUENCE LINE"
+                    case 4:
+                        kind = "DYNAMIC EIGENMODE"
+                    case 5:
+                        kind = "BUCKLING MODE"
+                    case 6:
+                        kind = "DESIGN CASE"
+                    case 7:
+                        kind = "TRAIN LOAD DEFINITION"
+                    case 8:
+                        kind = "TRANSIENT FUNCTION"
+                    case _:
+                        kind = "ILLEGAL LOAD CASE"
+
+                match lc.m_theo:
+                    case 0:
+                        theory = "1ST ORDER THEORY"
+                    case 1:
+                        theory = "2ND ORDER THEORY"
+                    case 2:
+                        theory = "TOTAL LAGRANGIAN"
+                    case 3:
+                        theory = "UPDATED LAGRANGIAN"
+                    case _:
+                        err_msg = f"Unknown error in theory of load case {lc_nmb}"
+                        raise RuntimeError(err_msg)
+
+                # dirty fix
+                temp_values = (c_int * 5)(*[lc.m_name[_] for _ in range(0, 5)])
+                temp_cast = cast(temp_values, c_char_p).value.decode("latin-1").rstrip().split(" ")  # type: ignore[union-attr]
+                designation = "".join(_ + " " for _ in temp_cast[:2]).rstrip()
+                self._designation[lc_nmb] = designation
+
+                self._factors[lc_nmb] = array(
+                    [lc.m_fact, lc.m_facx, lc.m_facy, lc.m_facz], dtype = float64
+                )
+                self._kind[lc_nmb] = kind
+                self._name[lc_nmb] = name.value.decode()
+                self._plc[lc_nmb] = lc.m_plc
+                self._reaction_sum[lc_nmb] = array(
+                    [lc.m_rx, lc.m_ry, lc.m_rz], dtype = float64
+                )
+                self._theory[lc_nmb] = theory
 
             self._loaded_lc.add(lc_nmb)
 
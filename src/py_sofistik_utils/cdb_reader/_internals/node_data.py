@@ -3,12 +3,18 @@ from ctypes import byref, c_int, sizeof
 from typing import Any
 
 # third party library imports
+from numpy import int64
+from numpy.typing import NDArray
 from pandas import DataFrame
 
 # local library specific imports
+from . node_index import _NodeIndex
 from . sofistik_dll import SofDll
 from . sofistik_classes import CNODE
-from . sofistik_utilities import decode_nodal_boundary_condition
+from . sofistik_utilities import (
+    decode_nodal_boundary_conditions,
+    NODAL_DEGREES_OF_FREEDOM
+)
 
 
 class _NodeData:
@@ -26,7 +32,9 @@ class _NodeData:
     * ``X0``: the X coordinate of the node
     * ``Y0``: the Y coordinate of the node
     * ``Z0``: the Z coordinate of the node
-    * ``KFIX``: string defining the boundary conditions defined for the node
+    * ``KFIX``: categorical string defining the boundary conditions defined for the node.
+      Its codes are the bits of the free degrees of freedom, see
+      :meth:`get_supported_nodes`
     * ``IS_USED``: `bool`, `True` if the node is connected to already engaged nodes
     """
     def __init__(self, dll: SofDll) -> None:
@@ -93,6 +101,45 @@ class _NodeData:
 
         return self._data[["X0", "Y0", "Z0"]][mask].copy(deep=True)
 
+    def get_spatial_index(self, cell_size: float | None = None) -> _NodeIndex:
+        """Return a spatial index over the nodal coordinates for nearest node, radius
+        and box queries, see :class:`_NodeIndex`.
+
+        Parameters
+        ----------
+        ``cell_size``: float | None, default None
+            The edge of the grid cells. When None, it is chosen from the node density.
+        """
+        return _NodeIndex(
+            self._data["ID"].to_numpy(),
+            self._data[["X0", "Y0", "Z0"]].to_numpy(),
+            cell_size
+        )
+
+    def get_supported_nodes(self, direction: str) -> NDArray[int64]:
+        """Return the numbers of the nodes supported in the given ``direction``,
+        e.g. ``"PZ"`` or ``"MX"``.
+
+        Parameters
+        ----------
+        ``direction``: str
+            One of ``"PX"``, ``"PY"``, ``"PZ"``, ``"MX"``, ``"MY"`` and ``"MZ"``
+
+        Raises
+        ------
+        LookupError
+            If the given ``direction`` is unknown.
+        """
+        if direction not in NODAL_DEGREES_OF_FREEDOM:
+            raise LookupError(f"Direction \"{direction}\" not found!")
+
+        node_ids = self._data.ID.to_numpy(dtype=int64)
+        if self._data.empty:
+            return node_ids
+
+        codes = self._data.KFIX.cat.codes.to_numpy()
+        return node_ids[(codes & NODAL_DEGREES_OF_FREEDOM[direction]) == 0]
+
     def get_number_of_nodes(self) -> int:
         """Return the number of nodes.
         """
@@ -115,31 +162,37 @@ class _NodeData:
 
             temp_container: list[dict[str, Any]] = []
             count = 0
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    20,
-                    0,
-                    byref(node),
-                    byref(record_length),
-                    0 if count == 0 else 1
-                )
-
-                if return_value.value >= 2:
-                    break
-
-                temp_container.append({
-                    "ID": node.m_nr,
-                    "INT_ID": node.m_inr,
-                    "X0": node.m_xyz[0],
-                    "Y0": node.m_xyz[1],
-                    "Z0": node.m_xyz[2],
-                    "KFIX": decode_nodal_boundary_condition(node.m_kfix),
-                    "NOT_USED": (node.m_ncod & 3) > 0
-                })
-
-                record_length = c_int(sizeof(node))
-                count += 1
-
-            self._data = DataFrame(temp_container)
+            with self._dll.phase(20, 0, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        20,
+                        0,
+                        byref(node),
+                        byref(record_length),
+                        0 if count == 0 else 1
+                    )
+
+                    if return_value.value >= 2:
+                        break
+
+                    temp_container.append({
+                        "ID": node.m_nr,
+                        "INT_ID": node.m_inr,
+                        "X0": node.m_xyz[0],
+                        "Y0": node.m_xyz[1],
+                        "Z0": node.m_xyz[2],
+                        "KFIX": node.m_kfix,
+                        "NOT_USED": (node.m_ncod & 3) > 0
+                    })
+
+                    record_length = c_int(sizeof(node))
+                    count += 1
+
+            with self._dll.phase(20, 0, "frame"):
+                self._data = DataFrame(temp_container)
+                if count > 0:
+                    self._data["KFIX"] = decode_nodal_boundary_conditions(
+                        self._data["KFIX"].to_numpy()
+                    )
             self._is_loaded = True
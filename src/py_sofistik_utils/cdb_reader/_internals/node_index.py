@@ -0,0 +1,312 @@
+# standard library imports
+
+# third party library imports
+from numpy import (
+    arange, argsort, asarray, bincount, bool_, broadcast_to, concatenate, cumsum, diff,
+    empty, flatnonzero, float64, floor, full, inf, int64, lexsort, maximum, minimum, r_,
+    repeat, searchsorted, split, stack, where, zeros
+)
+from numpy.typing import ArrayLike, NDArray
+
+# local library specific imports
+
+
+# points searched at once by _NodeIndex.nearest, to bound the candidate pairs in memory
+_CHUNK_SIZE = 256
+
+
+class _NodeIndex:
+    """
+    The ``_NodeIndex`` class is a spatial index over node coordinates, answering
+    batches of nearest node, radius and box queries without scanning all the nodes.
+
+    Nodes are hashed into a uniform grid of cubic cells, sized for about two nodes per
+    cell, and sorted by cell so that the nodes of a cell are contiguous. Queries only
+    visit the cells overlapping their search region, all the queries of a batch at
+    once.
+    """
+    def __init__(
+            self,
+            node_ids: ArrayLike,
+            coordinates: ArrayLike,
+            cell_size: float | None = None
+    ) -> None:
+        """The initializer of the ``_NodeIndex`` class.
+
+        Parameters
+        ----------
+        node_ids: ArrayLike
+            The node numbers, shape ``(n,)``
+        coordinates: ArrayLike
+            The node coordinates, shape ``(n, 3)``
+        cell_size: float | None, default None
+            The edge of the grid cells. When None, it is chosen from the node density.
+        """
+        node_ids = asarray(node_ids, dtype=int64)
+        coordinates = asarray(coordinates, dtype=float64).reshape(-1, 3)
+
+        self._origin = zeros(3, dtype=float64)
+        extent = zeros(3, dtype=float64)
+        if node_ids.size:
+            self._origin = coordinates.min(axis=0)
+            extent = coordinates.max(axis=0) - self._origin
+
+        self._extent = extent
+        self.cell_size = self._get_cell_size(extent, node_ids.size, cell_size)
+        self._shape = floor(extent / self.cell_size).astype(int64) + 1
+
+        keys = self._get_keys(self._get_cells(coordinates))
+        order = argsort(keys, kind="stable")
+        keys = keys[order]
+        self._ids = node_ids[order]
+        self._coordinates = coordinates[order]
+
+        # the nodes of the cell self._cell_keys[i] are
+        # self._cell_starts[i]:self._cell_starts[i + 1]
+        starts = flatnonzero(r_[True, diff(keys) != 0][:keys.size])
+        self._cell_keys = keys[starts]
+        self._cell_starts = r_[starts, keys.size].astype(int64)
+
+    def __len__(self) -> int:
+        return self._ids.size
+
+    def nearest(self, points: ArrayLike) -> tuple[NDArray[int64], NDArray[float64]]:
+        """Return the numbers of the nodes closest to ``points``, shape ``(q, 3)``,
+        and their distances.
+
+        Points are searched in chunks of ``_CHUNK_SIZE``, starting from the cells
+        around each point and widening until no unvisited cell can hold a closer
+        node. Points whose search would visit more cells than the occupied ones are
+        compared with all the nodes instead.
+
+        Raises
+        ------
+        RuntimeError
+            If the index holds no nodes.
+        """
+        if not len(self):
+            raise RuntimeError("No nodes to search!")
+
+        points = asarray(points, dtype=float64).reshape(-1, 3)
+        nodes = empty(points.shape[0], dtype=int64)
+        distances = empty(points.shape[0], dtype=float64)
+        for start in range(0, points.shape[0], _CHUNK_SIZE):
+            chunk = slice(start, start + _CHUNK_SIZE)
+            nodes[chunk], distances[chunk] = self._get_nearest(points[chunk])
+
+        return self._ids[nodes], distances ** 0.5
+
+    def within_box(self, lower: ArrayLike, upper: ArrayLike) -> list[NDArray[int64]]:
+        """Return, for each box, the numbers of the nodes inside it, bounds included.
+
+        Parameters
+        ----------
+        lower: ArrayLike
+            The lower corners of the boxes, shape ``(q, 3)``
+        upper: ArrayLike
+            The upper corners of the boxes, shape ``(q, 3)``
+        """
+        lower = asarray(lower, dtype=float64).reshape(-1, 3)
+        upper = asarray(upper, dtype=float64).reshape(-1, 3)
+
+        query, nodes = self._get_candidates(
+            self._get_cells(lower), self._get_cells(upper)
+        )
+        coordinates = self._coordinates[nodes]
+        is_inside = (
+            (coordinates >= lower[query]) & (coordinates <= upper[query])
+        ).all(axis=1)
+        return self._split(query[is_inside], nodes[is_inside], lower.shape[0])
+
+    def within_radius(
+            self,
+            points: ArrayLike,
+            radius: ArrayLike
+    ) -> list[NDArray[int64]]:
+        """Return, for each of the ``points``, shape ``(q, 3)``, the numbers of the
+        nodes not farther than ``radius``, a scalar or one value per point.
+        """
+        points = asarray(points, dtype=float64).reshape(-1, 3)
+        radius = broadcast_to(asarray(radius, dtype=float64), points.shape[:1])
+
+        query, nodes = self._get_candidates(
+            self._get_cells(points - radius[:, None]),
+            self._get_cells(points + radius[:, None])
+        )
+        distances = ((self._coordinates[nodes] - points[query]) ** 2).sum(axis=1)
+        is_inside = distances <= radius[query] ** 2
+        return self._split(query[is_inside], nodes[is_inside], points.shape[0])
+
+    @staticmethod
+    def _get_cell_size(
+            extent: NDArray[float64],
+            size: int,
+            cell_size: float | None
+    ) -> float:
+        """Return ``cell_size`` or, when None, the edge of the cells holding about two
+        nodes each, with no more cells than four times the nodes.
+
+        Raises
+        ------
+        RuntimeError
+            If the given ``cell_size`` is not positive.
+        """
+        if cell_size is not None:
+            if cell_size <= 0.0:
+                raise RuntimeError(f"Cell size {cell_size} must be positive!")
+
+            return cell_size
+
+        # flat directions, e.g. Z for a slab, do not take part in the density
+        spread = extent[extent > 1E-9 * extent.max(initial=0.0)]
+        if not spread.size:
+            return 1.0
+
+        edge = float(spread.prod() * 2.0 / size) ** (1.0 / spread.size)
+        while (floor(extent / edge) + 1).prod() > 4 * size:
+            edge *= 1.5
+
+        return edge
+
+    def _get_candidates(
+            self,
+            lower: NDArray[int64],
+            upper: NDArray[int64]
+    ) -> tuple[NDArray[int64], NDArray[int64]]:
+        """Return the ``(query, node)`` pairs of the nodes in the cells from ``lower``
+        to ``upper`` of each query, sorted by query. Nodes are positions in the sorted
+        arrays.
+        """
+        sizes = (upper - lower + 1).clip(0, None)
+        counts = sizes.prod(axis=1)
+        query = repeat(arange(sizes.shape[0]), counts)
+
+        # cells of each query block, as offsets from its lower cell
+        local = arange(counts.sum()) - repeat(cumsum(counts) - counts, counts)
+        sizes = sizes[query]
+        offsets = stack(
+            [
+                local // (sizes[:, 1] * sizes[:, 2]),
+                local // sizes[:, 2] % sizes[:, 1],
+                local % sizes[:, 2]
+            ],
+            axis=1
+        )
+        keys = self._get_keys(lower[query] + offsets)
+
+        positions = searchsorted(self._cell_keys, keys)
+        positions = positions.clip(0, max(self._cell_keys.size - 1, 0))
+        is_occupied = zeros(keys.shape, dtype=bool_)
+        if self._cell_keys.size:
+            is_occupied = self._cell_keys[positions] == keys
+
+        query, positions = query[is_occupied], positions[is_occupied]
+
+        starts = self._cell_starts[positions]
+        lengths = self._cell_starts[positions + 1] - starts
+        nodes = arange(lengths.sum()) + repeat(
+            starts - (cumsum(lengths) - lengths), lengths
+        )
+        return repeat(query, lengths), nodes
+
+    def _get_cells(self, coordinates: NDArray[float64]) -> NDArray[int64]:
+        """Return the grid cells of ``coordinates``, clipped to the grid.
+        """
+        cells = ((coordinates - self._origin) / self.cell_size).clip(0, self._shape - 1)
+        return floor(cells).astype(int64)
+
+    def _get_keys(self, cells: NDArray[int64]) -> NDArray[int64]:
+        """Return the linear keys of ``cells``.
+        """
+        return (  # type: ignore[no-any-return]
+            (cells[:, 0] * self._shape[1] + cells[:, 1]) * self._shape[2] + cells[:, 2]
+        )
+
+    def _get_nearest(
+            self,
+            points: NDArray[float64]
+    ) -> tuple[NDArray[int64], NDArray[float64]]:
+        """Return the positions in the sorted arrays of the nodes closest to
+        ``points`` and their squared distances.
+        """
+        best_distances = full(points.shape[0], inf, dtype=float64)
+        best = zeros(points.shape[0], dtype=int64)
+        cells = self._get_cells(points)
+
+        active = arange(points.shape[0])
+        rings = 1
+        while active.size:
+            lower = (cells[active] - rings).clip(0, None)
+            upper = minimum(cells[active] + rings, self._shape - 1)
+
+            is_wide = (upper - lower + 1).prod(axis=1) > self._cell_keys.size
+            for i in active[is_wide]:
+                distances = ((self._coordinates - points[i]) ** 2).sum(axis=1)
+                best[i] = distances.argmin()
+                best_distances[i] = distances[best[i]]
+
+            active, lower, upper = active[~is_wide], lower[~is_wide], upper[~is_wide]
+            query, nodes = self._get_candidates(lower, upper)
+
+            distances = (
+                (self._coordinates[nodes] - points[active][query]) ** 2
+            ).sum(axis=1)
+            order = lexsort((distances, query))
+            query, nodes, distances = query[order], nodes[order], distances[order]
+            is_first = r_[True, query[1:] != query[:-1]][:query.size]
+
+            found = active[query[is_first]]
+            best_distances[found] = distances[is_first]
+            best[found] = nodes[is_first]
+
+            bound = self._get_unvisited_distance(points[active], lower, upper)
+            active = active[best_distances[active] > bound]
+            rings *= 2
+
+        return best, best_distances
+
+    def _get_unvisited_distance(
+            self,
+            points: NDArray[float64],
+            lower: NDArray[int64],
+            upper: NDArray[int64]
+    ) -> NDArray[float64]:
+        """Return a lower bound of the squared distance from ``points`` to the nodes
+        outside the cells from ``lower`` to ``upper``, infinite when these cover the
+        grid.
+
+        Such nodes lie in a slab of the grid below or above these cells along at least
+        one axis, and are not closer than the nearest of these slabs.
+        """
+        # the bounding box of the nodes, tighter than the grid far from the model
+        grid_low = self._origin
+        grid_high = self._origin + self._extent
+        low_faces = self._origin + lower * self.cell_size
+        high_faces = self._origin + (upper + 1) * self.cell_size
+
+        outside = maximum(grid_low - points, 0.0) + maximum(points - grid_high, 0.0)
+        to_grid = outside ** 2
+        others = to_grid.sum(axis=1, keepdims=True) - to_grid
+        to_low_slabs = maximum(points - low_faces, 0.0) + maximum(grid_low - points, 0.0)
+        to_high_slabs = (
+            maximum(high_faces - points, 0.0) + maximum(points - grid_high, 0.0)
+        )
+        distances = concatenate(
+            [
+                where(lower > 0, others + to_low_slabs ** 2, inf),
+                where(upper < self._shape - 1, others + to_high_slabs ** 2, inf)
+            ],
+            axis=1
+        )
+        return distances.min(axis=1)  # type: ignore[no-any-return]
+
+    def _split(
+            self,
+            query: NDArray[int64],
+            nodes: NDArray[int64],
+            size: int
+    ) -> list[NDArray[int64]]:
+        """Split the node numbers of the ``(query, node)`` pairs, sorted by query,
+        into one array per query.
+        """
+        return split(self._ids[nodes], cumsum(bincount(query, minlength=size))[:-1])
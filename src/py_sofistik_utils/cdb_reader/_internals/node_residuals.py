@@ -199,49 +199,51 @@ class _NodeResiduals:
 
             temp_container: list[dict[str, Any]] = []
             count = 0
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    26,
-                    load_case,
-                    byref(node),
-                    byref(rec_length),
-                    0 if count == 0 else 1
-                )
-
-                rec_length = c_int(sizeof(node))
-                count += 1
-
-                temp_container.append(
-                    {
-                        "LOAD_CASE":load_case,
-                        "ID": node.m_nr,
-                        "UX": node.m_ux,
-                        "UY": node.m_uy,
-                        "UZ": node.m_uz,
-                        "URX": node.m_urx,
-                        "URY": node.m_ury,
-                        "URZ": node.m_urz,
-                        "URB": node.m_urb,
-                        "PX": node.m_px,
-                        "PY": node.m_py,
-                        "PZ": node.m_pz,
-                        "MX": node.m_mx,
-                        "MY": node.m_my,
-                        "MZ": node.m_mz,
-                        "MB": node.m_mb
-                    }
-                )
+            with self._dll.phase(26, load_case, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        26,
+                        load_case,
+                        byref(node),
+                        byref(rec_length),
+                        0 if count == 0 else 1
+                    )
+
+                    rec_length = c_int(sizeof(node))
+                    count += 1
+
+                    temp_container.append(
+                        {
+                            "LOAD_CASE":load_case,
+                            "ID": node.m_nr,
+                            "UX": node.m_ux,
+                            "UY": node.m_uy,
+                            "UZ": node.m_uz,
+                            "URX": node.m_urx,
+                            "URY": node.m_ury,
+                            "URZ": node.m_urz,
+                            "URB": node.m_urb,
+                            "PX": node.m_px,
+                            "PY": node.m_py,
+                            "PZ": node.m_pz,
+                            "MX": node.m_mx,
+                            "MY": node.m_my,
+                            "MZ": node.m_mz,
+                            "MB": node.m_mb
+                        }
+                    )
 
             # remove duplicated data as well as max min values
             del temp_container[0:2]
             del temp_container[-1]
 
-            if self._data.empty:
-                self._data = DataFrame(temp_container)
-            else:
-                self._data = concat(
-                    [self._data, DataFrame(temp_container)],
-                    ignore_index=True
-                )
+            with self._dll.phase(26, load_case, "merge"):
+                if self._data.empty:
+                    self._data = DataFrame(temp_container)
+                else:
+                    self._data = concat(
+                        [self._data, DataFrame(temp_container)],
+                        ignore_index=True
+                    )
             self._loaded_lc.add(load_case)
@@ -246,53 +246,55 @@ class _NodeResults:
 
             temp_container: list[dict[str, Any]] = []
             count = 0
-            while return_value.value < 2:
-                node = CN_DISP()
-                return_value.value = self._dll.get(
-                    1,
-                    24,
-                    load_case,
-                    byref(node),
-                    byref(rec_length),
-                    0 if count == 0 else 1
-                )
-
-                rec_length = c_int(sizeof(node))
-                count += 1
-
-                if return_value.value >= 2:
-                    break
-
-                temp_container.append(
-                    {
-                        "LOAD_CASE":load_case,
-                        "ID": node.m_nr,
-                        "UX": node.m_ux,
-                        "UY": node.m_uy,
-                        "UZ": node.m_uz,
-                        "URX": node.m_urx,
-                        "URY": node.m_ury,
-                        "URZ": node.m_urz,
-                        "URB": node.m_urb,
-                        "PX": node.m_px,
-                        "PY": node.m_py,
-                        "PZ": node.m_pz,
-                        "MX": node.m_mx,
-                        "MY": node.m_my,
-                        "MZ": node.m_mz,
-                        "MB": node.m_mb
-                    }
-                )
+            with self._dll.phase(24, load_case, "read"):
+                while return_value.value < 2:
+                    node = CN_DISP()
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        24,
+                        load_case,
+                        byref(node),
+                        byref(rec_length),
+                        0 if count == 0 else 1
+                    )
+
+                    rec_length = c_int(sizeof(node))
+                    count += 1
+
+                    if return_value.value >= 2:
+                        break
+
+                    temp_container.append(
+                        {
+                            "LOAD_CASE":load_case,
+                            "ID": node.m_nr,
+                            "UX": node.m_ux,
+                            "UY": node.m_uy,
+                            "UZ": node.m_uz,
+                            "URX": node.m_urx,
+                            "URY": node.m_ury,
+                            "URZ": node.m_urz,
+                            "URB": node.m_urb,
+                            "PX": node.m_px,
+                            "PY": node.m_py,
+                            "PZ": node.m_pz,
+                            "MX": node.m_mx,
+                            "MY": node.m_my,
+                            "MZ": node.m_mz,
+                            "MB": node.m_mb
+                        }
+                    )
 
             # remove max min
             del temp_container[0:2]
 
-            if self._data.empty:
-                self._data = DataFrame(temp_container)
-            else:
-                self._data = concat(
-                    [self._data, DataFrame(temp_container)],
-                    ignore_index=True
-                )
+            with self._dll.phase(24, load_case, "merge"):
+                if self._data.empty:
+                    self._data = DataFrame(temp_container)
+                else:
+                    self._data = concat(
+                        [self._data, DataFrame(temp_container)],
+                        ignore_index=True
+                    )
 
             self._loaded_lc.add(load_case)
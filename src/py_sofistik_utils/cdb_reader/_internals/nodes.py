@@ -5,6 +5,7 @@ from pandas import concat, DataFrame
 
 # local library specific imports
 from . node_data import _NodeData
+from . node_index import _NodeIndex
 from . node_residuals import _NodeResiduals
 from . node_results import _NodeResults
 from . sofistik_dll import SofDll
@@ -89,6 +90,36 @@ class _Nodes:
         lc_mask = self._data["LOAD_CASE"] == load_case
         return self._data.loc[lc_mask, ("ID", "X", "Y", "Z")].copy(deep=True)
 
+    def get_spatial_index(
+            self,
+            load_case: int | None = None,
+            cell_size: float | None = None
+    ) -> _NodeIndex:
+        """Return a spatial index over the nodal coordinates for nearest node, radius
+        and box queries, see :class:`_NodeIndex`.
+
+        Parameters
+        ----------
+        ``load_case``: int | None, default None
+            When given, the index is built on the deflected configuration of this load
+            case, calculated if needed. When None, on the undeformed coordinates.
+        ``cell_size``: float | None, default None
+            The edge of the grid cells. When None, it is chosen from the node density.
+        """
+        if load_case is None:
+            if not self.data.is_loaded():
+                self.data.load()
+
+            return self.data.get_spatial_index(cell_size)
+
+        if not self.is_deflected_configuration_calculated(load_case):
+            self.calculate_deflected_configuration(load_case)
+
+        coord = self.get_deflected_configuration(load_case)
+        return _NodeIndex(
+            coord["ID"].to_numpy(), coord[["X", "Y", "Z"]].to_numpy(), cell_size
+        )
+
     def is_deflected_configuration_calculated(self, load_case: int) -> bool:
         """Return ``True`` if the deflected configuration has been calculated for the
         given ``load_case``.
@@ -6,6 +6,8 @@ from pandas import DataFrame
 
 # local library specific imports
 from . group_data import _GroupData
+from . node_data import _NodeData
+from . plate_geometry import _PlateGeometry
 from . sofistik_dll import SofDll
 from . sofistik_classes import CQUAD
 
@@ -54,55 +56,58 @@ class _PlateData:
 
             temp_container: list[list[int]] = []
             count = 0
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    200,
-                    0,
-                    byref(quad),
-                    byref(rec_length),
-                    0 if count == 0 else 1
-                )
-
-                if return_value.value >= 2:
-                    break
-
-                if quad.m_nr != 0:
-                    temp_list: list[int] = [0 for _ in range(8)]
-                    temp_list[0] = 0
-                    temp_list[1] = quad.m_nr
-                    for i in range(0, 4):
-                        temp_list[i + 2] = quad.m_node[i]
-                    temp_list[6] = quad.m_mat
-                    temp_list[7] = quad.m_nra
-
-                    temp_container.append(temp_list)
-
-                rec_length = c_int(sizeof(quad))
-                count += 1
+            with self._dll.phase(200, 0, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        200,
+                        0,
+                        byref(quad),
+                        byref(rec_length),
+                        0 if count == 0 else 1
+                    )
+
+                    if return_value.value >= 2:
+                        break
+
+                    if quad.m_nr != 0:
+                        temp_list: list[int] = [0 for _ in range(8)]
+                        temp_list[0] = 0
+                        temp_list[1] = quad.m_nr
+                        for i in range(0, 4):
+                            temp_list[i + 2] = quad.m_node[i]
+                        temp_list[6] = quad.m_mat
+                        temp_list[7] = quad.m_nra
+
+                        temp_container.append(temp_list)
+
+                    rec_length = c_int(sizeof(quad))
+                    count += 1
 
             # preparing data for conversion to a pandas DataFrame
-            conv_data: list[dict[str, int]] = []
-            for item in temp_container:
-                conv_data.append({"GROUP"   : item[0],
-                                  "ELEM_ID" : item[1],
-                                  "N1"      : item[2],
-                                  "N2"      : item[3],
-                                  "N3"      : item[4],
-                                  "N4"      : item[5],
-                                  "MNO"     : item[6],
-                                  "NRA"     : item[7],
-                                  })
-
-            self._data = DataFrame(conv_data)
+            with self._dll.phase(200, 0, "frame"):
+                conv_data: list[dict[str, int]] = []
+                for item in temp_container:
+                    conv_data.append({"GROUP"   : item[0],
+                                      "ELEM_ID" : item[1],
+                                      "N1"      : item[2],
+                                      "N2"      : item[3],
+                                      "N3"      : item[4],
+                                      "N4"      : item[5],
+                                      "MNO"     : item[6],
+                                      "NRA"     : item[7],
+                                      })
+
+                self._data = DataFrame(conv_data)
             self._is_loaded = True
 
             # assigning groups
-            group_data = _GroupData(self._dll)
-            group_data.load()
+            with self._dll.phase(200, 0, "group"):
+                group_data = _GroupData(self._dll)
+                group_data.load()
 
-            for grp, quad_range in group_data.iterator_quad():
-                self._data.loc[self._data.ELEM_ID.isin(quad_range), "GROUP"] = grp
+                for grp, quad_range in group_data.iterator_quad():
+                    self._data.loc[self._data.ELEM_ID.isin(quad_range), "GROUP"] = grp
 
     def get_connectivity(self) -> DataFrame:
         """Return the plate connectivity for all the plate elements.
@@ -131,6 +136,31 @@ class _PlateData:
 
         return self._data.iloc[:, 1:6][mask].copy(deep=True)
 
+    def get_geometry(self, node_data: _NodeData) -> _PlateGeometry:
+        """Return the areas, centroids, unit normals and diagonal lengths of all the
+        plate elements, see :class:`_PlateGeometry`. Node data are loaded if needed.
+
+        Parameters
+        ----------
+        ``node_data``: _NodeData
+            The nodes the plates are joined to
+
+        Raises
+        ------
+        RuntimeError
+            If any plate node is not found in ``node_data``.
+        """
+        if not node_data.is_loaded():
+            node_data.load()
+
+        coordinates = node_data.get_all_coordinates()
+        return _PlateGeometry.from_nodes(
+            self._data["ELEM_ID"].to_numpy(),
+            self._data[["N1", "N2", "N3", "N4"]].to_numpy(),
+            coordinates["ID"].to_numpy(),
+            coordinates[["X0", "Y0", "Z0"]].to_numpy()
+        )
+
     def get_group_connectivity(self, group_number: int|list[int]) -> DataFrame:
         """Return the plate connectivity for the given ``grp_nmb``.
         The first column represents the element IDs.
@@ -0,0 +1,122 @@
+# standard library imports
+
+# third party library imports
+from numpy import (
+    argsort, asarray, bool_, cross, errstate, float64, int64, nan, searchsorted, sqrt,
+    stack, unique, where, zeros
+)
+from numpy.linalg import norm
+from numpy.typing import ArrayLike, NDArray
+
+# local library specific imports
+
+
+class _PlateGeometry:
+    """
+    The ``_PlateGeometry`` class stores the geometry of the quad elements of key
+    ``200/00`` derived from their nodes, in contiguous arrays with one entry per element
+    in loading order:
+
+    * ``elem_ids``: the element numbers, shape ``(n,)``
+    * ``areas``: the element areas, shape ``(n,)``
+    * ``centroids``: the element centroids, shape ``(n, 3)``
+    * ``normals``: the element unit normals, oriented by the node numbering, shape
+      ``(n, 3)``. NaN for elements without area
+    * ``diagonals``: the lengths of the diagonals ``N1-N3`` and ``N2-N4``, shape
+      ``(n, 2)``
+
+    Triangles are stored as quads with ``N3 == N4``: their second diagonal is the edge
+    ``N2-N3``. For warped quads, ``areas`` and ``normals`` refer to the mean plane
+    spanned by the diagonals.
+    """
+    def __init__(
+            self,
+            elem_ids: NDArray[int64],
+            areas: NDArray[float64],
+            centroids: NDArray[float64],
+            normals: NDArray[float64],
+            diagonals: NDArray[float64]
+    ) -> None:
+        """The initializer of the ``_PlateGeometry`` class.
+        """
+        self.elem_ids = elem_ids
+        self.areas = areas
+        self.centroids = centroids
+        self.normals = normals
+        self.diagonals = diagonals
+
+    def __len__(self) -> int:
+        return self.elem_ids.size
+
+    @classmethod
+    def from_nodes(
+            cls,
+            elem_ids: ArrayLike,
+            connectivity: ArrayLike,
+            node_ids: ArrayLike,
+            coordinates: ArrayLike
+    ) -> "_PlateGeometry":
+        """Build the geometry of the elements ``elem_ids`` from their ``(n, 4)``
+        ``connectivity`` and the ``(m, 3)`` ``coordinates`` of the nodes ``node_ids``.
+
+        Raises
+        ------
+        RuntimeError
+            If any node of the ``connectivity`` is not found in ``node_ids``.
+        """
+        connectivity = asarray(connectivity, dtype=int64).reshape(-1, 4)
+        node_ids = asarray(node_ids, dtype=int64)
+        coordinates = asarray(coordinates, dtype=float64).reshape(-1, 3)
+
+        order = argsort(node_ids, kind="stable")
+        sorted_ids = node_ids[order]
+        positions = searchsorted(sorted_ids, connectivity)
+        positions = positions.clip(0, max(node_ids.size - 1, 0))
+        is_found = zeros(connectivity.shape, dtype=bool_)
+        if node_ids.size:
+            is_found = sorted_ids[positions] == connectivity
+
+        if not is_found.all():
+            missing = unique(connectivity[~is_found]).tolist()
+            raise RuntimeError(f"Node numbers {missing} not found!")
+
+        # (4, n, 3): one array of coordinates per element node
+        p1, p2, p3, p4 = coordinates[order[positions]].transpose(1, 0, 2)
+        d13 = p3 - p1
+        d24 = p4 - p2
+
+        # the vector area of a quad is half the cross product of its diagonals
+        vector_areas = 0.5 * cross(d13, d24)
+        areas = norm(vector_areas, axis=1)
+        with errstate(divide="ignore", invalid="ignore"):
+            normals = where(
+                areas[:, None] > 0.0, vector_areas / areas[:, None], nan
+            )
+
+        # area-weighted centroid of the triangles N1-N2-N3 and N1-N3-N4, the mean of
+        # the nodes for elements without area
+        a123 = 0.5 * norm(cross(p2 - p1, d13), axis=1)
+        a134 = 0.5 * norm(cross(d13, p4 - p1), axis=1)
+        weights = a123 + a134
+        with errstate(divide="ignore", invalid="ignore"):
+            centroids = where(
+                weights[:, None] > 0.0,
+                (
+                    a123[:, None] * (p1 + p2 + p3) + a134[:, None] * (p1 + p3 + p4)
+                ) / (3.0 * weights[:, None]),
+                0.25 * (p1 + p2 + p3 + p4)
+            )
+
+        return cls(
+            asarray(elem_ids, dtype=int64),
+            areas,
+            centroids,
+            normals,
+            stack([norm(d13, axis=1), norm(d24, axis=1)], axis=1)
+        )
+
+    def characteristic_sizes(self) -> NDArray[float64]:
+        """Return the characteristic size of each element, i.e. the square root of its
+        area.
+        """
+        return sqrt(self.areas)  # type: ignore[no-any-return]
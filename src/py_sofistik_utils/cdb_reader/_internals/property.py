@@ -187,72 +187,75 @@ class _PropertyData:
 
             temp_container: list[Any] = [0 for _ in range(12)]
             count = 0
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    9,
-                    property_number,
-                    byref(prop),
-                    byref(rec_length),
-                    0 if count == 0 else 1
-                )
-
-                if return_value.value >= 2:
-                    break
-
-                if prop.m_id == 0:
-                    temp_container[0] = property_number
-                    temp_container[1] = prop.m_a
-                    temp_container[2] = prop.m_ay
-                    temp_container[3] = prop.m_az
-                    temp_container[4] = prop.m_it
-                    temp_container[5] = prop.m_iy
-                    temp_container[6] = prop.m_iz
-                    temp_container[9] = prop.m_em
-                    temp_container[10] = prop.m_gm
-                    temp_container[11] = prop.m_gam
-
-                else:
-                    return_value_add.value = self._dll.get(
-                        1,
+            with self._dll.phase(9, property_number, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
                         9,
                         property_number,
-                        byref(prop_add),
-                        byref(rec_length_add),
-                        -1
+                        byref(prop),
+                        byref(rec_length),
+                        0 if count == 0 else 1
                     )
 
-                    y_max = max(abs(prop_add.m_ymin), prop_add.m_ymax)
-                    z_max = max(abs(prop_add.m_zmin), prop_add.m_zmax)
-
-                #TODO: temporary workaround
-                if count >= 1:
-                    break
-                count += 1
-                rec_length = c_int(sizeof(prop))
-
-            data = DataFrame(
-                [
-                    {
-                        "ID": property_number,
-                        "A": temp_container[1],
-                        "AV_Y": temp_container[2],
-                        "AV_Z": temp_container[3],
-                        "J": temp_container[4],
-                        "I_YY": temp_container[5],
-                        "I_ZZ": temp_container[6],
-                        "W_EL_YY": temp_container[5] / y_max,
-                        "W_EL_ZZ": temp_container[6] / z_max,
-                        "E": temp_container[9],
-                        "G": temp_container[10],
-                        "SW": temp_container[11]
-                    }
-                ]
-            )
-
-            if self._data.empty:
-                self._data = data
-            else:
-                self._data = concat([self._data, data], ignore_index=True)
+                    if return_value.value >= 2:
+                        break
+
+                    if prop.m_id == 0:
+                        temp_container[0] = property_number
+                        temp_container[1] = prop.m_a
+                        temp_container[2] = prop.m_ay
+                        temp_container[3] = prop.m_az
+                        temp_container[4] = prop.m_it
+                        temp_container[5] = prop.m_iy
+                        temp_container[6] = prop.m_iz
+                        temp_container[9] = prop.m_em
+                        temp_container[10] = prop.m_gm
+                        temp_container[11] = prop.m_gam
+
+                    else:
+                        return_value_add.value = self._dll.get(
+                            self._dll.index,
+                            9,
+                            property_number,
+                            byref(prop_add),
+                            byref(rec_length_add),
+                            -1
+                        )
+
+                        y_max = max(abs(prop_add.m_ymin), prop_add.m_ymax)
+                        z_max = max(abs(prop_add.m_zmin), prop_add.m_zmax)
+
+                    #TODO: temporary workaround
+                    if count >= 1:
+                        break
+                    count += 1
+                    rec_length = c_int(sizeof(prop))
+
+            with self._dll.phase(9, property_number, "frame"):
+                data = DataFrame(
+                    [
+                        {
+                            "ID": property_number,
+                            "A": temp_container[1],
+                            "AV_Y": temp_container[2],
+                            "AV_Z": temp_container[3],
+                            "J": temp_container[4],
+                            "I_YY": temp_container[5],
+                            "I_ZZ": temp_container[6],
+                            "W_EL_YY": temp_container[5] / y_max,
+                            "W_EL_ZZ": temp_container[6] / z_max,
+                            "E": temp_container[9],
+                            "G": temp_container[10],
+                            "SW": temp_container[11]
+                        }
+                    ]
+                )
+
+            with self._dll.phase(9, property_number, "merge"):
+                if self._data.empty:
+                    self._data = data
+                else:
+                    self._data = concat([self._data, data], ignore_index=True)
 
             self._loaded_prop.add(property_number)
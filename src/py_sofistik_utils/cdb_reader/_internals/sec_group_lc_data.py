@@ -1,15 +1,16 @@
 # standard library imports
-from copy import deepcopy
 from ctypes import byref, c_int, sizeof
 from typing import Any, Generator
 
 # third party library imports
+from numpy.typing import ArrayLike, NDArray
 from pandas import concat, DataFrame
 
 # local library specific imports
+from . group_lc_data import ELEMENT_TYPES, map_element_groups
 from . sofistik_classes import CGRP_LC
 from . sofistik_dll import SofDll
-from . sofistik_utilities import long_to_str
+from . sofistik_utilities import longs_to_str
 
 
 class _SecondaryGroupLCData:
@@ -48,6 +49,8 @@ class _SecondaryGroupLCData:
         )
         self._dll = dll
         self._loaded_lc: set[int] = set()
+        # load case -> group name -> row, see load
+        self._groups: dict[int, dict[str, list[Any]]] = {}
 
     def clear(self, load_case: int) -> None:
         """Clear the results for the given ``load_case`` number.
@@ -57,12 +60,14 @@ class _SecondaryGroupLCData:
 
         self._data = self._data.drop(self._data[self._data.LOAD_CASE == load_case].index)
         self._loaded_lc.remove(load_case)
+        self._groups.pop(load_case, None)
 
     def clear_all(self) -> None:
         """Clear all group data.
         """
         self._data = self._data[0:0]
         self._loaded_lc.clear()
+        self._groups.clear()
 
     def get_active_groups(self, load_case: int) -> list[str]:
         """For the given ``load_case``, return the list of active groups.
@@ -77,13 +82,7 @@ class _SecondaryGroupLCData:
         RuntimeError
             If the given ``load_case`` is not loaded.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        active_mask = self._data["IS_ACTIVE"] == True
-
-        return self._data.GROUP[lc_mask & active_mask].to_list()
+        return [grp for grp, row in self._get_groups(load_case).items() if row[-1]]
 
     def get_beam_id_range(self, load_case: int, group_name: str) -> range:
         """For the given ``load_case``, return a range starting from the minimum beam
@@ -105,19 +104,7 @@ class _SecondaryGroupLCData:
         RuntimeError
             If the given ``load_case`` is not loaded.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_name.upper()
-
-        if (lc_mask & grp_mask).eq(False).all():
-            return range(0)
-
-        max_id = self._data.BEAM_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.BEAM_MIN_ID[lc_mask & grp_mask].item()
-
-        return range(min_id, max_id + 1, 1)
+        return self._get_id_range(load_case, group_name, "beam")
 
     def get_cable_id_range(self, load_case: int, group_name: str) -> range:
         """For the given ``load_case``, return a range starting from the minimum cable
@@ -139,24 +126,12 @@ class _SecondaryGroupLCData:
         RuntimeError
             If the given ``load_case`` is not loaded.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_name.upper()
-
-        if (lc_mask & grp_mask).eq(False).all():
-            return range(0)
-
-        max_id = self._data.CABLE_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.CABLE_MIN_ID[lc_mask & grp_mask].item()
-
-        return range(min_id, max_id + 1, 1)
+        return self._get_id_range(load_case, group_name, "cable")
 
     def get_quad_id_range(self, load_case: int, group_name: str) -> range:
-        """For the given ``load_case``, return a `range` starting from the minimum quad
+        """For the given ``load_case``, return a range starting from the minimum quad
         element ID to the maximum ID + 1, so that a check like
-        ``max_id in get_quad_id_range(lc, grp_nmb)`` return `True`.
+        ``max_id in get_quad_id_range(lc, grp_nmb)`` return ``True``.
 
         If no quad elements are present in the given ``load_case`` and ``group_name``:
         return ``range(0)``.
@@ -173,19 +148,7 @@ class _SecondaryGroupLCData:
         RuntimeError
             If the given ``load_case`` is not loaded.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_name.upper()
-
-        if (lc_mask & grp_mask).eq(False).all():
-            return range(0)
-
-        max_id = self._data.QUAD_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.QUAD_MIN_ID[lc_mask & grp_mask].item()
-
-        return range(min_id, max_id + 1, 1)
+        return self._get_id_range(load_case, group_name, "quad")
 
     def get_spring_id_range(self, load_case: int, group_name: str) -> range:
         """For the given ``load_case``, return a range starting from the minimum spring
@@ -207,19 +170,7 @@ class _SecondaryGroupLCData:
         RuntimeError
             If the given ``load_case`` is not loaded.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_name.upper()
-
-        if (lc_mask & grp_mask).eq(False).all():
-            return range(0)
-
-        max_id = self._data.SPRING_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.SPRING_MIN_ID[lc_mask & grp_mask].item()
-
-        return range(min_id, max_id + 1, 1)
+        return self._get_id_range(load_case, group_name, "spring")
 
     def get_truss_id_range(self, load_case: int, group_name: str) -> range:
         """For the given ``load_case``, return a range starting from the minimum truss
@@ -241,19 +192,39 @@ class _SecondaryGroupLCData:
         RuntimeError
             If the given ``load_case`` is not loaded.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_name.upper()
-
-        if (lc_mask & grp_mask).eq(False).all():
-            return range(0)
+        return self._get_id_range(load_case, group_name, "truss")
+
+    def get_element_groups(
+            self,
+            load_case: int,
+            element_ids: ArrayLike,
+            element_type: str,
+            default: str = ""
+    ) -> NDArray[Any]:
+        """For the given ``load_case``, return the active secondary group of each
+        element of ``element_ids``, or ``default`` if none.
 
-        max_id = self._data.TRUSS_MAX_ID[lc_mask & grp_mask].item()
-        min_id = self._data.TRUSS_MIN_ID[lc_mask & grp_mask].item()
+        Parameters
+        ----------
+        load_case: int
+            The load_case number
+        element_ids: ArrayLike
+            The element numbers
+        element_type: str
+            One of ``"beam"``, ``"cable"``, ``"quad"``, ``"spring"`` and ``"truss"``
+        default: str, default ""
+            Group of the elements not found in any active group
 
-        return range(min_id, max_id + 1, 1)
+        Raises
+        ------
+        LookupError
+            If the given ``element_type`` is unknown.
+        RuntimeError
+            If the given ``load_case`` is not loaded.
+        """
+        return map_element_groups(
+            self._get_groups(load_case), element_ids, element_type, default
+        )
 
     def group_is_active(self, load_case: int, group_name: str) -> bool:
         """Return ``True`` if the given ``group_name:` is active` in the given ``load_case``.
@@ -271,17 +242,13 @@ class _SecondaryGroupLCData:
         RuntimeError
             If the given ``load_case`` is not loaded.
         """
-        if load_case not in self._loaded_lc:
-            raise RuntimeError(f"Load case {load_case} not found!")
-
-        lc_mask = self._data["LOAD_CASE"] == load_case
-        grp_mask = self._data["GROUP"] == group_name.upper()
+        row = self._get_groups(load_case).get(group_name.upper())
 
-        if (lc_mask & grp_mask).eq(False).all():
+        if row is None:
             err_msg = f"Group {group_name:} not found in load case {load_case}!"
             raise RuntimeError(err_msg)
 
-        return bool(self._data.IS_ACTIVE[lc_mask & grp_mask].item())
+        return bool(row[-1])
 
     def iterator_beam(self, load_case: int) -> Generator[tuple[str, range], None, None]:
         """Yield a tuple containing the group number and the beam ID range for the given
@@ -328,100 +295,121 @@ class _SecondaryGroupLCData:
 
             self.clear(load_case)
 
-            temp_container: list[list[Any]] = []
+            # encoded group name -> row
+            temp_container: dict[int, list[Any]] = {}
             count = 0
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    11,
-                    load_case,
-                    byref(g_data),
-                    byref(rec_length),
-                    0 if count == 0 else 1
-                )
-
-                rec_length = c_int(sizeof(g_data))
-                count += 1
-
-                if return_value.value >= 2:
-                    break
-
-                if g_data.m_ng <= 999:
-                    continue
-
-                temp_list: list[Any] = [0 for _ in range(18)]
-                grp_name = long_to_str(g_data.m_ng)
-
-                # dummy addition to avoid IndexError in the next if statement
-                if not temp_container:
-                    temp_container.append(deepcopy(temp_list))
-
-                if grp_name != temp_container[-1][1]:
-                    temp_list[0] = load_case
-                    temp_list[1] = grp_name
-                    temp_list[-1] = (2 & g_data.m_inf) > 0
-                    temp_container.append(deepcopy(temp_list))
-
-                match g_data.m_typ:
-                    case 100:
-                        type_index = 2
-                    case 150:
-                        type_index = 5
-                    case 160:
-                        type_index = 8
-                    case 170:
-                        type_index = 11
-                    case 200:
-                        type_index = 14
-                    case _:
+            with self._dll.phase(11, load_case, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        11,
+                        load_case,
+                        byref(g_data),
+                        byref(rec_length),
+                        0 if count == 0 else 1
+                    )
+
+                    rec_length = c_int(sizeof(g_data))
+                    count += 1
+
+                    if return_value.value >= 2:
+                        break
+
+                    if g_data.m_ng <= 999:
                         continue
 
-                grp_index = [_[1] for _ in temp_container].index(grp_name)
-
-                if (temp_container[grp_index][type_index + 0] == 0 or
-                    g_data.m_min < temp_container[grp_index][type_index + 0]
-                ):
-                    temp_container[grp_index][type_index + 0] = g_data.m_min
-
-                if g_data.m_max > temp_container[grp_index][type_index + 1]:
-                    temp_container[grp_index][type_index + 1] = g_data.m_max
-
-                temp_container[grp_index][type_index + 2] = g_data.m_num
+                    # the encoded name is decoded at once in the frame phase
+                    grp_name = g_data.m_ng
+                    grp_list = temp_container.get(grp_name)
+
+                    if grp_list is None:
+                        grp_list = [0 for _ in range(18)]
+                        grp_list[0] = load_case
+                        grp_list[1] = grp_name
+                        grp_list[-1] = (2 & g_data.m_inf) > 0
+                        temp_container[grp_name] = grp_list
+
+                    match g_data.m_typ:
+                        case 100:
+                            type_index = 2
+                        case 150:
+                            type_index = 5
+                        case 160:
+                            type_index = 8
+                        case 170:
+                            type_index = 11
+                        case 200:
+                            type_index = 14
+                        case _:
+                            continue
+
+                    if (grp_list[type_index + 0] == 0 or
+                        g_data.m_min < grp_list[type_index + 0]
+                    ):
+                        grp_list[type_index + 0] = g_data.m_min
+
+                    if g_data.m_max > grp_list[type_index + 1]:
+                        grp_list[type_index + 1] = g_data.m_max
+
+                    grp_list[type_index + 2] = g_data.m_num
 
             # manage case that there are no secondary group data for this load case
             if not temp_container:
                 return
 
-            # remove the dummy addition on line 400
-            del temp_container[0]
-
             # preparing data for conversion to a pandas DataFrame
-            conv_data: list[dict[str, Any]] = []
-            for item in temp_container:
-                conv_data.append({"LOAD_CASE":          item[0],
-                                  "GROUP":              item[1],
-                                  "BEAM_MIN_ID":        item[2],
-                                  "BEAM_MAX_ID":        item[3],
-                                  "NUMBER_OF_BEAMS":    item[4],
-                                  "TRUSS_MIN_ID":       item[5],
-                                  "TRUSS_MAX_ID":       item[6],
-                                  "NUMBER_OF_TRUSSES":  item[7],
-                                  "CABLE_MIN_ID":       item[8],
-                                  "CABLE_MAX_ID":       item[9],
-                                  "NUMBER_OF_CABLES":   item[10],
-                                  "SPRING_MIN_ID":      item[11],
-                                  "SPRING_MAX_ID":      item[12],
-                                  "NUMBER_OF_SPRINGS":  item[13],
-                                  "QUAD_MIN_ID":        item[14],
-                                  "QUAD_MAX_ID":        item[15],
-                                  "NUMBER_OF_QUADS":     item[16],
-                                  "IS_ACTIVE":          item[17]})
-
-            if self._data.empty:
-                self._data = DataFrame(conv_data)
-            else:
-                self._data = concat(
-                    [self._data, DataFrame(conv_data)],
-                    ignore_index=True
-                )
+            with self._dll.phase(11, load_case, "frame"):
+                names = longs_to_str(list(temp_container))
+                for item, name in zip(temp_container.values(), names):
+                    item[1] = name
+
+                conv_data: list[dict[str, Any]] = []
+                for item in temp_container.values():
+                    conv_data.append({"LOAD_CASE":          item[0],
+                                      "GROUP":              item[1],
+                                      "BEAM_MIN_ID":        item[2],
+                                      "BEAM_MAX_ID":        item[3],
+                                      "NUMBER_OF_BEAMS":    item[4],
+                                      "TRUSS_MIN_ID":       item[5],
+                                      "TRUSS_MAX_ID":       item[6],
+                                      "NUMBER_OF_TRUSSES":  item[7],
+                                      "CABLE_MIN_ID":       item[8],
+                                      "CABLE_MAX_ID":       item[9],
+                                      "NUMBER_OF_CABLES":   item[10],
+                                      "SPRING_MIN_ID":      item[11],
+                                      "SPRING_MAX_ID":      item[12],
+                                      "NUMBER_OF_SPRINGS":  item[13],
+                                      "QUAD_MIN_ID":        item[14],
+                                      "QUAD_MAX_ID":        item[15],
+                                      "NUMBER_OF_QUADS":     item[16],
+                                      "IS_ACTIVE":          item[17]})
+
+            with self._dll.phase(11, load_case, "merge"):
+                if self._data.empty:
+                    self._data = DataFrame(conv_data)
+                else:
+                    self._data = concat(
+                        [self._data, DataFrame(conv_data)],
+                        ignore_index=True
+                    )
+            self._groups[load_case] = {_[1]: _ for _ in temp_container.values()}
             self._loaded_lc.add(load_case)
+
+    def _get_groups(self, load_case: int) -> dict[str, list[Any]]:
+        """Return the lookup table ``group -> row`` of ``load_case``.
+        """
+        try:
+            return self._groups[load_case]
+        except KeyError:
+            raise RuntimeError(f"Load case {load_case} not found!") from None
+
+    def _get_id_range(self, load_case: int, group_name: str, element_type: str) -> range:
+        """Return the ID range of the ``element_type`` elements of ``group_name``.
+        """
+        row = self._get_groups(load_case).get(group_name.upper())
+
+        if row is None:
+            return range(0)
+
+        index = ELEMENT_TYPES[element_type]
+        return range(row[index], row[index + 1] + 1, 1)
@@ -6,19 +6,52 @@ The `_SofDll` class load the SOFiSTiK dll `sof_cdb_w-202X.dll` and store as memb
 variables some of the function provided by SOFiSTiK to read and write cdb files.
 
 Writing to a cdb is currently not supported.
+
+Loaded dll handles are kept in a process-wide registry keyed by dll folder and version, so
+that readers opening many CDB files one after the other load each dll only once. The
+file-system checks of successfully loaded folders are cached as well.
+
+Each instance keeps the index returned by ``sof_cdb_init`` for its CDB file and passes it
+to the dll, so that several CDB files can stay open at once through different instances,
+e.g. one per reader for side-by-side comparisons.
 """
 # standard library imports
-from ctypes import CDLL, cdll
+from contextlib import contextmanager
+from ctypes import byref, CDLL, cdll, c_int, create_string_buffer
 import os
 from pathlib import Path
-from typing import Callable
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Generator
 
 # third party library imports
 
 # local library specific imports
+from .. hooks import LoadHook
+from . instrumentation import _Instrumentation
 from . sofistik_utilities import decode_cdb_status
 
 
+# (dll folder, dll name) -> loaded dll, shared by all the SofDll instances
+_DLL_HANDLES: dict[tuple[str, str], CDLL] = {}
+_DLL_HANDLES_LOCK = Lock()
+
+# folders and files found by _check_folder and _check_files
+_CHECKED_PATHS: set[Path] = set()
+
+# id of a loaded dll -> index of the CDB file it opened last
+_LAST_OPENED: dict[int, int] = {}
+
+
+def clear_dll_cache() -> None:
+    """Forget the loaded dll handles and the cached file-system checks. The dlls
+    are not unloaded: instances initialized afterwards load them again.
+    """
+    with _DLL_HANDLES_LOCK:
+        _DLL_HANDLES.clear()
+        _CHECKED_PATHS.clear()
+
+
 class SofDll():
     """The `_SofDll` class load the SOFiSTiK dll `sof_cdb_w-202X.dll` and store as member
     variables some of the function provided by SOFiSTiK to read cdb files.
@@ -27,48 +60,87 @@ class SofDll():
         """The initializer of the `SofDll` class.
         """
         self._dll: CDLL
+        self._get: Callable[..., int]
         self.get: Callable[..., int]
+        self.to_string: Callable[..., None]
+
+        self.instrumentation = _Instrumentation()
+        self._hooks: list[LoadHook] = []
+        # records read so far for the key whose "read" phase is running
+        self._hook_records = 0
+        self._hook_start = 0.0
 
         self._echo_level = echo_level
+        # index of the open CDB file, 0 when no file is open
+        self._index = 0
+        self._is_initialized = False
         self._path: str = dll_folder if self._check_folder(dll_folder) else ""
         self._version: str = self._check_version(version)
 
+    def add_hook(self, hook: LoadHook) -> None:
+        """Register ``hook``, which is then notified by every load. Registering
+        the same hook twice has no effect.
+        """
+        if hook not in self._hooks:
+            self._hooks.append(hook)
+            self._bind_get()
+
     def close(self) -> None:
-        """Close the CDB database.
+        """Close the CDB database. Nothing is done when no file is open: the dll
+        closes all the files of the process on ``sof_cdb_close(0)``, including those
+        opened by other instances.
         """
-        self._dll.sof_cdb_close(0)
+        if self._index == 0:
+            return
 
-        if self._dll.sof_cdb_status(1) == 0:
-            print("CDB file has been successfully closed.")
+        self._dll.sof_cdb_close(self._index)
+
+        if self._dll.sof_cdb_status(self._index) == 0:
+            # the file opened last is closed: sof_cdb_kexist no longer applies to the
+            # files still open, which are probed instead
+            if _LAST_OPENED.get(id(self._dll)) == self._index:
+                _LAST_OPENED[id(self._dll)] = 0
+            self._index = 0
+            if self._echo_level > 0:
+                print("CDB file has been successfully closed.")
             return
 
         raise RuntimeError("Unknown error while closing cdb file!")
 
     def load_dll(self) -> bool:
         """Checks if all the required required SOFiSTiK dynamic libraries are present and
-        loads the main SOFiSTiK dll.
+        loads the main SOFiSTiK dll, unless it has already been loaded by another
+        instance with the same folder and version.
         Returns `True` on success.
         """
-        if not self._check_folder(self._path):
-            raise RuntimeError()
-            return False
+        key = (str(Path(self._path).resolve()), self._version)
+        with _DLL_HANDLES_LOCK:
+            if key in _DLL_HANDLES:
+                self._dll = _DLL_HANDLES[key]
+                return True
+
+            if not self._check_folder(self._path):
+                raise RuntimeError()
+                return False
 
-        if not self._check_files(self._path, ["libmmd.dll", "libifcoremd.dll"]):
-            raise RuntimeError()
-            return False
+            if not self._check_files(self._path, ["libmmd.dll", "libifcoremd.dll"]):
+                raise RuntimeError()
+                return False
 
-        if not self._check_files(self._path, [self._version]):
-            raise RuntimeError()
-            return False
-        print("\n")
-        try:
-            with os.add_dll_directory(self._path):
-                print("Library loaded successfully!")
-                self._dll = cdll.LoadLibrary(self._version)
+            if not self._check_files(self._path, [self._version]):
+                raise RuntimeError()
+                return False
+            print("\n")
+            try:
+                with os.add_dll_directory(self._path):
+                    print("Library loaded successfully!")
+                    self._dll = cdll.LoadLibrary(self._version)
+
+            except: # OSError as e:
+                print(f"Failed to load library: {1}")
+                raise RuntimeError
 
-        except: # OSError as e:
-            print(f"Failed to load library: {1}")
-            raise RuntimeError
+            _DLL_HANDLES[key] = self._dll
 
         return True
 
@@ -77,17 +149,65 @@ class SofDll():
         """
         return self._echo_level
 
-    def initialize(self) -> None:
+    def get_keys(self, kwh: int | None = None) -> list[tuple[int, int]]:
+        """Return the keys ``(kwh, kwl)`` of the open CDB file, in the order of
+        ``sof_cdb_kenq_ex``, restricted to the given ``kwh`` if any. Keys are
+        enumerated from the CDB index, without probing them one by one.
+        """
+        key_high = c_int(0)
+        key_low = c_int(0)
+        keys: list[tuple[int, int]] = []
+
+        # request 0 returns the first key, request 1 the key following kwh/kwl
+        request = 0
+        while self._dll.sof_cdb_kenq_ex(
+            self._index, byref(key_high), byref(key_low), request
+        ) == 0:
+            if kwh is None or key_high.value == kwh:
+                keys.append((key_high.value, key_low.value))
+            request = 1
+
+        return keys
+
+    @property
+    def index(self) -> int:
+        """The index of the open CDB file, to be passed to ``get``. It is 0 when
+        no file is open.
         """
+        return self._index
+
+    def initialize(self) -> None:
+        """Load the SOFiSTiK dll and bind the functions used to read cdb files. Calling
+        this method on an already initialized instance has no effect.
         """
+        if self._is_initialized:
+            return
+
         self.load_dll()
 
-        self.get = self._dll.sof_cdb_get
+        self._get = self._dll.sof_cdb_get
+        self.to_string = self._dll.sof_lib_ps2cs
+        self._is_initialized = True
+        self._bind_get()
+
+    def is_initialized(self) -> bool:
+        """Return `True` if the SOFiSTiK dll has already been loaded.
+        """
+        return self._is_initialized
 
     def key_exist(self, kwh: int, kwl: int) -> bool:
         """Return `True` if the key exists and contains data, `False` otherwise.
+
+        ``sof_cdb_kexist`` applies to the CDB file opened last. When another
+        file has been opened since, the key is probed with ``sof_cdb_get``
+        instead.
         """
-        match self._dll.sof_cdb_kexist(kwh, kwl):
+        if _LAST_OPENED.get(id(self._dll), self._index) == self._index:
+            status = self._dll.sof_cdb_kexist(kwh, kwl)
+        else:
+            status = self._probe_key(kwh, kwl)
+
+        match status:
             case 0:
                 if self._echo_level > 0:
                     print(f"Key {kwh}/{kwl} does not exist!")
@@ -119,33 +239,187 @@ class SofDll():
         if not os.path.isfile(file_full_name):
             raise RuntimeError(f"\"{file_full_name}\" is NOT an existing regular file!")
 
-        self._dll.sof_cdb_init(file_full_name.encode("UTF-8"), mode)
+        self._open(file_full_name, mode)
+
+    def phase(self, kwh: int, kwl: int, name: str) -> ContextManager[Any]:
+        """Return a context manager timing the phase ``name`` (one of ``"read"``,
+        ``"group"``, ``"frame"`` and ``"merge"``) of the load of key ``kwh/kwl``.
+        It does nothing unless the instrumentation is enabled or hooks are
+        registered, in which case the ``"read"`` phase also notifies the hooks.
+        """
+        if name == "read" and self._hooks:
+            return self._hooked_read(kwh, kwl)
+
+        return self.instrumentation.phase(kwh, kwl, name)
+
+    def remove_hook(self, hook: LoadHook) -> None:
+        """Unregister ``hook``.
+
+        Raises
+        ------
+        LookupError
+            If ``hook`` is not registered.
+        """
+        try:
+            self._hooks.remove(hook)
+        except ValueError as e:
+            raise LookupError("Hook not registered!") from e
+
+        self._bind_get()
+
+    def set_echo_level(self, echo_level: int) -> None:
+        """Set the `echo_level` for this instance of `SofDll`.
+        """
+        self._echo_level = echo_level
+
+    def set_instrumentation(self, enabled: bool, memory: bool = False) -> None:
+        """Enable or disable the collection of extraction statistics, including
+        the memory profiling if ``memory`` is `True`.
+        """
+        self.instrumentation.set_enabled(enabled, memory)
+        self._bind_get()
+
+    def _bind_get(self) -> None:
+        """Bind `get` to the raw `sof_cdb_get`, or to its instrumented wrapper when
+        statistics are collected or hooks are registered.
+        """
+        if not self._is_initialized:
+            return
+
+        if self.instrumentation.is_enabled() or self._hooks:
+            self.get = self._instrumented_get
+        else:
+            self.get = self._get
+
+    def _instrumented_get(
+            self,
+            index: int,
+            kwh: int,
+            kwl: int,
+            data: Any,
+            record_length: Any,
+            pos: int
+    ) -> int:
+        """Call `sof_cdb_get`, record its statistics and notify the hooks.
+        """
+        start = perf_counter()
+        return_value: int = self._get(index, kwh, kwl, data, record_length, pos)
+        elapsed = perf_counter() - start
+
+        if self.instrumentation.is_enabled():
+            self.instrumentation.add_get(
+                kwh,
+                kwl,
+                return_value,
+                record_length._obj.value,
+                elapsed
+            )
+
+        if self._hooks and return_value < 2:
+            self._hook_records += 1
+            for hook in self._hooks:
+                if self._hook_records % hook.batch_size == 0:
+                    hook.on_batch(
+                        kwh,
+                        kwl,
+                        self._hook_records,
+                        perf_counter() - self._hook_start
+                    )
+
+        return return_value
+
+    @contextmanager
+    def _hooked_read(self, kwh: int, kwl: int) -> Generator[None, None, None]:
+        """Time the ``"read"`` phase of key ``kwh/kwl`` and notify the hooks.
+        """
+        # keys read while reading another key (if any) have their own counters
+        outer_state = self._hook_records, self._hook_start
+        self._hook_records = 0
+        self._hook_start = perf_counter()
+        try:
+            for hook in self._hooks:
+                hook.on_start(kwh, kwl)
+
+            with self.instrumentation.phase(kwh, kwl, "read"):
+                yield
+
+            for hook in self._hooks:
+                hook.on_end(
+                    kwh,
+                    kwl,
+                    self._hook_records,
+                    perf_counter() - self._hook_start
+                )
 
-        if self._dll.sof_cdb_status(1) > 0:
+        finally:
+            self._hook_records, self._hook_start = outer_state
+
+    def _open(self, file_full_name: str, mode: int) -> None:
+        """Open the cdb file through ``sof_cdb_init`` and keep its index.
+        """
+        index = self._dll.sof_cdb_init(file_full_name.encode("UTF-8"), mode)
+
+        if index > 0 and self._dll.sof_cdb_status(index) > 0:
+            self._index = index
+            _LAST_OPENED[id(self._dll)] = index
             if self._echo_level > 0:
                 print(f"CDB \"{file_full_name}\" successfully opened.")
-                print(decode_cdb_status(self._dll.sof_cdb_status(1)))
+                print(decode_cdb_status(self._dll.sof_cdb_status(index)))
 
             return
 
         raise RuntimeError(f"Unknown error while opening \"{file_full_name}\"!")
 
-    def set_echo_level(self, echo_level: int) -> None:
-        """Set the `echo_level` for this instance of `SofDll`.
+    def _probe_key(self, kwh: int, kwl: int) -> int:
+        """Return the ``sof_cdb_kexist`` status of key ``kwh/kwl`` of the open CDB
+        file by reading its first record: 0 if the key does not exist, 1 if it
+        is empty and 2 if it contains data.
         """
-        self._echo_level = echo_level
+        buffer = create_string_buffer(64)
+        record_length = c_int(64)
+        match self._dll.sof_cdb_get(
+            self._index,
+            kwh,
+            kwl,
+            byref(buffer),
+            byref(record_length),
+            0
+        ):
+            case 0 | 1:
+                return 2
+            case 2:
+                return 1
+            case _:
+                return 0
 
     @staticmethod
     def _check_files(path_to_dll: str, files: list[str]) -> bool:
         """Returns `True` if all the listed files are found in the provided folder.
+        Files found once are not checked again.
         """
-        return all((Path(path_to_dll) / _).is_file() for _ in files)
+        for file in files:
+            path = Path(path_to_dll) / file
+            if path not in _CHECKED_PATHS:
+                if not path.is_file():
+                    return False
+                _CHECKED_PATHS.add(path)
+
+        return True
 
     @staticmethod
     def _check_folder(path_to_dll: str) -> bool:
-        """Returns `True` if the provided path is a valid folder.
+        """Returns `True` if the provided path is a valid folder. Folders found once
+        are not checked again.
         """
-        return Path(path_to_dll).is_dir()
+        path = Path(path_to_dll)
+        if path in _CHECKED_PATHS:
+            return True
+
+        if path.is_dir():
+            _CHECKED_PATHS.add(path)
+            return True
+
+        return False
 
     @staticmethod
     def _check_version(version: int) -> str:
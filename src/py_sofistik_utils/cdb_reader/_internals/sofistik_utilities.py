@@ -6,8 +6,13 @@ The `SOFiSTiKUtilities` module provides functions and helpers to be used that ca
 across all the classes and modules.
 """
 # standard library imports
+from typing import TYPE_CHECKING
 
 # third party library imports
+if TYPE_CHECKING:
+    from numpy import object_
+    from numpy.typing import ArrayLike, NDArray
+    from pandas import Categorical
 
 # local library specific imports
 
@@ -43,8 +48,8 @@ def decode_cdb_status(status: int) -> str:
 
     return value[value.find("\n") + 1:]
 
-def decode_beam_end_release(itp2: int) -> str:
-    """Decode the beam end release conditions for the given beam end.
+def _decode_beam_end_release(itp2: int) -> str:
+    """Decode the beam end release conditions for the given beam end, bit by bit.
 
     Parameters
     ----------
@@ -76,8 +81,37 @@ def decode_beam_end_release(itp2: int) -> str:
 
     return value
 
-def decode_nodal_boundary_condition(kfix: int) -> str:
-    """Decode the nodal boundary conditions.
+# released force or moment -> bit of itp2
+BEAM_END_RELEASES = {"N": 1, "VY": 2, "VZ": 4, "MT": 8, "MY": 16, "MZ": 32, "MB": 64}
+
+# itp2 & 127 -> beam end release
+_BEAM_END_RELEASES = tuple(_decode_beam_end_release(_) for _ in range(128))
+
+def decode_beam_end_release(itp2: int) -> str:
+    """Decode the beam end release conditions for the given beam end, see
+    :func:`decode_beam_end_releases`.
+
+    Parameters
+    ----------
+    itp2: int
+        Beam end release condition as obtained from key 100/00.
+    """
+    return _BEAM_END_RELEASES[itp2 & 127]
+
+def decode_beam_end_releases(itp2: "ArrayLike") -> "NDArray[object_]":
+    """Decode the release conditions of many beam ends at once with a lookup table.
+
+    Parameters
+    ----------
+    itp2: ArrayLike
+        Beam end release conditions as obtained from key 100/00.
+    """
+    from numpy import array, asarray, object_
+
+    return array(_BEAM_END_RELEASES, dtype=object_)[asarray(itp2) & 127]
+
+def _decode_nodal_boundary_condition(kfix: int) -> str:
+    """Decode the nodal boundary conditions, bit by bit.
 
     This function is basically the one provided in the SOFiSTiK online documentation, with
     minor modifications to reflect latest changes in Python. Refer to:
@@ -128,6 +162,42 @@ def decode_nodal_boundary_condition(kfix: int) -> str:
 
     return value
 
+# degree of freedom -> bit of kfix, set if the degree of freedom is free
+NODAL_DEGREES_OF_FREEDOM = {"PX": 1, "PY": 2, "PZ": 4, "MX": 8, "MY": 16, "MZ": 32}
+
+# kfix & 63 -> boundary condition. Bit 64 and higher bits do not change the decoded value.
+_NODAL_BOUNDARY_CONDITIONS = tuple(_decode_nodal_boundary_condition(_) for _ in range(64))
+
+def decode_nodal_boundary_condition(kfix: int) -> str:
+    """Decode the nodal boundary conditions, see
+    :func:`decode_nodal_boundary_conditions`.
+
+    Parameters
+    ----------
+    kfix: int
+        Nodal degrees of freedom as obtained from key 20/00.
+    """
+    return _NODAL_BOUNDARY_CONDITIONS[kfix & 63]
+
+def decode_nodal_boundary_conditions(kfix: "ArrayLike") -> "Categorical":
+    """Decode the nodal boundary conditions of many nodes at once with a lookup table.
+
+    The codes of the returned :class:`pandas.Categorical` are ``kfix & 63``, i.e. the
+    bits of the free degrees of freedom, see ``NODAL_DEGREES_OF_FREEDOM``.
+
+    Parameters
+    ----------
+    kfix: ArrayLike
+        Nodal degrees of freedom as obtained from key 20/00.
+    """
+    from numpy import asarray, int8
+    from pandas import Categorical
+
+    return Categorical.from_codes(
+        (asarray(kfix) & 63).astype(int8),
+        categories=_NODAL_BOUNDARY_CONDITIONS
+    )
+
 def get_element_type(element_code: int) -> str:
     """Return the element type according to SOFiSTiK nomenclature.
     Refer to section 018/-2 in SOFiHELP - CDBase.
@@ -180,3 +250,28 @@ def long_to_str(long: int) -> str:
         decode += chr(part_1)
 
     return decode
+
+def longs_to_str(longs: "ArrayLike") -> "NDArray[object_]":
+    """Convert many `int` to `str` at once, see :func:`long_to_str`.
+
+    Each value is reinterpreted as 4 little-endian bytes and the zero bytes are dropped.
+    The values along the last axis of a 2D array are joined into a single `str`, e.g.
+    the 17 values of a group name.
+    """
+    from numpy import (
+        argsort, array, ascontiguousarray, asarray, char, object_, take_along_axis, uint8
+    )
+
+    values = asarray(longs)
+    if values.size == 0:
+        return array([], dtype=object_)
+
+    buffer = values.astype("<u4").view(uint8).reshape(values.shape[0], -1)
+    # move the zero bytes to the end of each row, keeping the order of the others
+    order = argsort(buffer == 0, axis=1, kind="stable")
+    buffer = ascontiguousarray(take_along_axis(buffer, order, axis=1))
+
+    # fixed width byte strings drop their trailing zero bytes
+    names = buffer.view(f"S{buffer.shape[1]}").reshape(-1)
+    return char.decode(names, "latin-1").astype(object_)  # type: ignore[no-any-return]
+
@@ -1,12 +1,16 @@
 # standard library imports
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 # third party library imports
 
 # local library specific imports
-from . spring_data import _SpringData
-from . spring_result import _SpringResult
 from . sofistik_dll import SofDll
 
+if TYPE_CHECKING:
+    from . spring_data import _SpringData
+    from . spring_result import _SpringResult
+
 
 class _Spring:
     """
@@ -17,9 +21,15 @@ class _Spring:
     point for reading, manipulating and evaluating spring definitions, applied
     loads, and analysis results.
     """
-    data: _SpringData
-    result: _SpringResult
-
     def __init__(self, dll: SofDll) -> None:
-        self.data = _SpringData(dll)
-        self.result = _SpringResult(dll)
+        self._dll = dll
+
+    @cached_property
+    def data(self) -> "_SpringData":
+        from . spring_data import _SpringData
+        return _SpringData(self._dll)
+
+    @cached_property
+    def result(self) -> "_SpringResult":
+        from . spring_result import _SpringResult
+        return _SpringResult(self._dll)
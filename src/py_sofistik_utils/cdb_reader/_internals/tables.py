@@ -0,0 +1,163 @@
+"""
+Tables
+------
+
+The `Tables` module maps the table names used by the batch and export tools to the
+sub-readers of a ``SOFiSTiKCDBReader`` instance, and provides uniform helpers to load and
+retrieve their data.
+"""
+# standard library imports
+from typing import Any
+
+# third party library imports
+from pandas import DataFrame
+
+# local library specific imports
+
+
+# table name -> (reader attribute, depends on load case, accepts a list of load cases)
+_TABLES: dict[str, tuple[str, bool, bool]] = {
+    "beam_data":            ("beam_geo",         False, False),
+    "beam_load":            ("beam_load",        True,  True),
+    "beam_result":          ("beam_res",         True,  False),
+    "beam_stress":          ("beam_stress",      True,  False),
+    "cable_data":           ("cable.data",       False, False),
+    "cable_load":           ("cable.load",       True,  True),
+    "cable_result":         ("cable.result",     True,  True),
+    "group_data":           ("grp_data",         False, False),
+    "group_lc_data":        ("grp_lc_data",      True,  False),
+    "node_data":            ("nodes.data",       False, False),
+    "node_residual":        ("nodes.residuals",  True,  False),
+    "node_result":          ("nodes.results",    True,  False),
+    "plate_data":           ("plate_data",       False, False),
+    "sec_group_lc_data":    ("sec_grp_lc_data",  True,  False),
+    "spring_data":          ("spring.data",      False, False),
+    "spring_result":        ("spring.result",    True,  True),
+    "truss_data":           ("truss.data",       False, False),
+    "truss_load":           ("truss.load",       True,  True),
+    "truss_result":         ("truss.result",     True,  True),
+}
+
+
+def accepts_load_case_list(table: str) -> bool:
+    """Return `True` if the given ``table`` is loaded for several load cases at
+    once.
+    """
+    check_table_name(table)
+    return _TABLES[table][2]
+
+def check_table_name(table: str) -> None:
+    """Raise a `LookupError` if ``table`` is not a known table name.
+    """
+    if table not in _TABLES:
+        raise LookupError(
+            f"Unknown table \"{table}\"! Available tables: {', '.join(_TABLES)}."
+        )
+
+def clear_table(reader: Any, table: str) -> None:
+    """Clear all the loaded data of the given ``table``.
+    """
+    obj = get_table(reader, table)
+    if is_load_case_table(table):
+        obj.clear_all()
+    else:
+        obj.clear()
+
+def get_table(reader: Any, table: str) -> Any:
+    """Return the sub-reader of ``reader`` that manages the given ``table``.
+    """
+    check_table_name(table)
+
+    obj = reader
+    for attribute in _TABLES[table][0].split("."):
+        obj = getattr(obj, attribute)
+
+    return obj
+
+def is_load_case_table(table: str) -> bool:
+    """Return `True` if the given ``table`` is stored per load case.
+    """
+    check_table_name(table)
+    return _TABLES[table][1]
+
+def load_table(
+        reader: Any,
+        table: str,
+        load_cases: int | list[int] | None = None
+) -> None:
+    """Load the given ``table`` using the sub-readers of ``reader``.
+
+    Parameters
+    ----------
+    reader : SOFiSTiKCDBReader
+        An open reader
+    table : str
+        Table name, see :func:`table_names`
+    load_cases : int | list[int] | None, default None
+        Load case numbers. Required for tables stored per load case, ignored
+        otherwise.
+
+    Raises
+    ------
+    LookupError
+        If ``table`` is unknown.
+    RuntimeError
+        If ``table`` is stored per load case and no ``load_cases`` are given.
+    """
+    obj = get_table(reader, table)
+    _, per_load_case, multi_load_case = _TABLES[table]
+
+    if not per_load_case:
+        obj.load()
+        return
+
+    if load_cases is None:
+        raise RuntimeError(f"Table \"{table}\" requires at least one load case!")
+
+    if isinstance(load_cases, int):
+        load_cases = [load_cases]
+
+    if multi_load_case:
+        obj.load(list(load_cases))
+        return
+
+    for load_case in dict.fromkeys(load_cases):
+        obj.load(load_case)
+
+def table_data(
+        reader: Any,
+        table: str,
+        columns: list[str] | None = None
+) -> DataFrame:
+    """Return a copy of the loaded ``table`` with a default integer index.
+
+    Parameters
+    ----------
+    reader : SOFiSTiKCDBReader
+        The reader holding the loaded data
+    table : str
+        Table name, see :func:`table_names`
+    columns : list[str] | None, default None
+        Columns to retrieve. All columns are returned when None.
+
+    Raises
+    ------
+    LookupError
+        If ``table`` is unknown or any of the requested ``columns`` is not found.
+    """
+    data: DataFrame = get_table(reader, table)._data
+
+    if columns is not None:
+        missing = [_ for _ in columns if _ not in data.columns]
+        if missing:
+            raise LookupError(
+                f"Columns {missing} not found in table \"{table}\"!"
+            )
+        data = data[columns]
+
+    return data.reset_index(drop=True)
+
+def table_names() -> list[str]:
+    """Return the names of all the available tables.
+    """
+    return list(_TABLES)
@@ -1,13 +1,17 @@
 # standard library imports
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 # third party library imports
 
 # local library specific imports
-from . truss_data import _TrussData
-from . truss_load import _TrussLoad
-from . truss_result import _TrussResult
 from . sofistik_dll import SofDll
 
+if TYPE_CHECKING:
+    from . truss_data import _TrussData
+    from . truss_load import _TrussLoad
+    from . truss_result import _TrussResult
+
 
 class _Truss:
     """
@@ -18,11 +22,20 @@ class _Truss:
     provides a structured entry point for reading, manipulating and evaluating
     truss definitions, applied loads, and analysis results.
     """
-    data: _TrussData
-    load: _TrussLoad
-    result: _TrussResult
-
     def __init__(self, dll: SofDll) -> None:
-        self.data = _TrussData(dll)
-        self.load = _TrussLoad(dll)
-        self.result = _TrussResult(dll)
+        self._dll = dll
+
+    @cached_property
+    def data(self) -> "_TrussData":
+        from . truss_data import _TrussData
+        return _TrussData(self._dll)
+
+    @cached_property
+    def load(self) -> "_TrussLoad":
+        from . truss_load import _TrussLoad
+        return _TrussLoad(self._dll)
+
+    @cached_property
+    def result(self) -> "_TrussResult":
+        from . truss_result import _TrussResult
+        return _TrussResult(self._dll)
@@ -136,53 +136,58 @@ class _TrussData:
 
             data: list[dict[str, float | int]] = []
             first_call = True
-            while return_value.value < 2:
-                return_value.value = self._dll.get(
-                    1,
-                    150,
-                    0,
-                    byref(truss),
-                    byref(record_length),
-                    0 if first_call else 1
-                )
-
-                record_length = c_int(sizeof(truss))
-                first_call = False
-                if return_value.value >= 2:
-                    break
-
-                data.append(
-                    {
-                        "GROUP":    0,
-                        "ELEM_ID":  truss.m_nr,
-                        "N1":       truss.m_node[0],
-                        "N2":       truss.m_node[1],
-                        "L0":       truss.m_dl,
-                        "PROPERTY": truss.m_nrq,
-                        "GAP":      truss.m_gap
-                    }
-                )
+            with self._dll.phase(150, 0, "read"):
+                while return_value.value < 2:
+                    return_value.value = self._dll.get(
+                        self._dll.index,
+                        150,
+                        0,
+                        byref(truss),
+                        byref(record_length),
+                        0 if first_call else 1
+                    )
+
+                    record_length = c_int(sizeof(truss))
+                    first_call = False
+                    if return_value.value >= 2:
+                        break
+
+                    data.append(
+                        {
+                            "GROUP":    0,
+                            "ELEM_ID":  truss.m_nr,
+                            "N1":       truss.m_node[0],
+                            "N2":       truss.m_node[1],
+                            "L0":       truss.m_dl,
+                            "PROPERTY": truss.m_nrq,
+                            "GAP":      truss.m_gap
+                        }
+                    )
+
+            with self._dll.phase(150, 0, "frame"):
+                temp_df = DataFrame(data).sort_values("ELEM_ID", kind="mergesort")
+                elem_ids = temp_df["ELEM_ID"]
 
             # assigning groups
-            group_data = _GroupData(self._dll)
-            group_data.load()
+            with self._dll.phase(150, 0, "group"):
+                group_data = _GroupData(self._dll)
+                group_data.load()
 
-            temp_df = DataFrame(data).sort_values("ELEM_ID", kind="mergesort")
-            elem_ids = temp_df["ELEM_ID"]
+                for grp, grp_range in group_data.iterator_truss():
+                    if grp_range.stop == 0:
+                        continue
 
-            for grp, grp_range in group_data.iterator_truss():
-                if grp_range.stop == 0:
-                    continue
-
-                left = elem_ids.searchsorted(grp_range.start, side="left")
-                right = elem_ids.searchsorted(grp_range.stop - 1, side="right")
-                temp_df.loc[temp_df.index[left:right], "GROUP"] = grp
+                    left = elem_ids.searchsorted(grp_range.start, side="left")
+                    right = elem_ids.searchsorted(grp_range.stop - 1, side="right")
+                    temp_df.loc[temp_df.index[left:right], "GROUP"] = grp
 
             # set indices for fast lookup
-            temp_df = temp_df.set_index(["ELEM_ID"], drop=False)
+            with self._dll.phase(150, 0, "frame"):
+                temp_df = temp_df.set_index(["ELEM_ID"], drop=False)
 
             # merge data
-            if self._data.empty:
-                self._data = temp_df
-            else:
-                self._data = concat([self._data, temp_df])
+            with self._dll.phase(150, 0, "merge"):
+                if self._data.empty:
+                    self._data = temp_df
+                else:
+                    self._data = concat([self._data, temp_df])
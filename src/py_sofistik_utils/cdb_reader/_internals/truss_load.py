@@ -162,34 +162,39 @@ class _TrussLoad:
         for load_case in load_cases:
             if self._dll.key_exist(151, load_case):
                 self.clear(load_case)
-                temp_list.extend(self._load(load_case))
+                with self._dll.phase(151, load_case, "read"):
+                    temp_list.extend(self._load(load_case))
 
-        # assigning groups
-        group_data = _GroupData(self._dll)
-        group_data.load()
+        with self._dll.phase(151, -1, "frame"):
+            temp_df = DataFrame(temp_list).sort_values("ELEM_ID", kind="mergesort")
+            elem_ids = temp_df["ELEM_ID"]
 
-        temp_df = DataFrame(temp_list).sort_values("ELEM_ID", kind="mergesort")
-        elem_ids = temp_df["ELEM_ID"]
+        # assigning groups
+        with self._dll.phase(151, -1, "group"):
+            group_data = _GroupData(self._dll)
+            group_data.load()
 
-        for grp, grp_range in group_data.iterator_truss():
-            if grp_range.stop == 0:
-                continue
+            for grp, grp_range in group_data.iterator_truss():
+                if grp_range.stop == 0:
+                    continue
 
-            left = elem_ids.searchsorted(grp_range.start, side="left")
-            right = elem_ids.searchsorted(grp_range.stop - 1, side="right")
-            temp_df.loc[temp_df.index[left:right], "GROUP"] = grp
+                left = elem_ids.searchsorted(grp_range.start, side="left")
+                right = elem_ids.searchsorted(grp_range.stop - 1, side="right")
+                temp_df.loc[temp_df.index[left:right], "GROUP"] = grp
 
         # set indices for fast lookup
-        temp_df = temp_df.set_index(
-            ["ELEM_ID", "LOAD_CASE", "TYPE"],
-            drop=False
-        )
+        with self._dll.phase(151, -1, "frame"):
+            temp_df = temp_df.set_index(
+                ["ELEM_ID", "LOAD_CASE", "TYPE"],
+                drop=False
+            )
 
         # merge data
-        if self._data.empty:
-            self._data = temp_df
-        else:
-            self._data = concat([self._data, temp_df])
+        with self._dll.phase(151, -1, "merge"):
+            if self._data.empty:
+                self._data = temp_df
+            else:
+                self._data = concat([self._data, temp_df])
         self._loaded_lc.update(load_cases)
 
     def set_echo_level(self, echo_level: int) -> None:
@@ -208,7 +213,7 @@ class _TrussLoad:
         first_call = True
         while return_value.value < 2:
             return_value.value = self._dll.get(
-                1,
+                self._dll.index,
                 151,
                 load_case,
                 byref(trus),
@@ -0,0 +1,248 @@
+"""
+Batch extraction
+----------------
+
+The ``batch_extract`` function distributes many CDB files over a pool of worker processes
+and merges the extracted tables into a single :class:`pandas.DataFrame` per table, tagged
+by CDB name.
+
+Each worker loads the SOFiSTiK dll once, then opens its CDB files one after the other and
+runs the same :class:`ExtractionPlan` on each of them. The ``init_worker``,
+``get_worker_dll`` and ``load_dll`` helpers manage this dll and are shared with the
+``sofistik-extract`` command.
+"""
+# standard library imports
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from os import cpu_count, sep
+from pathlib import Path
+
+# third party library imports
+from pandas import concat, DataFrame, read_pickle
+
+# local library specific imports
+from . _internals.sofistik_dll import SofDll
+from . _internals.tables import check_table_name, is_load_case_table
+from . reader import SOFiSTiKCDBReader
+
+
+class ExtractionPlan:
+    """Declarative description of the data extracted from each CDB file by
+    :func:`batch_extract`.
+
+    Parameters
+    ----------
+    tables : str | list[str]
+        Table names, e.g. ``"node_data"`` or ``"cable_result"``. Refer to
+        :meth:`SOFiSTiKCDBReader.load_table` for the available tables.
+    load_cases : int | list[int] | None, default None
+        Load case numbers used for the tables stored per load case
+    columns : dict[str, list[str]] | None, default None
+        Optional column projection for each table. Tables not listed here are
+        extracted with all their columns.
+
+    Raises
+    ------
+    LookupError
+        If any table name is unknown.
+    RuntimeError
+        If a table stored per load case is requested without ``load_cases``.
+    """
+    def __init__(
+            self,
+            tables: str | list[str],
+            load_cases: int | list[int] | None = None,
+            columns: dict[str, list[str]] | None = None
+    ) -> None:
+        if isinstance(tables, str):
+            tables = [tables]
+        if isinstance(load_cases, int):
+            load_cases = [load_cases]
+
+        self.tables: list[str] = list(dict.fromkeys(tables))
+        self.load_cases: list[int] | None = (
+            None if load_cases is None else list(dict.fromkeys(load_cases))
+        )
+        self.columns: dict[str, list[str]] = dict(columns or {})
+
+        for table in self.tables + list(self.columns):
+            check_table_name(table)
+
+        for table in self.tables:
+            if is_load_case_table(table) and not self.load_cases:
+                raise RuntimeError(
+                    f"Table \"{table}\" requires at least one load case!"
+                )
+
+    def run(self, reader: SOFiSTiKCDBReader) -> dict[str, DataFrame]:
+        """Load all the planned tables with the given open ``reader`` and return
+        them, projected on the requested columns.
+        """
+        data: dict[str, DataFrame] = {}
+        for table in self.tables:
+            reader.load_table(table, self.load_cases)
+            data[table] = reader.table_data(table, self.columns.get(table))
+
+        return data
+
+
+# dll shared by all the CDB files processed by the same worker process
+_WORKER_DLL: SofDll | None = None
+
+
+def batch_extract(
+        cdb_files: list[str],
+        plan: ExtractionPlan,
+        path_to_dlls: str,
+        version: int = 2023,
+        max_workers: int | None = None,
+        cache_dir: str | None = None
+) -> dict[str, DataFrame]:
+    """Run ``plan`` on each of the given ``cdb_files`` using a pool of worker
+    processes and return one :class:`pandas.DataFrame` per planned table.
+
+    Each returned ``DataFrame`` has a leading ``CDB`` column holding the CDB
+    file name (without extension) the rows were extracted from. Rows are
+    ordered as ``cdb_files``, regardless of the order in which the workers
+    complete.
+
+    Parameters
+    ----------
+    cdb_files : list[str]
+        Paths to the CDB files, including the ``.cdb`` extension
+    plan : ExtractionPlan
+        Tables, load cases and columns to extract from each file
+    path_to_dlls : str
+        Folder containing the SOFiSTiK dlls
+    version : int, default 2023
+        SOFiSTiK version
+    max_workers : int | None, default None
+        Number of worker processes, defaults to the number of CPUs. With
+        ``max_workers=1`` all the files are processed in the calling process.
+    cache_dir : str | None, default None
+        When given, workers write their results to pickle files in this folder
+        and send back only the file paths, keeping the inter-process traffic
+        small for large tables.
+
+    Raises
+    ------
+    RuntimeError
+        If two CDB files share the same name, or if a worker fails. In the
+        latter case the original exception is chained.
+    """
+    names = [Path(_).stem for _ in cdb_files]
+    if len(set(names)) != len(names):
+        raise RuntimeError("CDB files must have unique names!")
+
+    if cache_dir is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(cdb_files)))
+
+    results: dict[str, dict[str, DataFrame | str]] = {}
+    if max_workers == 1:
+        # a dll of its own, leaving the worker dll of the calling process untouched
+        dll = load_dll(path_to_dlls, version)
+        for cdb_file in cdb_files:
+            name, data = _extract(cdb_file, plan, cache_dir, dll)
+            results[name] = data
+
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_worker,
+            initargs=(path_to_dlls, version)
+        ) as executor:
+            futures = {
+                executor.submit(_extract, cdb_file, plan, cache_dir): cdb_file
+                for cdb_file in cdb_files
+            }
+            for future in as_completed(futures):
+                try:
+                    name, data = future.result()
+                except Exception as e:
+                    raise RuntimeError(
+                        f"Extraction failed for \"{futures[future]}\"!"
+                    ) from e
+                results[name] = data
+
+    # merge data, following the order of cdb_files
+    merged: dict[str, DataFrame] = {}
+    for table in plan.tables:
+        frames: list[DataFrame] = []
+        for name in names:
+            item = results[name][table]
+            frame = read_pickle(item) if isinstance(item, str) else item
+            frame.insert(loc=0, column="CDB", value=name)
+            frames.append(frame)
+
+        merged[table] = concat(frames, ignore_index=True)
+
+    return merged
+
+
+def get_worker_dll() -> SofDll:
+    """Return the dll loaded by :func:`init_worker` in the current process.
+
+    Raises
+    ------
+    RuntimeError
+        If :func:`init_worker` has not been called in the current process.
+    """
+    if _WORKER_DLL is None:
+        raise RuntimeError("The worker dll has not been initialized!")
+
+    return _WORKER_DLL
+
+
+def init_worker(path_to_dlls: str, version: int) -> None:
+    """Load the SOFiSTiK dll once per worker process, e.g. as the ``initializer`` of a
+    :class:`concurrent.futures.ProcessPoolExecutor`. The dll is then returned by
+    :func:`get_worker_dll`.
+    """
+    global _WORKER_DLL
+
+    _WORKER_DLL = load_dll(path_to_dlls, version)
+
+
+def load_dll(path_to_dlls: str, version: int) -> SofDll:
+    """Return a new initialized SOFiSTiK dll, without echo.
+    """
+    dll = SofDll(path_to_dlls, 0, version)
+    dll.initialize()
+    return dll
+
+
+def _extract(
+        cdb_file: str,
+        plan: ExtractionPlan,
+        cache_dir: str | None,
+        dll: SofDll | None = None
+) -> tuple[str, dict[str, DataFrame | str]]:
+    """Run ``plan`` on a single CDB file with ``dll`` or, when None, with the dll of
+    the worker process.
+    """
+    path = Path(cdb_file)
+    reader = SOFiSTiKCDBReader(
+        str(path.parent) + sep,
+        path.stem,
+        "",
+        dll=get_worker_dll() if dll is None else dll
+    )
+
+    reader.open()
+    try:
+        data = plan.run(reader)
+    finally:
+        reader.close()
+
+    if cache_dir is None:
+        return path.stem, dict(data)
+
+    paths: dict[str, DataFrame | str] = {}
+    for table, frame in data.items():
+        paths[table] = str(Path(cache_dir) / f"{path.stem}.{table}.pkl")
+        frame.to_pickle(paths[table])
+
+    return path.stem, paths
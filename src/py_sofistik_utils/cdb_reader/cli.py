@@ -0,0 +1,490 @@
+"""
+Command line extractor
+----------------------
+
+The ``sofistik-extract`` console script extracts tables from one or more CDB files and
+writes them to columnar files partitioned by CDB, table and load case::
+
+    OUTPUT/<cdb name>/<table>/data.parquet         tables not stored per load case
+    OUTPUT/<cdb name>/<table>/LC=<number>.parquet  tables stored per load case
+
+Example::
+
+    sofistik-extract model.cdb --dlls C:/sofistik/dlls --version 2025 \\
+        --tables node_result cable_result --load-cases 1-100,1000 \\
+        --columns node_result:ID,UX,UY,UZ --output results --workers 4 --resume
+
+Parquet files require ``pyarrow``, ``--format npz`` writes numpy ``.npz`` archives with
+one array per column instead, readable without pickling: text columns are stored as
+strings and array-valued columns, e.g. the stations of ``beam_data``, are stacked when
+their arrays share the same shape. Otherwise, their values are concatenated and the
+offsets of each row are stored in ``<column>_OFFSETS``, of length ``rows + 1``.
+
+Completed partitions are recorded in ``OUTPUT/manifest.json``. With ``--resume``, the
+partitions already listed there are skipped, so that an interrupted extraction restarts
+where it stopped. Each file is written under a temporary name and renamed once complete.
+"""
+# standard library imports
+from argparse import ArgumentParser
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from importlib import import_module
+from json import dumps, loads
+from os import replace, sep
+from pathlib import Path
+from typing import Any, Generator, Sequence
+
+# third party library imports
+from numpy import asarray, concatenate, cumsum, int64, ndarray, savez, stack, zeros
+from pandas import DataFrame
+
+# local library specific imports
+from . import batch
+from . _internals.sofistik_dll import SofDll
+from . _internals.tables import (
+    accepts_load_case_list,
+    check_table_name,
+    is_load_case_table
+)
+from . reader import SOFiSTiKCDBReader
+
+
+_FORMATS = ("parquet", "npz")
+
+_MANIFEST_FORMAT = 1
+
+# (table, load case or None)
+_Partition = tuple[str, int | None]
+
+
+def parse_load_cases(selector: str) -> list[int] | None:
+    """Parse a load case selector, e.g. ``"1-10,1000,2000-2005"``, into the
+    sorted list of load case numbers. Return None for ``"all"``.
+
+    Raises
+    ------
+    RuntimeError
+        If the selector is invalid.
+    """
+    if selector.strip().lower() == "all":
+        return None
+
+    load_cases: set[int] = set()
+    try:
+        for item in selector.split(","):
+            first, separator, last = item.strip().partition("-")
+            numbers = range(int(first), int(last if separator else first) + 1)
+            if not numbers:
+                raise ValueError(item)
+            load_cases.update(numbers)
+
+    except ValueError as e:
+        raise RuntimeError(f"Invalid load case selector \"{selector}\"!") from e
+
+    return sorted(load_cases)
+
+
+def run_extraction(
+        cdb_files: list[str],
+        tables: list[str],
+        output: str,
+        load_cases: list[int] | None = None,
+        columns: dict[str, list[str]] | None = None,
+        file_format: str = "parquet",
+        path_to_dlls: str = "",
+        version: int = 2023,
+        max_workers: int = 1,
+        chunk_size: int = 50,
+        resume: bool = False,
+        dll: SofDll | None = None
+) -> dict[str, Any]:
+    """Extract ``tables`` from each of the ``cdb_files`` into partitioned files
+    in the ``output`` folder and return the manifest.
+
+    Parameters
+    ----------
+    cdb_files : list[str]
+        Paths to the CDB files, including the ``.cdb`` extension
+    tables : list[str]
+        Table names, e.g. ``"node_result"``
+    output : str
+        Output folder
+    load_cases : list[int] | None, default None
+        Load cases of the tables stored per load case. When None, all the load
+        cases listed in the index of each CDB file (keys ``12/LC``) are extracted.
+    columns : dict[str, list[str]] | None, default None
+        Optional column projection for each table
+    file_format : str, default "parquet"
+        ``"parquet"`` or ``"npz"``
+    path_to_dlls : str, default ""
+        Folder containing the SOFiSTiK dlls
+    version : int, default 2023
+        SOFiSTiK version
+    max_workers : int, default 1
+        Number of worker processes. With ``max_workers=1`` all the files are
+        processed in the calling process.
+    chunk_size : int, default 50
+        Number of load cases extracted by a worker before reporting back. Each
+        chunk opens its CDB file once and loads the tables accepting several load
+        cases, e.g. ``cable_result``, with their groups once.
+    resume : bool, default False
+        Skip the partitions already recorded in the manifest
+    dll : SofDll | None, default None
+        An initialized dll used instead of ``path_to_dlls`` and ``version``,
+        e.g. a ``MemoryDll``. Requires ``max_workers=1``.
+
+    Raises
+    ------
+    LookupError
+        If any table name is unknown.
+    RuntimeError
+        If the format is not supported or its engine is not installed, if two
+        CDB files share the same name, or if an extraction fails.
+    """
+    columns = dict(columns or {})
+    for table in [*tables, *columns]:
+        check_table_name(table)
+
+    _check_format(file_format)
+
+    names = [Path(_).stem for _ in cdb_files]
+    if len(set(names)) != len(names):
+        raise RuntimeError("CDB files must have unique names!")
+
+    if dll is not None and max_workers != 1:
+        raise RuntimeError("A dll instance can only be used with max_workers=1!")
+
+    root = Path(output)
+    root.mkdir(parents=True, exist_ok=True)
+    manifest_path = root / "manifest.json"
+
+    manifest: dict[str, Any] = {"format": _MANIFEST_FORMAT, "partitions": {}}
+    if resume and manifest_path.exists():
+        manifest = loads(manifest_path.read_text(encoding="utf-8"))
+
+    # the calling process needs the dll to extract or to find the load cases
+    if dll is None and (max_workers == 1 or load_cases is None):
+        dll = batch.load_dll(path_to_dlls, version)
+
+    tasks: list[tuple[str, list[_Partition]]] = []
+    for cdb_file in cdb_files:
+        cdb_load_cases = load_cases
+        if cdb_load_cases is None and any(is_load_case_table(_) for _ in tables):
+            cdb_load_cases = _find_load_cases(cdb_file, dll)  # type: ignore[arg-type]
+
+        pending = [
+            _ for _ in _partitions(tables, cdb_load_cases or [])
+            if _partition_name(Path(cdb_file).stem, *_) not in manifest["partitions"]
+        ]
+        step = max(1, chunk_size * len(tables))
+        tasks.extend(
+            (cdb_file, pending[_:_ + step]) for _ in range(0, len(pending), step)
+        )
+
+    def record(written: dict[str, dict[str, Any]]) -> None:
+        manifest["partitions"].update(written)
+        manifest["partitions"] = dict(sorted(manifest["partitions"].items()))
+        _write_text(manifest_path, dumps(manifest, indent=2))
+
+    if max_workers == 1:
+        for cdb_file, partitions in tasks:
+            record(
+                _extract_partitions(
+                    cdb_file,
+                    partitions,
+                    columns,
+                    str(root),
+                    file_format,
+                    dll
+                )
+            )
+
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=batch.init_worker,
+            initargs=(path_to_dlls, version)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _extract_partitions,
+                    cdb_file,
+                    partitions,
+                    columns,
+                    str(root),
+                    file_format
+                ): cdb_file
+                for cdb_file, partitions in tasks
+            }
+            for future in as_completed(futures):
+                try:
+                    record(future.result())
+                except Exception as e:
+                    raise RuntimeError(
+                        f"Extraction failed for \"{futures[future]}\"!"
+                    ) from e
+
+    record({})
+    return manifest
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point of the ``sofistik-extract`` console script.
+    """
+    parser = ArgumentParser(
+        prog="sofistik-extract",
+        description="Extract tables from SOFiSTiK CDB files to columnar files."
+    )
+    parser.add_argument("cdb_files", nargs="+", help="CDB files, including extension")
+    parser.add_argument("--dlls", required=True, help="folder of the SOFiSTiK dlls")
+    parser.add_argument("--version", type=int, default=2023, help="SOFiSTiK version")
+    parser.add_argument("--tables", nargs="+", required=True, help="table names")
+    parser.add_argument(
+        "--load-cases",
+        default="all",
+        help="load case selector, e.g. \"1-10,1000\", default all"
+    )
+    parser.add_argument(
+        "--columns",
+        action="append",
+        default=[],
+        metavar="TABLE:COL1,COL2",
+        help="column projection of a table, can be repeated"
+    )
+    parser.add_argument("--output", required=True, help="output folder")
+    parser.add_argument("--format", choices=_FORMATS, default="parquet")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=50,
+        help="load cases per worker task"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip the partitions recorded in the manifest"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        columns: dict[str, list[str]] = {}
+        for item in args.columns:
+            table, _, names = item.partition(":")
+            if not names:
+                raise RuntimeError(f"Invalid column projection \"{item}\"!")
+            columns[table] = names.split(",")
+
+        manifest = run_extraction(
+            args.cdb_files,
+            args.tables,
+            args.output,
+            parse_load_cases(args.load_cases),
+            columns,
+            args.format,
+            args.dlls,
+            args.version,
+            args.workers,
+            args.chunk_size,
+            args.resume
+        )
+
+    except (LookupError, RuntimeError) as e:
+        parser.exit(1, f"sofistik-extract: error: {e}\n")
+
+    print(f"{len(manifest['partitions'])} partitions written to \"{args.output}\".")
+    return 0
+
+
+def _check_format(file_format: str) -> None:
+    """Raise a `RuntimeError` if ``file_format`` is not supported or if its
+    engine is not installed.
+    """
+    if file_format not in _FORMATS:
+        raise RuntimeError(
+            f"Unsupported format \"{file_format}\"! Available formats: "
+            f"{', '.join(_FORMATS)}."
+        )
+
+    if file_format == "parquet":
+        try:
+            import_module("pyarrow")
+        except ImportError as e:
+            raise RuntimeError(
+                "Parquet files require pyarrow: install it or use the npz format!"
+            ) from e
+
+
+def _extract_partitions(
+        cdb_file: str,
+        partitions: list[_Partition],
+        columns: dict[str, list[str]],
+        output: str,
+        file_format: str,
+        dll: SofDll | None = None
+) -> dict[str, dict[str, Any]]:
+    """Extract the given partitions of a single CDB file and return their
+    manifest entries.
+    """
+    path = Path(cdb_file)
+    reader = SOFiSTiKCDBReader(
+        str(path.parent) + sep,
+        path.stem,
+        "",
+        dll=batch.get_worker_dll() if dll is None else dll
+    )
+
+    # load cases of each table, None for the tables not stored per load case
+    load_cases: dict[str, list[int | None]] = {}
+    for table, load_case in partitions:
+        load_cases.setdefault(table, []).append(load_case)
+
+    written: dict[str, dict[str, Any]] = {}
+    reader.open()
+    try:
+        for table, table_load_cases in load_cases.items():
+            for load_case, frame in _load_frames(
+                reader, table, table_load_cases, columns.get(table)
+            ):
+                name = _partition_name(path.stem, table, load_case)
+                file = Path(output) / f"{name}.{file_format}"
+                file.parent.mkdir(parents=True, exist_ok=True)
+                _write_frame(frame, file, file_format)
+
+                written[name] = {
+                    "cdb": path.stem,
+                    "table": table,
+                    "load_case": load_case,
+                    "file": file.relative_to(output).as_posix(),
+                    "rows": len(frame)
+                }
+
+    finally:
+        reader.close()
+
+    return written
+
+
+def _find_load_cases(cdb_file: str, dll: SofDll) -> list[int]:
+    """Return the load cases stored in the given CDB file, as listed by the keys
+    ``12/LC`` of its index.
+    """
+    path = Path(cdb_file)
+    reader = SOFiSTiKCDBReader(str(path.parent) + sep, path.stem, "", dll=dll)
+
+    reader.open()
+    try:
+        return sorted({kwl for _, kwl in dll.get_keys(12) if kwl > 0})
+    finally:
+        reader.close()
+
+
+def _load_frames(
+        reader: SOFiSTiKCDBReader,
+        table: str,
+        load_cases: list[int | None],
+        columns: list[str] | None
+) -> Generator[tuple[int | None, DataFrame], None, None]:
+    """Load ``table`` and yield its frame for each of the ``load_cases``, or its
+    only frame for ``[None]``. Tables accepting several load cases are loaded at
+    once and split by ``LOAD_CASE``, the others one load case at a time.
+    """
+    if load_cases == [None] or not accepts_load_case_list(table):
+        for load_case in load_cases:
+            if load_case is None:
+                reader.load_table(table)
+            else:
+                reader.load_table(table, load_case)
+
+            frame = reader.table_data(table, columns)
+            reader.clear_table(table)
+            yield load_case, frame
+
+        return
+
+    reader.load_table(table, load_cases)  # type: ignore[arg-type]
+    selected = None if columns is None else list(dict.fromkeys(["LOAD_CASE", *columns]))
+    data = reader.table_data(table, selected)
+    reader.clear_table(table)
+
+    is_load_case = data["LOAD_CASE"].to_numpy()
+    for load_case in load_cases:
+        frame = data[is_load_case == load_case].reset_index(drop=True)
+        yield load_case, frame if columns is None else frame[columns]
+
+
+def _partition_name(cdb: str, table: str, load_case: int | None) -> str:
+    """Return the partition name, which is also its path without extension.
+    """
+    if load_case is None:
+        return f"{cdb}/{table}/data"
+
+    return f"{cdb}/{table}/LC={load_case}"
+
+
+def _partitions(tables: list[str], load_cases: list[int]) -> list[_Partition]:
+    """Return the partitions of the given tables, load case by load case.
+    """
+    partitions: list[_Partition] = [
+        (_, None) for _ in tables if not is_load_case_table(_)
+    ]
+    for load_case in load_cases:
+        partitions.extend((_, load_case) for _ in tables if is_load_case_table(_))
+
+    return partitions
+
+
+def _to_arrays(frame: DataFrame) -> dict[str, ndarray]:
+    """Return the columns of ``frame`` as arrays that can be saved without
+    pickling, see the module documentation.
+
+    Raises
+    ------
+    RuntimeError
+        If a column mixes arrays and scalars, or holds arrays of objects.
+    """
+    arrays: dict[str, ndarray] = {}
+    for column in frame.columns:
+        name = str(column)
+        values = frame[column].to_numpy()
+        if values.dtype == object:
+            cells = [asarray(_) for _ in values]
+            is_array = [_.ndim > 0 for _ in cells]
+            if not any(is_array):
+                values = values.astype(str)
+            elif not all(is_array):
+                raise RuntimeError(f"Column \"{name}\" mixes arrays and scalars!")
+            elif len({_.shape for _ in cells}) == 1:
+                values = stack(cells)
+            else:
+                offsets = zeros(len(cells) + 1, dtype=int64)
+                cumsum([_.size for _ in cells], out=offsets[1:])
+                arrays[f"{name}_OFFSETS"] = offsets
+                values = concatenate([_.ravel() for _ in cells])
+
+        if values.dtype == object:
+            raise RuntimeError(f"Column \"{name}\" cannot be written to npz files!")
+
+        arrays[name] = values
+
+    return arrays
+
+
+def _write_frame(frame: DataFrame, file: Path, file_format: str) -> None:
+    """Write ``frame`` to ``file`` through a temporary file.
+    """
+    temporary = file.with_name(file.name + ".tmp")
+    if file_format == "parquet":
+        frame.to_parquet(temporary, index=False)
+    else:
+        with open(temporary, "wb") as f:
+            savez(f, **_to_arrays(frame))
+
+    replace(temporary, file)
+
+
+def _write_text(file: Path, text: str) -> None:
+    """Write ``text`` to ``file`` through a temporary file.
+    """
+    temporary = file.with_name(file.name + ".tmp")
+    temporary.write_text(text, encoding="utf-8")
+    replace(temporary, file)
@@ -0,0 +1,269 @@
+"""
+Diff
+----
+
+The ``diff_tables`` function compares a table loaded by two readers, e.g. the results of
+two revisions of a model, and ``diff_frames`` does the same on two
+:class:`pandas.DataFrame`.
+
+Rows are aligned on their key columns (by default the ``LOAD_CASE``, ``ID``, ``ELEM_ID``
+and ``STATION`` columns found in the table and holding scalars) and all the numeric
+columns are compared at once with numpy, without any Python loop over the rows. Two
+values ``a`` and ``b`` differ when::
+
+    |b - a| > atol + rtol * max(|a|, |b|)
+
+or when only one of them is NaN.
+"""
+# standard library imports
+
+# third party library imports
+from numpy import abs as np_abs, divide, float64, isnan, maximum, zeros_like
+from pandas import concat, DataFrame, Series
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_scalar
+
+# local library specific imports
+from . reader import SOFiSTiKCDBReader
+
+
+_KEY_COLUMNS = ("LOAD_CASE", "ID", "ELEM_ID", "STATION")
+
+_DIFFERENCE_COLUMNS = ["COLUMN", "FIRST", "SECOND", "DELTA", "ABS_DELTA", "REL_DELTA"]
+
+
+class TableDiff:
+    """Result of :func:`diff_tables` and :func:`diff_frames`.
+
+    Attributes
+    ----------
+    differences : DataFrame
+        One row per key and column whose values differ, with the key columns,
+        ``GROUP`` (if found in the table), ``COLUMN``, ``FIRST``, ``SECOND``,
+        ``DELTA`` (``SECOND - FIRST``), ``ABS_DELTA`` and ``REL_DELTA``
+    summary : DataFrame
+        One row per group (if the table has a ``GROUP`` column) and column, with
+        the number of ``COMPARED`` and ``DIFFERENT`` values and the maximum
+        absolute and relative deltas ``MAX_ABS_DELTA`` and ``MAX_REL_DELTA``
+    only_first : DataFrame
+        Keys found in the first table only
+    only_second : DataFrame
+        Keys found in the second table only
+    """
+    def __init__(
+            self,
+            differences: DataFrame,
+            summary: DataFrame,
+            only_first: DataFrame,
+            only_second: DataFrame
+    ) -> None:
+        self.differences = differences
+        self.summary = summary
+        self.only_first = only_first
+        self.only_second = only_second
+
+    def has_differences(self) -> bool:
+        """Return `True` if any value differs or any key is found in one table
+        only.
+        """
+        return not (
+            self.differences.empty and self.only_first.empty and self.only_second.empty
+        )
+
+
+def diff_frames(
+        first: DataFrame,
+        second: DataFrame,
+        keys: list[str] | None = None,
+        columns: list[str] | None = None,
+        atol: float = 0.0,
+        rtol: float = 0.0
+) -> TableDiff:
+    """Compare two tables row by row, see :func:`diff_tables`.
+
+    Parameters
+    ----------
+    first, second : DataFrame
+        Tables to compare
+    keys : list[str] | None, default None
+        Columns identifying a row. When None, the ``LOAD_CASE``, ``ID``,
+        ``ELEM_ID`` and ``STATION`` columns of ``first`` holding scalars are used,
+        e.g. ``STATION`` is skipped for ``beam_data``, where it holds arrays.
+    columns : list[str] | None, default None
+        Columns to compare. When None, all the numeric columns found in both
+        tables, except the keys and ``GROUP``, are compared.
+    atol : float, default 0.0
+        Absolute tolerance
+    rtol : float, default 0.0
+        Relative tolerance
+
+    Raises
+    ------
+    LookupError
+        If any of the ``keys`` or ``columns`` is not found in both tables.
+    RuntimeError
+        If no key is given nor found, if any key holds arrays or if the keys are
+        not unique.
+    """
+    if keys is None:
+        keys = [
+            _ for _ in _KEY_COLUMNS if _ in first.columns and _is_scalar(first[_])
+        ]
+    if not keys:
+        raise RuntimeError("No key columns to align the tables!")
+
+    if columns is None:
+        columns = [
+            _ for _ in first.columns
+            if _ in second.columns
+            and _ not in keys
+            and _ != "GROUP"
+            and is_numeric_dtype(first[_])
+            and not is_bool_dtype(first[_])
+        ]
+
+    for name, table in [("first", first), ("second", second)]:
+        missing = [_ for _ in [*keys, *columns] if _ not in table.columns]
+        if missing:
+            raise LookupError(f"Columns {missing} not found in the {name} table!")
+
+        arrays = [_ for _ in keys if not _is_scalar(table[_])]
+        if arrays:
+            raise RuntimeError(f"Keys {arrays} hold arrays in the {name} table!")
+
+        if table.duplicated(keys).any():
+            raise RuntimeError(f"Keys {keys} are not unique in the {name} table!")
+
+    groups = ["GROUP"] if "GROUP" in first.columns and "GROUP" not in keys else []
+    merged = first[[*keys, *groups, *columns]].merge(
+        second[[*keys, *columns]],
+        how="outer",
+        on=keys,
+        suffixes=("_FIRST", "_SECOND"),
+        indicator=True,
+        sort=True
+    )
+
+    side = merged.pop("_merge")
+    only_first = merged.loc[side == "left_only", keys].reset_index(drop=True)
+    only_second = merged.loc[side == "right_only", keys].reset_index(drop=True)
+    aligned = merged[side == "both"]
+    labels = aligned[[*keys, *groups]]
+
+    differences: list[DataFrame] = []
+    summaries: list[DataFrame] = []
+    for column in columns:
+        a = aligned[f"{column}_FIRST"].to_numpy(dtype=float64)
+        b = aligned[f"{column}_SECOND"].to_numpy(dtype=float64)
+
+        delta = b - a
+        abs_delta = np_abs(delta)
+        scale = maximum(np_abs(a), np_abs(b))
+        rel_delta = divide(abs_delta, scale, out=zeros_like(abs_delta), where=scale > 0)
+        is_different = (abs_delta > atol + rtol * scale) | (isnan(a) != isnan(b))
+
+        if is_different.any():
+            difference = labels[is_different].reset_index(drop=True)
+            difference["COLUMN"] = column
+            difference["FIRST"] = a[is_different]
+            difference["SECOND"] = b[is_different]
+            difference["DELTA"] = delta[is_different]
+            difference["ABS_DELTA"] = abs_delta[is_different]
+            difference["REL_DELTA"] = rel_delta[is_different]
+            differences.append(difference)
+
+        statistics = DataFrame(
+            {
+                "COMPARED": 1,
+                "DIFFERENT": is_different,
+                "MAX_ABS_DELTA": abs_delta,
+                "MAX_REL_DELTA": rel_delta
+            }
+        )
+        if groups:
+            statistics["GROUP"] = aligned["GROUP"].to_numpy()
+            summary = statistics.groupby("GROUP", sort=True).agg(
+                {
+                    "COMPARED": "sum",
+                    "DIFFERENT": "sum",
+                    "MAX_ABS_DELTA": "max",
+                    "MAX_REL_DELTA": "max"
+                }
+            ).reset_index()
+        else:
+            summary = DataFrame(
+                {
+                    "COMPARED": [len(statistics)],
+                    "DIFFERENT": [int(is_different.sum())],
+                    "MAX_ABS_DELTA": [abs_delta.max(initial=0.0)],
+                    "MAX_REL_DELTA": [rel_delta.max(initial=0.0)]
+                }
+            )
+        summary.insert(len(groups), "COLUMN", column)
+        summaries.append(summary)
+
+    difference_columns = [*keys, *groups, *_DIFFERENCE_COLUMNS]
+    summary_columns = [
+        *groups, "COLUMN", "COMPARED", "DIFFERENT", "MAX_ABS_DELTA", "MAX_REL_DELTA"
+    ]
+    return TableDiff(
+        concat(differences, ignore_index=True) if differences
+        else DataFrame(columns=difference_columns),
+        concat(summaries, ignore_index=True) if summaries
+        else DataFrame(columns=summary_columns),
+        only_first,
+        only_second
+    )
+
+
+def diff_tables(
+        first: SOFiSTiKCDBReader,
+        second: SOFiSTiKCDBReader,
+        table: str,
+        columns: list[str] | None = None,
+        atol: float = 0.0,
+        rtol: float = 0.0
+) -> TableDiff:
+    """Compare the given ``table`` loaded by two readers, e.g. the results of two
+    revisions of a model.
+
+    Rows are aligned on their ``LOAD_CASE``, ``ID``, ``ELEM_ID`` and ``STATION``
+    columns, when found and holding scalars, and only the values that differ by more
+    than the given tolerances are reported, together with summary statistics per group.
+
+    Parameters
+    ----------
+    first, second : SOFiSTiKCDBReader
+        Readers that already loaded ``table``, see
+        :meth:`SOFiSTiKCDBReader.load_table`
+    table : str
+        Table name, e.g. ``"node_result"`` or ``"cable_result"``
+    columns : list[str] | None, default None
+        Columns to compare. When None, all the numeric columns except the keys
+        and ``GROUP`` are compared.
+    atol : float, default 0.0
+        Absolute tolerance
+    rtol : float, default 0.0
+        Relative tolerance
+
+    Raises
+    ------
+    LookupError
+        If ``table`` is unknown or any of the ``columns`` is not found.
+    RuntimeError
+        If the rows of ``table`` cannot be identified by their keys, e.g. for
+        tables holding several loads per element.
+    """
+    return diff_frames(
+        first.table_data(table),
+        second.table_data(table),
+        columns=columns,
+        atol=atol,
+        rtol=rtol
+    )
+
+
+def _is_scalar(column: Series) -> bool:
+    """Return `True` if all the values of ``column`` are scalars, e.g. not the
+    station arrays of ``beam_data``.
+    """
+    return column.dtype != object or bool(column.map(is_scalar).all())
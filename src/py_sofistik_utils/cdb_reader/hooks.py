@@ -0,0 +1,98 @@
+"""
+Hooks
+-----
+
+``LoadHook`` subclasses are notified while the records of a CDB key are read, e.g. to
+display a progress bar, to export metrics or to cancel a long load. Hooks are registered
+with :meth:`SOFiSTiKCDBReader.add_hook` and are called by every ``load`` method of the
+reader and of its helper classes.
+
+For each key ``kwh/kwl`` being read, the hooks receive:
+
+* ``on_start`` before the first record is read;
+* ``on_batch`` every ``batch_size`` records;
+* ``on_end`` once all the records have been read, with the total number of records and
+  the elapsed wall time in seconds.
+
+Exceptions raised by a hook propagate to the caller of ``load`` and abort the load, which
+is how :class:`CancellationToken` works.
+"""
+# standard library imports
+
+# third party library imports
+
+# local library specific imports
+
+
+class LoadHook:
+    """Base class of the load hooks. All the callbacks do nothing by default,
+    subclasses override the ones they need.
+
+    Parameters
+    ----------
+    batch_size : int, default 1000
+        Number of records between two calls to :meth:`on_batch`
+
+    Raises
+    ------
+    RuntimeError
+        If ``batch_size`` is not positive.
+    """
+    def __init__(self, batch_size: int = 1000) -> None:
+        if batch_size < 1:
+            raise RuntimeError("The batch size must be positive!")
+
+        self.batch_size = batch_size
+
+    def on_batch(self, kwh: int, kwl: int, records: int, elapsed: float) -> None:
+        """Called every ``batch_size`` records with the number of ``records``
+        read so far and the ``elapsed`` time since :meth:`on_start`.
+        """
+
+    def on_end(self, kwh: int, kwl: int, records: int, elapsed: float) -> None:
+        """Called once all the ``records`` of key ``kwh/kwl`` have been read.
+        It is not called when the load fails or is cancelled.
+        """
+
+    def on_start(self, kwh: int, kwl: int) -> None:
+        """Called before the first record of key ``kwh/kwl`` is read.
+        """
+
+
+class CancellationToken(LoadHook):
+    """Hook aborting the running load at the next batch once :meth:`cancel`
+    has been called, e.g. from another thread.
+
+    The cancelled load raises a ``RuntimeError`` and the data of the key being
+    read are not stored. Keys loaded before the cancellation are kept.
+    """
+    def __init__(self, batch_size: int = 1000) -> None:
+        super().__init__(batch_size)
+        self._is_cancelled = False
+
+    def cancel(self) -> None:
+        """Request the cancellation of the running load.
+        """
+        self._is_cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """Return `True` if the cancellation has been requested.
+        """
+        return self._is_cancelled
+
+    def on_batch(self, kwh: int, kwl: int, records: int, elapsed: float) -> None:
+        self._check(kwh, kwl)
+
+    def on_start(self, kwh: int, kwl: int) -> None:
+        self._check(kwh, kwl)
+
+    def reset(self) -> None:
+        """Clear the cancellation request, so that the token can be reused.
+        """
+        self._is_cancelled = False
+
+    def _check(self, kwh: int, kwl: int) -> None:
+        """Raise if the cancellation has been requested.
+        """
+        if self._is_cancelled:
+            raise RuntimeError(f"Load of key {kwh}/{kwl} cancelled!")
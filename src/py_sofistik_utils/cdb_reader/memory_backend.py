@@ -0,0 +1,318 @@
+"""
+Memory backend
+--------------
+
+The ``MemoryDll`` class replaces the SOFiSTiK dll with records held in memory by a
+``MemoryCDB``. It exposes the same interface as ``SofDll``, so that it can be passed to
+:class:`SOFiSTiKCDBReader` through its ``dll`` argument and every reader path can run
+without SOFiSTiK, e.g. on Linux for testing and benchmarking.
+
+Records are stored as raw bytes following the layouts of the ``sofistik_classes`` module
+and are served by ``sof_cdb_get`` with the same semantics as the dll: position ``0``
+reads the first record of a key, ``1`` the next one and ``-1`` reads again the current
+record, possibly into a different structure.
+"""
+# standard library imports
+from bisect import bisect_right
+from collections import OrderedDict
+from ctypes import addressof, memmove, sizeof, string_at, Structure
+from typing import Any, Callable, Sequence
+
+# third party library imports
+from numpy import concatenate, cumsum, frombuffer, int64, ndarray, uint8, zeros
+
+# local library specific imports
+from . _internals.sofistik_dll import SofDll
+
+
+# raw records of a key: the concatenated bytes and the record offsets (length n + 1)
+_Records = tuple[ndarray, ndarray]
+
+
+class MemoryCDB:
+    """In-memory store of CDB records, organized by key ``kwh/kwl``.
+
+    Keys can be filled eagerly with :meth:`add_records` and :meth:`add_buffer`, or
+    lazily with :meth:`add_lazy`: lazy keys are built on first access and only the
+    ``cache_size`` most recently used ones are kept in memory, so that models with
+    thousands of load cases can be served without materializing all of them.
+
+    Parameters
+    ----------
+    cache_size : int, default 8
+        Number of lazy keys kept in memory once built
+    """
+    def __init__(self, cache_size: int = 8) -> None:
+        self._cache_size = max(1, cache_size)
+        self._records: dict[tuple[int, int], _Records] = {}
+        self._factories: dict[tuple[int, int], Callable[[], _Records]] = {}
+        self._cache: OrderedDict[tuple[int, int], _Records] = OrderedDict()
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        return key in self._records or key in self._factories
+
+    def add_buffer(
+            self,
+            kwh: int,
+            kwl: int,
+            buffer: bytes | ndarray,
+            record_lengths: Sequence[int] | ndarray
+    ) -> None:
+        """Append records stored back to back in ``buffer`` to key ``kwh/kwl``.
+
+        Raises
+        ------
+        RuntimeError
+            If the size of ``buffer`` does not match the sum of
+            ``record_lengths``, or if ``kwh/kwl`` is a lazy key.
+        """
+        if (kwh, kwl) in self._factories:
+            raise RuntimeError(f"Key {kwh}/{kwl} is lazy and cannot be extended!")
+
+        data = frombuffer(buffer, dtype=uint8)
+        offsets = zeros(len(record_lengths) + 1, dtype=int64)
+        cumsum(record_lengths, out=offsets[1:])
+        if offsets[-1] != data.size:
+            raise RuntimeError(
+                f"Buffer of {data.size} bytes does not match the record lengths!"
+            )
+
+        if (kwh, kwl) in self._records:
+            old_data, old_offsets = self._records[(kwh, kwl)]
+            data = concatenate([old_data, data])
+            offsets = concatenate([old_offsets[:-1], offsets + old_offsets[-1]])
+
+        self._records[(kwh, kwl)] = (data, offsets)
+
+    def add_lazy(
+            self,
+            kwh: int,
+            kwl: int,
+            factory: Callable[[], tuple[bytes | ndarray, Sequence[int] | ndarray]]
+    ) -> None:
+        """Register key ``kwh/kwl`` whose records are built by ``factory`` on
+        first access. ``factory`` returns the buffer and the record lengths, as
+        accepted by :meth:`add_buffer`.
+        """
+        def build() -> _Records:
+            buffer, record_lengths = factory()
+            data = frombuffer(buffer, dtype=uint8)
+            offsets = zeros(len(record_lengths) + 1, dtype=int64)
+            cumsum(record_lengths, out=offsets[1:])
+            return data, offsets
+
+        self._records.pop((kwh, kwl), None)
+        self._factories[(kwh, kwl)] = build
+
+    def add_records(
+            self,
+            kwh: int,
+            kwl: int,
+            records: ndarray | Sequence[Structure]
+    ) -> None:
+        """Append ``records`` to key ``kwh/kwl``. ``records`` is either a numpy
+        structured array, whose items are stored as fixed length records, or a
+        sequence of ``ctypes`` structures of any type.
+        """
+        if isinstance(records, ndarray):
+            self.add_buffer(
+                kwh,
+                kwl,
+                records.tobytes(),
+                [records.dtype.itemsize] * records.size
+            )
+        else:
+            self.add_buffer(
+                kwh,
+                kwl,
+                b"".join(bytes(_) for _ in records),
+                [sizeof(_) for _ in records]
+            )
+
+    def keys(self) -> list[tuple[int, int]]:
+        """Return the sorted list of the keys ``(kwh, kwl)``.
+        """
+        return sorted(set(self._records) | set(self._factories))
+
+    def records(self, kwh: int, kwl: int) -> _Records:
+        """Return the raw records of key ``kwh/kwl`` as a tuple of the bytes and
+        the record offsets.
+
+        Raises
+        ------
+        LookupError
+            If the key does not exist.
+        """
+        key = (kwh, kwl)
+        if key in self._records:
+            return self._records[key]
+
+        if key not in self._factories:
+            raise LookupError(f"Key {kwh}/{kwl} not found!")
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self._cache[key] = self._factories[key]()
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return self._cache[key]
+
+
+class _MemoryLibrary:
+    """Implementation of the ``sof_cdb_*`` and ``sof_lib_ps2cs`` functions of the
+    SOFiSTiK dll used by ``SofDll``, backed by :class:`MemoryCDB` objects.
+
+    As with the dll, every ``sof_cdb_init`` opens a file under a new index, records are
+    read from the file of the given index, ``sof_cdb_kenq_ex`` lists its keys in sorted
+    order, ``sof_cdb_kexist`` applies to the file opened last and ``sof_cdb_close(0)``
+    closes all the open files.
+    """
+    def __init__(self) -> None:
+        # files available to sof_cdb_init, by name
+        self._files: dict[bytes, MemoryCDB] = {}
+        # open files and their read cursors, by index
+        self._open: dict[int, tuple[MemoryCDB, dict[tuple[int, int], int]]] = {}
+        # sorted keys of the open files, listed by sof_cdb_kenq_ex
+        self._keys: dict[int, list[tuple[int, int]]] = {}
+        self._last_index = 0
+        self._last_opened = 0
+
+    def add_file(self, name: bytes, cdb: MemoryCDB) -> None:
+        """Make ``cdb`` available to ``sof_cdb_init`` as ``name``.
+        """
+        self._files[name] = cdb
+
+    def sof_cdb_close(self, index: int) -> None:
+        if index == 0:
+            self._open.clear()
+            self._keys.clear()
+        else:
+            self._open.pop(index, None)
+            self._keys.pop(index, None)
+
+    def sof_cdb_get(
+            self,
+            index: int,
+            kwh: int,
+            kwl: int,
+            data: Any,
+            record_length: Any,
+            pos: int
+    ) -> int:
+        if index not in self._open:
+            return 3
+
+        cdb, cursors = self._open[index]
+        key = (kwh, kwl)
+        if key not in cdb:
+            return 3
+
+        buffer, offsets = cdb.records(kwh, kwl)
+        match pos:
+            case 0:
+                cursor = 0
+            case -1:
+                cursor = cursors.get(key, 0)
+            case _:
+                cursor = cursors.get(key, -1) + 1
+
+        cursors[key] = cursor
+        if cursor >= offsets.size - 1:
+            return 2
+
+        start = int(offsets[cursor])
+        size = int(offsets[cursor + 1]) - start
+        length = record_length._obj
+        n_bytes = min(size, length.value)
+        memmove(addressof(data._obj), buffer.ctypes.data + start, n_bytes)
+
+        return_value = 1 if size > length.value else 0
+        length.value = n_bytes
+        return return_value
+
+    def sof_cdb_init(self, name: bytes, mode: int) -> int:
+        if name not in self._files:
+            return 0
+
+        self._last_index += 1
+        self._open[self._last_index] = (self._files[name], {})
+        self._last_opened = self._last_index
+        return self._last_index
+
+    def sof_cdb_kenq_ex(self, index: int, kwh: Any, kwl: Any, request: int) -> int:
+        if index not in self._open:
+            return 1
+
+        if index not in self._keys:
+            self._keys[index] = self._open[index][0].keys()
+
+        keys = self._keys[index]
+        position = 0
+        if request != 0:
+            position = bisect_right(keys, (kwh._obj.value, kwl._obj.value))
+
+        if position == len(keys):
+            return 1
+
+        kwh._obj.value, kwl._obj.value = keys[position]
+        return 0
+
+    def sof_cdb_kexist(self, kwh: int, kwl: int) -> int:
+        if self._last_opened not in self._open:
+            return 0
+
+        cdb = self._open[self._last_opened][0]
+        if (kwh, kwl) not in cdb:
+            return 0
+
+        return 2 if cdb.records(kwh, kwl)[1].size > 1 else 1
+
+    def sof_cdb_status(self, index: int) -> int:
+        return 3 if index in self._open else 0
+
+    def sof_lib_ps2cs(self, source: Any, target: Any, size: int) -> None:
+        text = string_at(addressof(source._obj), sizeof(source._obj))
+        target._obj.value = text.split(b"\x00")[0].rstrip()[:size - 1]
+
+
+# library shared by the MemoryDll instances created with shared=True
+_SHARED_LIBRARY = _MemoryLibrary()
+
+
+class MemoryDll(SofDll):
+    """Drop-in replacement of ``SofDll`` serving the records of a
+    :class:`MemoryCDB`. Instrumentation and hooks work as with the dll.
+
+    Parameters
+    ----------
+    cdb : MemoryCDB
+        The records to serve
+    echo_level : int, default 0
+        Echo level
+    shared : bool, default False
+        If `True`, the instance uses a process-wide library shared with the other
+        shared instances, as ``SofDll`` instances share the loaded dll, so that
+        several CDB files are open at once under different indices of one handle.
+    """
+    def __init__(self, cdb: MemoryCDB, echo_level: int = 0, shared: bool = False) -> None:
+        super().__init__("", echo_level)
+        self._cdb = cdb
+        self._shared = shared
+
+    def load_dll(self) -> bool:
+        """Bind the in-memory implementation of the SOFiSTiK functions.
+        """
+        library = _SHARED_LIBRARY if self._shared else _MemoryLibrary()
+        self._dll = library  # type: ignore[assignment]
+        return True
+
+    def open_cdb(self, file_full_name: str, mode: int = 93) -> None:
+        """Open the in-memory CDB and keep its index as ``SofDll`` does.
+        """
+        self._dll.add_file(  # type: ignore[attr-defined]
+            file_full_name.encode("UTF-8"), self._cdb
+        )
+        self._open(file_full_name, mode)
@@ -6,123 +6,199 @@ The ``SOFiSTiKCDBReader`` class provides methods and data structure to read-only
 SOFiSTiK cdb file and serialize its content.
 """
 # standard library imports
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 # third party library imports
 
 # local library specific imports
-from . _internals.beam_data import _BeamData
-from . _internals.beam_load import _BeamLoad
-from . _internals.beam_results import _BeamResults
-from . _internals.beam_stresses import _BeamStress
-from . _internals.cable import Cables
-from . _internals.group_data import _GroupData
-from . _internals.group_lc_data import _GroupLCData
-from . _internals.load_cases import _LoadCases
-from . _internals.nodes import _Nodes
-from . _internals.plate_data import _PlateData
-from . _internals.property import _PropertyData
-from . _internals.sec_group_lc_data import _SecondaryGroupLCData
-from . _internals.spring import _Spring
 from . _internals.sofistik_dll import SofDll
-from . _internals.truss import _Truss
+from . hooks import LoadHook
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+    from . _internals.beam_data import _BeamData
+    from . _internals.beam_load import _BeamLoad
+    from . _internals.beam_results import _BeamResults
+    from . _internals.beam_stresses import _BeamStress
+    from . _internals.cable import Cables
+    from . _internals.group_data import _GroupData
+    from . _internals.group_lc_data import _GroupLCData
+    from . _internals.load_cases import _LoadCases
+    from . _internals.nodes import _Nodes
+    from . _internals.plate_data import _PlateData
+    from . _internals.property import _PropertyData
+    from . _internals.sec_group_lc_data import _SecondaryGroupLCData
+    from . _internals.spring import _Spring
+    from . _internals.truss import _Truss
+    from . shared_tables import SharedTable
 
 
 class SOFiSTiKCDBReader:
     """The ``SOFiSTiKCDBReader`` class provides methods and data structure to read-only
     access to a SOFiSTiK cdb file and serialize its content.
-    """
-    beam_geo: _BeamData
-    beam_load: _BeamLoad
-    beam_res: _BeamResults
-    cable: Cables
-    beam_stress: _BeamStress
-    grp_data: _GroupData
-    grp_lc_data: _GroupLCData
-    load_case: _LoadCases
-    nodes: _Nodes
-    plate_data: _PlateData
-    properties: _PropertyData
-    sec_grp_lc_data: _SecondaryGroupLCData
-    spring: _Spring
-    truss: _Truss
 
+    Sub-readers, e.g. ``cable`` or ``load_case``, are created on first access together
+    with the import of their modules, so that tools using only a few of them do not pay
+    for the others.
+    """
     def __init__(
             self,
             path_to_cdb: str,
             file_name: str,
             path_to_dlls: str,
-            version: int = 2023
+            version: int = 2023,
+            dll: SofDll | None = None
     ) -> None:
         """The initializer of the ``SOFiSTiKCDBReader`` class.
+
+        An already initialized ``dll`` can be shared among several readers that access
+        their CDB files one after the other, e.g. by the workers of
+        :func:`batch_extract`. When ``dll`` is None, a new instance is created from
+        ``path_to_dlls`` and ``version``.
         """
         self._echo_level = 0
         self.full_name = path_to_cdb + file_name + ".cdb"
         self.is_open = False
 
-        self._dll = SofDll(path_to_dlls, self.get_echo_level(), version)
+        if dll is None:
+            dll = SofDll(path_to_dlls, self.get_echo_level(), version)
+        self._dll = dll
+
+    @cached_property
+    def beam_geo(self) -> "_BeamData":
+        from . _internals.beam_data import _BeamData
+        return _BeamData(self._dll)
+
+    @cached_property
+    def beam_load(self) -> "_BeamLoad":
+        from . _internals.beam_load import _BeamLoad
+        return _BeamLoad(self._dll)
 
-        self.beam_res = _BeamResults(self._dll)
-        self.beam_geo = _BeamData(self._dll)
-        self.beam_load = _BeamLoad(self._dll)
-        self.beam_stress = _BeamStress(self._dll)
+    @cached_property
+    def beam_res(self) -> "_BeamResults":
+        from . _internals.beam_results import _BeamResults
+        return _BeamResults(self._dll)
 
-        self.cable = Cables(self._dll)
+    @cached_property
+    def beam_stress(self) -> "_BeamStress":
+        from . _internals.beam_stresses import _BeamStress
+        return _BeamStress(self._dll)
 
-        self.grp_data = _GroupData(self._dll)
-        self.grp_lc_data = _GroupLCData(self._dll)
-        self.sec_grp_lc_data = _SecondaryGroupLCData(self._dll)
+    @cached_property
+    def cable(self) -> "Cables":
+        from . _internals.cable import Cables
+        return Cables(self._dll)
 
-        self.nodes = _Nodes(self._dll)
+    @cached_property
+    def grp_data(self) -> "_GroupData":
+        from . _internals.group_data import _GroupData
+        return _GroupData(self._dll)
 
-        self.plate_data = _PlateData(self._dll)
+    @cached_property
+    def grp_lc_data(self) -> "_GroupLCData":
+        from . _internals.group_lc_data import _GroupLCData
+        return _GroupLCData(self._dll)
 
-        self.spring = _Spring(self._dll)
+    @cached_property
+    def load_case(self) -> "_LoadCases":
+        from . _internals.load_cases import _LoadCases
+        return _LoadCases(self._dll)
 
-        self.load_case = _LoadCases(self._dll)
-        self.properties = _PropertyData(self._dll)
+    @cached_property
+    def nodes(self) -> "_Nodes":
+        from . _internals.nodes import _Nodes
+        return _Nodes(self._dll)
 
-        self.truss = _Truss(self._dll)
+    @cached_property
+    def plate_data(self) -> "_PlateData":
+        from . _internals.plate_data import _PlateData
+        return _PlateData(self._dll)
+
+    @cached_property
+    def properties(self) -> "_PropertyData":
+        from . _internals.property import _PropertyData
+        return _PropertyData(self._dll)
+
+    @cached_property
+    def sec_grp_lc_data(self) -> "_SecondaryGroupLCData":
+        from . _internals.sec_group_lc_data import _SecondaryGroupLCData
+        return _SecondaryGroupLCData(self._dll)
+
+    @cached_property
+    def spring(self) -> "_Spring":
+        from . _internals.spring import _Spring
+        return _Spring(self._dll)
+
+    @cached_property
+    def truss(self) -> "_Truss":
+        from . _internals.truss import _Truss
+        return _Truss(self._dll)
+
+    def add_hook(self, hook: LoadHook) -> None:
+        """Register ``hook``, which is then notified while the records of each
+        CDB key are read by any ``load`` method. Refer to :class:`LoadHook` for
+        details. Registering the same hook twice has no effect.
+        """
+        self._dll.add_hook(hook)
 
     def clear(self) -> None:
         """Clear all the loaded data and results.
         """
-        #self.beam_res.clear_all_forces()
-        #self.beam_geo.clear_connectivity()
-        self.cable.data.clear()
-        self.cable.load.clear_all()
-        self.cable.result.clear_all()
-        self.grp_data.clear()
-        self.grp_lc_data.clear_all()
-        self.sec_grp_lc_data.clear_all()
-        self.nodes.data.clear()
-        self.nodes.results.clear_all()
-        self.spring.data.clear()
-        self.spring.result.clear_all()
-        #self.load_case.clear_all()
-        #self.properties.clear_all_values()
+        self.clear_data()
+        self.clear_results()
+        if self._is_created("cable"):
+            self.cable.load.clear_all()
 
     def clear_data(self) -> None:
         """Clear all the loaded data.
         """
         #self.beam_geo.clear_connectivity()
-        self.cable.data.clear()
-        self.grp_data.clear()
-        self.grp_lc_data.clear_all()
-        self.sec_grp_lc_data.clear_all()
-        self.nodes.data.clear()
-        self.spring.data.clear()
+        if self._is_created("cable"):
+            self.cable.data.clear()
+        if self._is_created("grp_data"):
+            self.grp_data.clear()
+        if self._is_created("grp_lc_data"):
+            self.grp_lc_data.clear_all()
+        if self._is_created("sec_grp_lc_data"):
+            self.sec_grp_lc_data.clear_all()
+        if self._is_created("nodes"):
+            self.nodes.data.clear()
+        if self._is_created("spring"):
+            self.spring.data.clear()
         #self.load_case.clear_all()
         #self.properties.clear_all_values()
 
+    def clear_instrumentation(self) -> None:
+        """Clear the extraction statistics collected so far.
+        """
+        self._dll.instrumentation.clear()
+
     def clear_results(self) -> None:
         """Clear all the loaded results.
         """
         #self.beam_res.clear_all_forces()
-        self.cable.result.clear_all()
-        self.nodes.results.clear_all()
-        self.spring.result.clear_all()
+        if self._is_created("cable"):
+            self.cable.result.clear_all()
+        if self._is_created("nodes"):
+            self.nodes.results.clear_all()
+        if self._is_created("spring"):
+            self.spring.result.clear_all()
         #self.load_case.clear_all()
 
+    def clear_table(self, table: str) -> None:
+        """Clear all the loaded data of the given ``table``, e.g. to keep the
+        memory bounded while extracting many load cases one after the other.
+
+        Raises
+        ------
+        LookupError
+            If ``table`` is unknown.
+        """
+        from . _internals.tables import clear_table
+        clear_table(self, table)
+
     def close(self) -> None:
         """Close the CDB database.
         """
@@ -134,11 +210,57 @@ class SOFiSTiKCDBReader:
         """
         return self._echo_level
 
+    def get_instrumentation_report(self) -> "DataFrame":
+        """Return the extraction statistics collected since the instrumentation
+        was enabled, one row per CDB key.
+
+        The columns are ``KWH``, ``KWL``, ``GET_CALLS``, ``RECORDS``, ``BYTES``
+        and the wall time in seconds spent in each phase: ``FFI_TIME`` (inside
+        ``sof_cdb_get``), ``DECODE_TIME`` (reading the ctypes records),
+        ``GROUP_TIME`` (group assignment), ``FRAME_TIME`` (``DataFrame``
+        construction, sorting and indexing), ``MERGE_TIME`` (concatenation
+        with previously loaded data) and ``TOTAL_TIME``. Phases covering
+        several load cases at once are reported with ``KWL = -1``.
+
+        With memory profiling enabled, the peak memory in bytes of each phase
+        is reported in ``READ_PEAK_MEMORY``, ``GROUP_PEAK_MEMORY``,
+        ``FRAME_PEAK_MEMORY`` and ``MERGE_PEAK_MEMORY``, the peak of the whole
+        load of the key in ``PEAK_MEMORY`` and the memory still allocated once
+        loaded in ``RETAINED_MEMORY``. These columns are zero otherwise.
+        """
+        return self._dll.instrumentation.report()
+
     def initialize(self) -> None:
         """Open the CDB file.
         """
         self.open()
 
+    def load_table(
+            self,
+            table: str,
+            load_cases: int | list[int] | None = None
+    ) -> None:
+        """Load the given ``table`` by name, e.g. ``"cable_result"`` or
+        ``"node_data"``.
+
+        Parameters
+        ----------
+        table : str
+            Table name
+        load_cases : int | list[int] | None, default None
+            Load case numbers. Required for tables stored per load case, ignored
+            otherwise.
+
+        Raises
+        ------
+        LookupError
+            If ``table`` is unknown.
+        RuntimeError
+            If ``table`` is stored per load case and no ``load_cases`` are given.
+        """
+        from . _internals.tables import load_table
+        load_table(self, table, load_cases)
+
     def open(self) -> None:
         """Open a CDB database always in a read-only mode! This method is supposed to be
         called before any other call.
@@ -148,8 +270,92 @@ class SOFiSTiKCDBReader:
             self._dll.open_cdb(self.full_name, 93)
             self.is_open = True
 
+    def remove_hook(self, hook: LoadHook) -> None:
+        """Unregister ``hook``.
+
+        Raises
+        ------
+        LookupError
+            If ``hook`` is not registered.
+        """
+        self._dll.remove_hook(hook)
+
     def set_echo_level(self, new_echo_level: int) -> None:
         """Set the ``echo_level`` for this instance of ``SOFiSTiKCDBReader``.
         """
         self._echo_level = new_echo_level
         self._dll.set_echo_level(new_echo_level)
+
+    def set_instrumentation(self, enabled: bool, memory: bool = False) -> None:
+        """Enable or disable the collection of extraction statistics, see
+        :meth:`get_instrumentation_report`. Disabled by default, in which case
+        ``sof_cdb_get`` is called directly and the overhead is negligible.
+
+        Parameters
+        ----------
+        enabled : bool
+            Collect the statistics if `True`
+        memory : bool, default False
+            Also profile the peak and retained memory of each load phase with
+            :mod:`tracemalloc`. This is a diagnostic mode that slows down the
+            loads significantly.
+        """
+        self._dll.set_instrumentation(enabled, memory)
+
+    def share_table(
+            self,
+            table: str,
+            columns: list[str] | None = None
+    ) -> "SharedTable":
+        """Publish the numeric columns of the loaded ``table`` in shared memory.
+
+        The returned :class:`SharedTable` owns the shared memory blocks; its
+        handle can be sent to worker processes, which attach to the data
+        without copying it. Refer to :class:`SharedTable` for details.
+
+        Parameters
+        ----------
+        table : str
+            Table name
+        columns : list[str] | None, default None
+            Columns to publish. When None, all the numeric and boolean columns
+            are published.
+
+        Raises
+        ------
+        LookupError
+            If ``table`` is unknown or any of the requested ``columns`` is not
+            found.
+        RuntimeError
+            If any of the requested ``columns`` is neither numeric nor boolean.
+        """
+        from . shared_tables import SharedTable
+        return SharedTable(self.table_data(table, columns), columns)
+
+    def table_data(
+            self,
+            table: str,
+            columns: list[str] | None = None
+    ) -> "DataFrame":
+        """Return a copy of the loaded ``table`` with a default integer index.
+
+        Parameters
+        ----------
+        table : str
+            Table name
+        columns : list[str] | None, default None
+            Columns to retrieve. All columns are returned when None.
+
+        Raises
+        ------
+        LookupError
+            If ``table`` is unknown or any of the requested ``columns`` is not
+            found.
+        """
+        from . _internals.tables import table_data
+        return table_data(self, table, columns)
+
+    def _is_created(self, name: str) -> bool:
+        """Return `True` if the sub-reader ``name`` has already been created.
+        """
+        return name in self.__dict__
@@ -0,0 +1,500 @@
+"""
+Query service
+-------------
+
+The ``QueryService`` class keeps ``SOFiSTiKCDBReader`` instances open and the tables they
+loaded in memory, and answers vectorised queries from this warm cache:
+
+* ``results``: rows of a table for a set of load cases and IDs;
+* ``envelope``: minimum and maximum of the selected columns over a set of load cases, per
+  ID (and station);
+* ``group``: rows of a table belonging to a group.
+
+Tables are loaded on first use, one load case at a time. Concurrent queries needing the
+same table and load case wait for a single load instead of loading it again. Loads are
+serialized, since the SOFiSTiK dll is not thread safe, while queries on loaded tables run
+concurrently. Only the ``cache_size`` most recently used tables are kept in memory.
+
+CDB paths are resolved against the root folder of the service, and paths outside it are
+rejected.
+
+The ``serve`` function, and the ``sofistik-serve`` console script, expose a service over
+HTTP on localhost. Queries are posted as JSON to ``/query``::
+
+    {"query": "envelope", "cdb": "C:/models/bridge.cdb", "table": "beam_result",
+     "load_cases": [1001, 1002], "ids": [101, 102], "columns": ["MY"]}
+
+and answered with the rows of the result as ``{"columns": [...], "data": [[...], ...]}``.
+Invalid queries, e.g. on a CDB file outside the root folder, are answered with a 400
+status. ``GET /status`` returns the cached tables.
+"""
+# standard library imports
+from argparse import ArgumentParser
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from math import isfinite
+from os import sep
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Sequence
+
+# third party library imports
+from numpy import generic, ndarray
+from pandas import concat, DataFrame, NA
+
+# local library specific imports
+from . _internals.sofistik_dll import SofDll
+from . _internals.tables import check_table_name, is_load_case_table
+from . reader import SOFiSTiKCDBReader
+
+
+# (cdb, table, load case or None)
+_CacheKey = tuple[str, str, int | None]
+
+_ID_COLUMNS = ("ID", "ELEM_ID")
+
+
+class QueryService:
+    """Keep CDB files open and their tables in memory to answer queries.
+
+    Parameters
+    ----------
+    path_to_dlls : str, default ""
+        Folder containing the SOFiSTiK dlls
+    version : int, default 2023
+        SOFiSTiK version
+    dll_factory : Callable[[str], SofDll] | None, default None
+        Return the dll used to open the given CDB file, e.g. a ``MemoryDll``.
+        When None, a ``SofDll`` is created from ``path_to_dlls`` and
+        ``version``.
+    root : str | None, default None
+        Folder of the CDB files that can be queried, subfolders included. Query
+        paths are relative to it. When None, the current working directory.
+    cache_size : int, default 256
+        Number of tables, one per load case for the tables stored per load case,
+        kept in memory. The least recently used ones are evicted first.
+    """
+    def __init__(
+            self,
+            path_to_dlls: str = "",
+            version: int = 2023,
+            dll_factory: Callable[[str], SofDll] | None = None,
+            root: str | None = None,
+            cache_size: int = 256
+    ) -> None:
+        self._path_to_dlls = path_to_dlls
+        self._version = version
+        self._dll_factory = dll_factory
+        self._root = (Path.cwd() if root is None else Path(root)).resolve()
+        self._cache_size = max(1, cache_size)
+
+        # readers and cached frames of each CDB, by path relative to the root
+        self._readers: dict[str, SOFiSTiKCDBReader] = {}
+        self._frames: OrderedDict[_CacheKey, Future[DataFrame]] = OrderedDict()
+        # guards _frames and _readers
+        self._lock = Lock()
+        # serializes the calls to the dll
+        self._dll_lock = Lock()
+
+    def cached(self) -> list[_CacheKey]:
+        """Return the keys ``(cdb, table, load case)`` of the loaded tables, with
+        ``cdb`` relative to the root folder. Tables not stored per load case have a
+        None load case.
+        """
+        with self._lock:
+            return sorted(
+                (key for key, future in self._frames.items() if future.done()),
+                key=lambda _: (_[0], _[1], -1 if _[2] is None else _[2])
+            )
+
+    def close(self) -> None:
+        """Close all the CDB files and clear the cache.
+        """
+        with self._lock, self._dll_lock:
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+            self._frames.clear()
+
+    def envelope(
+            self,
+            cdb: str,
+            table: str,
+            load_cases: list[int],
+            columns: list[str],
+            ids: list[int] | None = None
+    ) -> DataFrame:
+        """Return the minimum and maximum of ``columns`` over ``load_cases``, one
+        row per ID (and per station for beams). Result columns are named
+        ``<column>_MIN`` and ``<column>_MAX``.
+
+        Raises
+        ------
+        LookupError
+            If ``table`` or any of the ``columns`` is not found.
+        RuntimeError
+            If ``table`` has no ID column.
+        """
+        data = self.results(cdb, table, load_cases, ids)
+        keys = [_ for _ in ("GROUP", *_ID_COLUMNS, "STATION") if _ in data.columns]
+        if not any(_ in keys for _ in _ID_COLUMNS):
+            raise RuntimeError(f"Table \"{table}\" has no ID column!")
+
+        missing = [_ for _ in columns if _ not in data.columns]
+        if missing:
+            raise LookupError(f"Columns {missing} not found in table \"{table}\"!")
+
+        envelope = data.groupby(keys, sort=True)[columns].agg(["min", "max"])
+        envelope.columns = [
+            f"{column}_{stat.upper()}" for column, stat in envelope.columns
+        ]
+        return envelope.reset_index()
+
+    def group(
+            self,
+            cdb: str,
+            table: str,
+            group: int | str,
+            load_cases: list[int] | None = None,
+            columns: list[str] | None = None
+    ) -> DataFrame:
+        """Return the rows of ``table`` belonging to ``group``.
+
+        Raises
+        ------
+        LookupError
+            If ``table`` has no ``GROUP`` column, or any of the ``columns`` is
+            not found.
+        RuntimeError
+            If ``table`` is stored per load case and no ``load_cases`` are given.
+        """
+        data = self._table(cdb, table, load_cases)
+        if "GROUP" not in data.columns:
+            raise LookupError(f"Table \"{table}\" has no GROUP column!")
+
+        return self._project(data[data["GROUP"] == group], table, columns)
+
+    def results(
+            self,
+            cdb: str,
+            table: str,
+            load_cases: list[int] | None = None,
+            ids: list[int] | None = None,
+            columns: list[str] | None = None
+    ) -> DataFrame:
+        """Return the rows of ``table`` for the given ``load_cases`` and ``ids``.
+        Key columns are always returned.
+
+        Raises
+        ------
+        LookupError
+            If ``table`` or any of the ``columns`` is not found.
+        RuntimeError
+            If ``table`` is stored per load case and no ``load_cases`` are given.
+        """
+        data = self._table(cdb, table, load_cases)
+        if ids is not None:
+            id_column = next((_ for _ in _ID_COLUMNS if _ in data.columns), None)
+            if id_column is None:
+                raise RuntimeError(f"Table \"{table}\" has no ID column!")
+            data = data[data[id_column].isin(ids)]
+
+        return self._project(data, table, columns)
+
+    def _frame(self, cdb: str, table: str, load_case: int | None) -> DataFrame:
+        """Return the cached data of ``table`` for a single load case, loading it
+        if needed. Concurrent calls with the same arguments share one load.
+        """
+        key = (cdb, table, load_case)
+        with self._lock:
+            future = self._frames.get(key)
+            is_owner = future is None
+            if future is None:
+                future = self._frames[key] = Future()
+            else:
+                self._frames.move_to_end(key)
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            with self._dll_lock:
+                reader = self._reader(cdb)
+                if load_case is None:
+                    reader.load_table(table)
+                else:
+                    reader.load_table(table, load_case)
+                frame = reader.table_data(table)
+                reader.clear_table(table)
+
+        except BaseException as e:
+            with self._lock:
+                del self._frames[key]
+            future.set_exception(e)
+            raise
+
+        future.set_result(frame)
+        with self._lock:
+            # tables still loading are never evicted
+            loaded = [_ for _, item in self._frames.items() if item.done()]
+            for _ in loaded[:max(0, len(self._frames) - self._cache_size)]:
+                del self._frames[_]
+
+        return frame
+
+    def _project(
+            self,
+            data: DataFrame,
+            table: str,
+            columns: list[str] | None
+    ) -> DataFrame:
+        """Return ``data`` restricted to its key columns and ``columns``.
+        """
+        if columns is not None:
+            missing = [_ for _ in columns if _ not in data.columns]
+            if missing:
+                raise LookupError(
+                    f"Columns {missing} not found in table \"{table}\"!"
+                )
+
+            keys = [
+                _ for _ in ("LOAD_CASE", "GROUP", *_ID_COLUMNS, "STATION")
+                if _ in data.columns and _ not in columns
+            ]
+            data = data[[*keys, *columns]]
+
+        return data.reset_index(drop=True)
+
+    def _reader(self, cdb: str) -> SOFiSTiKCDBReader:
+        """Return the open reader of ``cdb``, opening it if needed. Must be
+        called holding the dll lock.
+        """
+        reader = self._readers.get(cdb)
+        if reader is None:
+            path = self._root / cdb
+            dll = (
+                SofDll(self._path_to_dlls, 0, self._version)
+                if self._dll_factory is None else self._dll_factory(str(path))
+            )
+            reader = SOFiSTiKCDBReader(str(path.parent) + sep, path.stem, "", dll=dll)
+            reader.open()
+            with self._lock:
+                self._readers[cdb] = reader
+
+        return reader
+
+    def _resolve(self, cdb: str) -> str:
+        """Return the path of ``cdb`` relative to the root folder, resolving links and
+        ``..`` parts.
+
+        Raises
+        ------
+        RuntimeError
+            If ``cdb`` is outside the root folder.
+        """
+        path = (self._root / cdb).resolve()
+        if not path.is_relative_to(self._root):
+            raise RuntimeError(f"CDB file \"{cdb}\" is outside the root folder!")
+
+        return path.relative_to(self._root).as_posix()
+
+    def _table(
+            self,
+            cdb: str,
+            table: str,
+            load_cases: list[int] | None
+    ) -> DataFrame:
+        """Return the data of ``table`` for the given ``load_cases``.
+        """
+        check_table_name(table)
+        cdb = self._resolve(cdb)
+        if not is_load_case_table(table):
+            return self._frame(cdb, table, None)
+
+        if not load_cases:
+            raise RuntimeError(f"Table \"{table}\" requires at least one load case!")
+
+        frames = [self._frame(cdb, table, _) for _ in dict.fromkeys(load_cases)]
+        if len(frames) == 1:
+            return frames[0]
+
+        return concat(frames, ignore_index=True)
+
+
+def _to_json(value: Any) -> Any:
+    """Return ``value`` as a JSON serializable object: arrays become lists, numpy
+    scalars Python ones and missing, NaN or infinite values None.
+    """
+    if isinstance(value, ndarray):
+        value = value.tolist()
+
+    if isinstance(value, (list, tuple)):
+        return [_to_json(_) for _ in value]
+
+    if isinstance(value, generic):
+        value = value.item()
+
+    if value is NA or isinstance(value, float) and not isfinite(value):
+        return None
+
+    return value
+
+
+def _to_rows(data: DataFrame) -> list[list[Any]]:
+    """Return the rows of ``data`` as JSON serializable lists, converting each column
+    on its own so that integer columns are not upcast to float by mixed frames.
+    """
+    columns: list[list[Any]] = []
+    for _, column in data.items():
+        if column.dtype.kind in "iub" and not column.hasnans:
+            columns.append(column.tolist())
+        else:
+            # object cells, e.g. the stations of beam_data, hold arrays
+            columns.append([_to_json(_) for _ in column.tolist()])
+
+    return [list(_) for _ in zip(*columns)]
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Answer the HTTP requests with the ``QueryService`` of the server.
+    """
+    server: "_Server"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self._handle(self._get)
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        self._handle(self._post)
+
+    def log_message(self, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(*args)
+
+    def _get(self) -> None:
+        """Answer ``GET /status``.
+        """
+        if self.path != "/status":
+            self._send(404, {"error": f"Unknown path \"{self.path}\"!"})
+            return
+
+        self._send(
+            200,
+            {"cached": [list(_) for _ in self.server.service.cached()]}
+        )
+
+    def _handle(self, method: Callable[[], None]) -> None:
+        """Call ``method``, answering with a 500 status if it fails, so that the
+        client is never left without a response.
+        """
+        try:
+            method()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def _post(self) -> None:
+        """Answer ``POST /query``.
+        """
+        if self.path != "/query":
+            self._send(404, {"error": f"Unknown path \"{self.path}\"!"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = loads(self.rfile.read(length))
+            query = request.pop("query")
+            if query not in ("results", "envelope", "group"):
+                raise LookupError(f"Unknown query \"{query}\"!")
+
+            data = getattr(self.server.service, query)(**request)
+
+        except (KeyError, LookupError, RuntimeError, TypeError, ValueError) as e:
+            self._send(400, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        self._send(
+            200,
+            {"columns": [str(_) for _ in data.columns], "data": _to_rows(data)}
+        )
+
+    def _send(self, status: int, body: dict[str, Any]) -> None:
+        payload = dumps(body, allow_nan=False).encode("UTF-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _Server(ThreadingHTTPServer):
+    """HTTP server holding a ``QueryService``.
+    """
+    daemon_threads = True
+
+    def __init__(
+            self,
+            address: tuple[str, int],
+            service: QueryService,
+            verbose: bool = False
+    ) -> None:
+        super().__init__(address, _RequestHandler)
+        self.service = service
+        self.verbose = verbose
+
+
+def serve(
+        service: QueryService,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        verbose: bool = False
+) -> ThreadingHTTPServer:
+    """Return an HTTP server answering the queries with ``service``. Call its
+    ``serve_forever`` method to start it, possibly in a separate thread, and
+    ``shutdown`` to stop it.
+
+    The server listens on localhost by default. It has no authentication and
+    must not be exposed on a public interface.
+    """
+    return _Server((host, port), service, verbose)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point of the ``sofistik-serve`` console script.
+    """
+    parser = ArgumentParser(
+        prog="sofistik-serve",
+        description="Serve queries on SOFiSTiK CDB files kept open in memory."
+    )
+    parser.add_argument("--dlls", required=True, help="folder of the SOFiSTiK dlls")
+    parser.add_argument("--version", type=int, default=2023, help="SOFiSTiK version")
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="folder of the CDB files that can be queried, default the current one"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help="tables kept in memory"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="listening address")
+    parser.add_argument("--port", type=int, default=8765, help="listening port")
+    parser.add_argument("--verbose", action="store_true", help="log the requests")
+    args = parser.parse_args(argv)
+
+    service = QueryService(
+        args.dlls, args.version, root=args.root, cache_size=args.cache_size
+    )
+    server = serve(service, args.host, args.port, args.verbose)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+    return 0
@@ -0,0 +1,256 @@
+"""
+Shared tables
+-------------
+
+The ``SharedTable`` class publishes the columns of a loaded table into
+:mod:`multiprocessing.shared_memory` blocks, one block per column. The lightweight
+``SharedTableHandle`` can be sent to worker processes, which attach to the blocks and get
+a :class:`pandas.DataFrame` backed by the shared memory, without copying nor pickling the
+data.
+
+Only numeric and boolean columns can be shared.
+"""
+# standard library imports
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import os
+from sys import version_info
+from typing import Any
+
+# third party library imports
+from numpy import dtype, frombuffer, ndarray
+from pandas import DataFrame
+
+# local library specific imports
+
+
+# shared memory blocks are registered with the resource tracker before Python 3.13
+_IS_TRACKED = os.name == "posix" and version_info < (3, 13)
+
+# blocks detached by SharedTableView.close but still referenced by frames
+_PENDING_BLOCKS: list[SharedMemory] = []
+
+
+class SharedTableHandle:
+    """Picklable description of a table published by :class:`SharedTable`.
+
+    Handles are cheap to pickle: they only store the names of the shared memory
+    blocks, together with the dtype and the length of each column.
+    """
+    def __init__(self, columns: list[tuple[str, str, str]], length: int) -> None:
+        self._columns = columns
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def columns(self) -> list[str]:
+        """The names of the shared columns.
+        """
+        return [_[0] for _ in self._columns]
+
+    def attach(self, index: list[str] | None = None) -> "SharedTableView":
+        """Attach to the shared memory blocks and return a read-only view of
+        the table.
+
+        Parameters
+        ----------
+        index : list[str] | None, default None
+            Columns used to build the index of the returned ``DataFrame``. The
+            index columns are not dropped. A default integer index is used when
+            None.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the publishing :class:`SharedTable` has already been unlinked.
+        """
+        blocks: list[SharedMemory] = []
+        arrays: dict[str, ndarray] = {}
+        try:
+            for column, shm_name, dtype_str in self._columns:
+                block = _attach_block(shm_name)
+                blocks.append(block)
+
+                # frombuffer keeps the buffer exported, so that the block cannot be
+                # unmapped while the array is alive
+                array: ndarray = frombuffer(
+                    block.buf,
+                    dtype=dtype(dtype_str),
+                    count=self._length
+                )
+                array.flags.writeable = False
+                arrays[column] = array
+
+        except BaseException:
+            arrays.clear()
+            for block in blocks:
+                block.close()
+            raise
+
+        return SharedTableView(arrays, blocks, index)
+
+
+class SharedTableView:
+    """Read-only view of a table attached from a :class:`SharedTableHandle`.
+
+    The ``DataFrame`` returned by :meth:`data` references the shared memory
+    directly and stays valid after :meth:`close`: the blocks still referenced by
+    frames are closed once these are released.
+    """
+    def __init__(
+            self,
+            arrays: dict[str, ndarray],
+            blocks: list[SharedMemory],
+            index: list[str] | None = None
+    ) -> None:
+        self._blocks = blocks
+        self._data = DataFrame(arrays, copy=False)
+
+        if index is not None:
+            self._data = self._data.set_index(index, drop=False)
+
+    def __enter__(self) -> "SharedTableView":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Detach from the shared memory blocks. The blocks still referenced by
+        frames returned by :meth:`data` are closed by a later call of ``close``
+        on any view, once these frames are released.
+        """
+        self._data = self._data[0:0].copy()
+        _PENDING_BLOCKS.extend(self._blocks)
+        self._blocks.clear()
+        _close_pending_blocks()
+
+    def data(self) -> DataFrame:
+        """Return the zero-copy :class:`pandas.DataFrame` of the shared table.
+        """
+        return self._data
+
+
+class SharedTable:
+    """Publish the columns of a :class:`pandas.DataFrame` into shared memory.
+
+    The publishing process owns the shared memory blocks: they stay available
+    to the workers until :meth:`unlink` is called, which also happens when the
+    instance is used as a context manager.
+
+    Parameters
+    ----------
+    data : DataFrame
+        The table to publish, e.g. as returned by
+        :meth:`SOFiSTiKCDBReader.table_data`
+    columns : list[str] | None, default None
+        Columns to publish. When None, all the numeric and boolean columns
+        are published and the remaining ones are skipped.
+
+    Raises
+    ------
+    LookupError
+        If any of the requested ``columns`` is not found.
+    RuntimeError
+        If any of the requested ``columns`` is neither numeric nor boolean.
+    """
+    def __init__(self, data: DataFrame, columns: list[str] | None = None) -> None:
+        if columns is None:
+            columns = [_ for _ in data.columns if _is_shareable(data[_])]
+        else:
+            missing = [_ for _ in columns if _ not in data.columns]
+            if missing:
+                raise LookupError(f"Columns {missing} not found!")
+
+            not_shareable = [_ for _ in columns if not _is_shareable(data[_])]
+            if not_shareable:
+                raise RuntimeError(
+                    f"Columns {not_shareable} are neither numeric nor boolean "
+                    "and cannot be shared!"
+                )
+
+        self._blocks: list[SharedMemory] = []
+        description: list[tuple[str, str, str]] = []
+        try:
+            for column in columns:
+                values = data[column].to_numpy()
+                block = SharedMemory(create=True, size=max(values.nbytes, 1))
+                self._blocks.append(block)
+
+                ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+                description.append((column, block.name, values.dtype.str))
+
+        except BaseException:
+            self.unlink()
+            raise
+
+        self._handle = SharedTableHandle(description, len(data))
+
+    def __enter__(self) -> "SharedTable":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.unlink()
+
+    def handle(self) -> SharedTableHandle:
+        """Return the picklable handle to be sent to the worker processes.
+        """
+        return self._handle
+
+    def nbytes(self) -> int:
+        """Return the total size of the shared memory blocks in bytes.
+        """
+        return sum(_.size for _ in self._blocks)
+
+    def unlink(self) -> None:
+        """Release the shared memory blocks. Workers that are still attached
+        keep their mapping until they close their view.
+        """
+        for block in self._blocks:
+            block.close()
+            if _IS_TRACKED:
+                # the tracker may be shared with workers, which unregistered the block
+                # when attaching
+                name = block._name  # type: ignore[attr-defined]
+                resource_tracker.register(name, "shared_memory")
+            block.unlink()
+        self._blocks.clear()
+
+
+def _attach_block(name: str) -> SharedMemory:
+    """Attach to an existing shared memory block without handing its ownership
+    to the resource tracker of the current process.
+    """
+    if version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+
+    # before Python 3.13 attaching always registers the block with the resource tracker,
+    # which would then unlink it when the worker process exits
+    block = SharedMemory(name=name)
+    if _IS_TRACKED:
+        resource_tracker.unregister(
+            block._name,  # type: ignore[attr-defined]
+            "shared_memory"
+        )
+
+    return block
+
+def _close_pending_blocks() -> None:
+    """Close the attached blocks no longer referenced by any frame, and keep the
+    other ones pending.
+    """
+    pending: list[SharedMemory] = []
+    for block in _PENDING_BLOCKS:
+        try:
+            block.close()
+        except BufferError:
+            pending.append(block)
+
+    _PENDING_BLOCKS[:] = pending
+
+def _is_shareable(column: Any) -> bool:
+    """Return `True` if the given column has a numeric or boolean numpy dtype.
+    """
+    return isinstance(column.dtype, dtype) and column.dtype.kind in "biuf"
@@ -0,0 +1,654 @@
+"""
+Synthetic models
+----------------
+
+The ``generate_model`` function builds a :class:`MemoryCDB` holding a consistent
+synthetic model of any size, to scale-test the reader without SOFiSTiK.
+
+Nodes lie on a square grid in the global XY plane; beams, trusses and cables connect
+grid nodes, springs connect a node to the ground and quads fill the grid cells. Element
+lengths and directions follow from the nodal coordinates. Elements are split into
+``n_groups`` groups numbered from 1, with element numbers ``group * divisor + i`` as in
+SOFiSTiK, where the divisor is the smallest power of ten above the number of elements
+of a group.
+
+The following keys are generated, using the layouts of the ``sofistik_classes`` module:
+
+* ``9/NR``: sectional values of ``n_properties`` properties;
+* ``11/00`` and ``11/LC``: group data, including ``n_secondary_groups`` secondary groups
+  per load case;
+* ``12/LC``: load case information;
+* ``20/00`` and ``24/LC``: nodes and nodal displacements and support forces;
+* ``100/00``, ``101/LC``, ``102/LC`` and ``105/LC``: beams with ``n_stations`` sections,
+  beam loads, forces and stresses;
+* ``150/00``, ``151/LC`` and ``152/LC``: trusses, truss loads and results;
+* ``160/00``, ``161/LC`` and ``162/LC``: cables, cable loads and results;
+* ``170/00`` and ``170/LC``: springs and spring results;
+* ``200/00``: quads.
+
+Results are built lazily, one key at a time, so that models with thousands of load
+cases do not need to fit in memory. Results are pseudo-random but reproducible: they
+only depend on ``seed`` and on the load case number.
+"""
+# standard library imports
+from ctypes import sizeof
+from math import ceil, isqrt
+from typing import Callable
+
+# third party library imports
+from numpy import (
+    arange,
+    array_split,
+    concatenate,
+    cross,
+    dtype,
+    float32,
+    full,
+    int32,
+    ndarray,
+    repeat,
+    stack,
+    tile,
+    zeros
+)
+from numpy.linalg import norm
+from numpy.random import default_rng, Generator
+
+# local library specific imports
+from . _internals.sofistik_classes import (
+    CBEAM,
+    CBEAM_DL,
+    CBEAM_FOR,
+    CBEAM_SCT,
+    CBEAM_STR,
+    CCABL,
+    CCABL_LOA,
+    CCABL_RES,
+    CGRP,
+    CGRP_LC,
+    CLC_CTRL,
+    CN_DISP,
+    CNODE,
+    CQUAD,
+    CSECT,
+    CSECT_ADD,
+    CSPRI,
+    CSPRI_RES,
+    CTRUS,
+    CTRUS_LOA,
+    CTRUS_RES
+)
+from . memory_backend import MemoryCDB
+
+
+def generate_model(
+        n_nodes: int = 1000,
+        n_beams: int = 0,
+        n_trusses: int = 0,
+        n_cables: int = 0,
+        n_springs: int = 0,
+        n_quads: int = 0,
+        load_cases: int | list[int] = 1,
+        n_stations: int = 3,
+        n_groups: int = 1,
+        n_secondary_groups: int = 0,
+        n_properties: int = 1,
+        seed: int = 0,
+        cache_size: int = 8
+) -> MemoryCDB:
+    """Return a :class:`MemoryCDB` holding a synthetic model, see the module
+    documentation for its layout.
+
+    Parameters
+    ----------
+    n_nodes : int, default 1000
+        Number of nodes
+    n_beams, n_trusses, n_cables, n_springs, n_quads : int, default 0
+        Number of elements of each type
+    load_cases : int | list[int], default 1
+        Load case numbers, or the number of load cases numbered from 1
+    n_stations : int, default 3
+        Number of sections of each beam, including both ends
+    n_groups : int, default 1
+        Number of groups the elements are split into
+    n_secondary_groups : int, default 0
+        Number of secondary groups, each one covering the elements of a group
+    n_properties : int, default 1
+        Number of properties, assigned to the elements in turn
+    seed : int, default 0
+        Seed of the pseudo-random results
+    cache_size : int, default 8
+        Number of result keys kept in memory, see :class:`MemoryCDB`
+
+    Raises
+    ------
+    RuntimeError
+        If the arguments are inconsistent, e.g. there are too few nodes for
+        the requested elements.
+    """
+    if isinstance(load_cases, int):
+        load_cases = list(range(1, load_cases + 1))
+
+    model = _SyntheticModel(
+        n_nodes,
+        {
+            100: n_beams,
+            150: n_trusses,
+            160: n_cables,
+            170: n_springs,
+            200: n_quads
+        },
+        n_stations,
+        n_groups,
+        n_secondary_groups,
+        n_properties,
+        seed
+    )
+
+    cdb = MemoryCDB(cache_size)
+    for property_number in range(1, n_properties + 1):
+        cdb.add_records(9, property_number, model.property_data(property_number))
+    cdb.add_records(11, 0, model.group_data())
+    cdb.add_records(20, 0, model.node_data())
+    if n_beams:
+        cdb.add_buffer(100, 0, *model.beam_data())
+    if n_trusses:
+        cdb.add_records(150, 0, model.truss_data())
+    if n_cables:
+        cdb.add_records(160, 0, model.cable_data())
+    if n_springs:
+        cdb.add_records(170, 0, model.spring_data())
+    if n_quads:
+        cdb.add_records(200, 0, model.quad_data())
+
+    for load_case in load_cases:
+        cdb.add_records(11, load_case, model.group_lc_data(load_case))
+        cdb.add_records(12, load_case, [model.load_case_data(load_case)])
+        cdb.add_lazy(24, load_case, _fixed(model.node_results, load_case))
+        if n_beams:
+            cdb.add_lazy(101, load_case, _fixed(model.beam_loads, load_case))
+            cdb.add_lazy(102, load_case, _fixed(model.beam_results, load_case))
+            cdb.add_lazy(105, load_case, _fixed(model.beam_stresses, load_case))
+        if n_trusses:
+            cdb.add_lazy(151, load_case, _fixed(model.truss_loads, load_case))
+            cdb.add_lazy(152, load_case, _fixed(model.truss_results, load_case))
+        if n_cables:
+            cdb.add_lazy(161, load_case, _fixed(model.cable_loads, load_case))
+            cdb.add_lazy(162, load_case, _fixed(model.cable_results, load_case))
+        if n_springs:
+            cdb.add_lazy(170, load_case, _fixed(model.spring_results, load_case))
+
+    return cdb
+
+
+class _SyntheticModel:
+    """Geometry and topology of a synthetic model, and the builders of its
+    records.
+    """
+    def __init__(
+            self,
+            n_nodes: int,
+            n_elements: dict[int, int],
+            n_stations: int,
+            n_groups: int,
+            n_secondary_groups: int,
+            n_properties: int,
+            seed: int
+    ) -> None:
+        if n_nodes < 4:
+            raise RuntimeError("At least 4 nodes are required!")
+        if n_stations < 2:
+            raise RuntimeError("At least 2 stations per beam are required!")
+        if not 1 <= n_groups <= 999:
+            raise RuntimeError("The number of groups must be between 1 and 999!")
+        if any(_ < 0 for _ in n_elements.values()):
+            raise RuntimeError("The number of elements cannot be negative!")
+        if not 0 <= n_secondary_groups <= 1000:
+            raise RuntimeError(
+                "The number of secondary groups must be between 0 and 1000!"
+            )
+        if n_properties < 1:
+            raise RuntimeError("At least 1 property is required!")
+
+        self._n_properties = n_properties
+        self._n_secondary_groups = n_secondary_groups
+        self._n_stations = n_stations
+        self._seed = seed
+
+        # nodes on a square grid with unit spacing
+        self._nx = isqrt(n_nodes - 1) + 1
+        index = arange(n_nodes)
+        self._node_ids = index + 1
+        self._xyz = stack(
+            [index % self._nx, index // self._nx, zeros(n_nodes)],
+            axis=1
+        ).astype(float32)
+        self._is_support = index < self._nx
+
+        # element numbers and groups, per element type
+        self._groups = arange(1, n_groups + 1)
+        self._ids: dict[int, ndarray] = {}
+        self._id_ranges: dict[int, list[tuple[int, int]]] = {}
+        for element_type, count in n_elements.items():
+            chunks = array_split(arange(count), n_groups)
+            divisor = 10 ** len(str(ceil(count / n_groups)))
+            self._ids[element_type] = concatenate(
+                [grp * divisor + arange(1, len(chunk) + 1)
+                 for grp, chunk in zip(self._groups, chunks)]
+            ).astype(int32)
+            self._id_ranges[element_type] = [
+                (grp * divisor + 1, grp * divisor + len(chunk))
+                for grp, chunk in zip(self._groups, chunks)
+            ]
+
+        # connectivity
+        self._nodes = {
+            100: self._pairs(n_elements[100], 1),
+            150: self._pairs(n_elements[150], self._nx),
+            160: self._pairs(n_elements[160], self._nx + 1)
+        }
+
+        n_rows = n_nodes // self._nx
+        n_cells = (self._nx - 1) * (n_rows - 1)
+        if n_elements[200] and n_cells < 1:
+            raise RuntimeError("Too few nodes to generate quads!")
+        cell = arange(n_elements[200]) % max(n_cells, 1)
+        base = (cell // (self._nx - 1)) * self._nx + cell % (self._nx - 1) + 1
+        self._quad_nodes = stack(
+            [base, base + 1, base + self._nx + 1, base + self._nx],
+            axis=1
+        )
+
+    def beam_data(self) -> tuple[ndarray, ndarray]:
+        """Return the buffer and the record lengths of key ``100/00``: each beam
+        record is followed by the records of its sections.
+        """
+        n_beams = self._ids[100].size
+        block = dtype(
+            [("beam", dtype(CBEAM)), ("sct", dtype(CBEAM_SCT), (self._n_stations,))]
+        )
+        records = zeros(n_beams, dtype=block)
+
+        nodes = self._nodes[100]
+        lengths, directions = self._geometry(nodes)
+        beam = records["beam"]
+        beam["m_nr"] = self._ids[100]
+        beam["m_node"] = nodes
+        beam["m_np"] = self._properties(n_beams)
+        beam["m_dl"] = lengths
+        beam["m_t"][:, 0] = directions
+        beam["m_t"][:, 1] = cross([0.0, 0.0, 1.0], directions)
+        beam["m_t"][:, 2] = [0.0, 0.0, 1.0]
+
+        sct = records["sct"]
+        sct["m_nq"] = beam["m_np"][:, None]
+        sct["m_x"] = lengths[:, None] * arange(self._n_stations) / (self._n_stations - 1)
+        # hinged in MY at the end of every other beam
+        sct["m_itp2"][1::2, -1] = 16
+
+        record_lengths = tile(
+            [sizeof(CBEAM)] + [sizeof(CBEAM_SCT)] * self._n_stations,
+            n_beams
+        )
+        return records.view(dtype("u1")).reshape(-1), record_lengths
+
+    def beam_results(self, load_case: int) -> ndarray:
+        """Return the records of key ``102/LC``, one per beam section. Forces are
+        consistent along each beam: ``VZ`` is constant and ``MY`` is linear.
+        """
+        rng = self._rng(102, load_case)
+        n_beams = self._ids[100].size
+        lengths, _ = self._geometry(self._nodes[100])
+        stations = lengths[:, None] * arange(self._n_stations) / (self._n_stations - 1)
+
+        n = repeat(rng.normal(0.0, 100.0, n_beams), self._n_stations)
+        vz = repeat(rng.normal(0.0, 10.0, n_beams), self._n_stations)
+        my_start = repeat(rng.normal(0.0, 10.0, n_beams), self._n_stations)
+
+        records = zeros(n_beams * self._n_stations, dtype=dtype(CBEAM_FOR))
+        records["m_nr"] = repeat(self._ids[100], self._n_stations)
+        records["m_x"] = stations.reshape(-1)
+        records["m_n"] = n
+        records["m_vz"] = vz
+        records["m_my"] = my_start + vz * records["m_x"]
+        records["m_ux"] = n * 1E-6
+        return records
+
+    def beam_loads(self, load_case: int) -> ndarray:
+        """Return the records of key ``101/LC``, a uniform load ``PZZ`` on each
+        beam.
+        """
+        rng = self._rng(101, load_case)
+        lengths, _ = self._geometry(self._nodes[100])
+        load = rng.uniform(-10.0, 0.0, lengths.size)
+
+        records = zeros(lengths.size, dtype=dtype(CBEAM_DL))
+        records["m_nr"] = self._ids[100]
+        records["m_typ"] = 13
+        records["m_l"] = lengths
+        records["m_pa"] = load
+        records["m_pe"] = load
+        return records
+
+    def beam_stresses(self, load_case: int) -> ndarray:
+        """Return the records of key ``105/LC``, one per beam section, derived
+        from the forces of key ``102/LC`` for a unit section.
+        """
+        forces = self.beam_results(load_case)
+
+        records = zeros(forces.size, dtype=dtype(CBEAM_STR))
+        records["m_nr"] = forces["m_nr"]
+        records["m_mnr"] = 1024 + 1
+        records["m_x"] = forces["m_x"]
+        records["m_sigc"] = forces["m_n"] - abs(forces["m_my"]) * 6.0
+        records["m_sigt"] = forces["m_n"] + abs(forces["m_my"]) * 6.0
+        records["m_tau"] = forces["m_vz"] * 1.5
+        records["m_sigv"] = (
+            records["m_sigt"] ** 2 + 3.0 * records["m_tau"] ** 2
+        ) ** 0.5
+        return records
+
+    def cable_data(self) -> ndarray:
+        """Return the records of key ``160/00``.
+        """
+        return self._line_elements(dtype(CCABL), 160)
+
+    def cable_loads(self, load_case: int) -> ndarray:
+        """Return the records of key ``161/LC``, a load ``PG`` on each cable.
+        """
+        return self._element_loads(161, 160, load_case, dtype(CCABL_LOA))
+
+    def cable_results(self, load_case: int) -> ndarray:
+        """Return the records of key ``162/LC``.
+        """
+        rng = self._rng(162, load_case)
+        lengths, _ = self._geometry(self._nodes[160])
+        force = rng.uniform(0.0, 100.0, lengths.size)
+
+        records = zeros(lengths.size, dtype=dtype(CCABL_RES))
+        records["m_nr"] = self._ids[160]
+        records["m_n"] = force
+        records["m_n_m"] = force
+        records["m_v"] = force * lengths * 1E-6
+        records["m_l0"] = lengths
+        records["m_eps0"] = force * 1E-6
+        records["m_effs"] = 1.0
+        return records
+
+    def group_data(self) -> list[CGRP]:
+        """Return the records of key ``11/00``.
+        """
+        records: list[CGRP] = []
+        for index, grp in enumerate(self._groups):
+            header = CGRP(m_ng=grp, m_typ=0)
+            header.m_text[:] = _encode_text(f"GROUP {grp}", 17)
+            records.append(header)
+
+            for element_type, id_ranges in self._id_ranges.items():
+                min_id, max_id = id_ranges[index]
+                if max_id >= min_id:
+                    records.append(
+                        CGRP(
+                            m_ng=grp,
+                            m_typ=element_type,
+                            m_num=max_id - min_id + 1,
+                            m_min=min_id,
+                            m_max=max_id
+                        )
+                    )
+
+        return records
+
+    def group_lc_data(self, load_case: int) -> list[CGRP_LC]:
+        """Return the records of key ``11/LC``, all groups being active. The
+        records of the secondary groups, whose number is their encoded name,
+        follow the ones of the primary groups.
+        """
+        primary = self.group_data()
+        records: list[CGRP_LC] = []
+        for record in primary:
+            records.append(self._group_lc_record(record.m_ng, record))
+
+        for index in range(self._n_secondary_groups):
+            # secondary group "Snnn" covers the elements of a primary group
+            name = int.from_bytes(f"S{index:03d}".encode(), "little")
+            grp = self._groups[index % self._groups.size]
+            records.extend(
+                self._group_lc_record(name, record)
+                for record in primary if record.m_ng == grp
+            )
+
+        return records
+
+    def load_case_data(self, load_case: int) -> CLC_CTRL:
+        """Return the record of key ``12/LC``.
+        """
+        record = CLC_CTRL(m_kind=0, m_theo=0, m_fact=1.0)
+        if load_case == 1:
+            record.m_facz = -1.0
+
+        record.m_name[:] = _encode_text("SYNTH", 8)
+        record.m_rtex[:] = _encode_text(f"LC {load_case}", 17)
+        return record
+
+    def node_data(self) -> ndarray:
+        """Return the records of key ``20/00``. The nodes of the first grid row
+        are fixed in translation.
+        """
+        records = zeros(self._node_ids.size, dtype=dtype(CNODE))
+        records["m_nr"] = self._node_ids
+        records["m_inr"] = self._node_ids
+        # the bits of kfix are set for the free degrees of freedom
+        records["m_kfix"] = 63
+        records["m_kfix"][self._is_support] = 56
+        records["m_xyz"] = self._xyz
+        return records
+
+    def node_results(self, load_case: int) -> ndarray:
+        """Return the records of key ``24/LC``. The first two records hold the
+        maximum and minimum values, as in SOFiSTiK. Support nodes do not move
+        and are the only ones with support forces.
+        """
+        rng = self._rng(24, load_case)
+        n_nodes = self._node_ids.size
+        free = ~self._is_support
+
+        records = zeros(n_nodes + 2, dtype=dtype(CN_DISP))
+        nodes = records[2:]
+        nodes["m_nr"] = self._node_ids
+        for field in ["m_ux", "m_uy", "m_uz", "m_urx", "m_ury", "m_urz"]:
+            nodes[field][free] = rng.normal(0.0, 1E-3, free.sum())
+        for field in ["m_px", "m_py", "m_pz"]:
+            nodes[field][self._is_support] = rng.normal(
+                0.0, 100.0, self._is_support.sum()
+            )
+
+        for field, _ in CN_DISP._fields_[1:]:
+            records[field][0] = nodes[field].max()
+            records[field][1] = nodes[field].min()
+
+        return records
+
+    def property_data(self, property_number: int) -> list[CSECT | CSECT_ADD]:
+        """Return the records of key ``9/NR``: the sectional values of a solid
+        rectangular section, followed by its extents.
+        """
+        width = 0.2 + 0.1 * (property_number - 1)
+        height = 2.0 * width
+        area = width * height
+        section = CSECT(
+            m_id=0,
+            m_mno=1,
+            m_a=area,
+            m_ay=area * 5.0 / 6.0,
+            m_az=area * 5.0 / 6.0,
+            m_it=0.229 * height * width ** 3,
+            m_iy=width * height ** 3 / 12.0,
+            m_iz=height * width ** 3 / 12.0,
+            m_em=3.0E7,
+            m_gm=1.25E7,
+            m_gam=25.0
+        )
+        extents = CSECT_ADD(
+            m_id=4,
+            m_ymin=-width / 2.0,
+            m_ymax=width / 2.0,
+            m_zmin=-height / 2.0,
+            m_zmax=height / 2.0
+        )
+        return [section, extents]
+
+    def quad_data(self) -> ndarray:
+        """Return the records of key ``200/00``.
+        """
+        records = zeros(self._ids[200].size, dtype=dtype(CQUAD))
+        records["m_nr"] = self._ids[200]
+        records["m_node"] = self._quad_nodes
+        records["m_mat"] = self._properties(self._ids[200].size)
+        records["m_nra"] = 1
+        records["m_thick"] = 0.2
+        return records
+
+    def spring_data(self) -> ndarray:
+        """Return the records of key ``170/00``, springs acting along global Z.
+        """
+        n_springs = self._ids[170].size
+        records = zeros(n_springs, dtype=dtype(CSPRI))
+        records["m_nr"] = self._ids[170]
+        records["m_node"][:, 0] = arange(n_springs) % self._node_ids.size + 1
+        records["m_nrq"] = self._properties(n_springs)
+        records["m_t"] = [0.0, 0.0, 1.0]
+        records["m_cp"] = 1000.0
+        return records
+
+    def spring_results(self, load_case: int) -> ndarray:
+        """Return the records of key ``170/LC``, consistent with the axial
+        stiffness of key ``170/00``.
+        """
+        rng = self._rng(170, load_case)
+        force = rng.normal(0.0, 10.0, self._ids[170].size)
+
+        records = zeros(force.size, dtype=dtype(CSPRI_RES))
+        records["m_nr"] = self._ids[170]
+        records["m_p"] = force
+        records["m_v"] = force / 1000.0
+        return records
+
+    def truss_data(self) -> ndarray:
+        """Return the records of key ``150/00``.
+        """
+        return self._line_elements(dtype(CTRUS), 150)
+
+    def truss_loads(self, load_case: int) -> ndarray:
+        """Return the records of key ``151/LC``, a load ``PG`` on each truss.
+        """
+        return self._element_loads(151, 150, load_case, dtype(CTRUS_LOA))
+
+    def truss_results(self, load_case: int) -> ndarray:
+        """Return the records of key ``152/LC``.
+        """
+        rng = self._rng(152, load_case)
+        lengths, _ = self._geometry(self._nodes[150])
+        force = rng.normal(0.0, 100.0, lengths.size)
+
+        records = zeros(lengths.size, dtype=dtype(CTRUS_RES))
+        records["m_nr"] = self._ids[150]
+        records["m_n"] = force
+        records["m_v"] = force * lengths * 1E-6
+        return records
+
+    def _element_loads(
+            self,
+            kwh: int,
+            element_type: int,
+            load_case: int,
+            record_type: dtype
+    ) -> ndarray:
+        """Return the records of trusses and cables loads, which share their
+        layout.
+        """
+        rng = self._rng(kwh, load_case)
+        load = rng.uniform(0.0, 1.0, self._ids[element_type].size)
+
+        records = zeros(load.size, dtype=record_type)
+        records["m_nr"] = self._ids[element_type]
+        records["m_typ"] = 10
+        records["m_pa"] = load
+        records["m_pe"] = load
+        return records
+
+    def _geometry(self, nodes: ndarray) -> tuple[ndarray, ndarray]:
+        """Return the lengths and the unit directions of the given node pairs.
+        """
+        delta = self._xyz[nodes[:, 1] - 1] - self._xyz[nodes[:, 0] - 1]
+        lengths = norm(delta, axis=1)
+        return lengths, delta / lengths[:, None]
+
+    def _group_lc_record(self, name: int, record: CGRP) -> CGRP_LC:
+        """Return the load case record of group ``name`` built from ``record``
+        of key ``11/00``.
+        """
+        return CGRP_LC(
+            m_ng=name,
+            m_typ=record.m_typ,
+            m_num=record.m_num,
+            m_min=record.m_min,
+            m_max=record.m_max,
+            m_inf=2 if record.m_typ == 0 else 0,
+            m_faks=1.0
+        )
+
+    def _line_elements(self, record_type: dtype, element_type: int) -> ndarray:
+        """Return the records of trusses and cables, which share their layout.
+        """
+        nodes = self._nodes[element_type]
+        lengths, directions = self._geometry(nodes)
+
+        records = zeros(lengths.size, dtype=record_type)
+        records["m_nr"] = self._ids[element_type]
+        records["m_node"] = nodes
+        records["m_nrq"] = self._properties(lengths.size)
+        records["m_t"] = directions
+        records["m_dl"] = lengths
+        return records
+
+    def _pairs(self, n_elements: int, step: int) -> ndarray:
+        """Return the nodes of ``n_elements`` connecting node ``i`` to node
+        ``i + step``, wrapping around the available nodes.
+        """
+        n_nodes = self._node_ids.size
+        if step >= n_nodes:
+            step = 1
+
+        first = arange(n_elements) % (n_nodes - step) + 1
+        return stack([first, first + step], axis=1)
+
+    def _properties(self, n_elements: int) -> ndarray:
+        """Return the property numbers of ``n_elements``, assigned in turn.
+        """
+        return arange(n_elements) % self._n_properties + 1
+
+    def _rng(self, kwh: int, load_case: int) -> Generator:
+        """Return the random generator of key ``kwh/load_case``.
+        """
+        return default_rng([self._seed, kwh, load_case])
+
+
+def _encode_text(text: str, size: int) -> list[int]:
+    """Encode ``text`` as SOFiSTiK does, four characters per integer.
+    """
+    raw = text.encode("latin-1")[:4 * size - 1].ljust(4 * size, b"\x00")
+    return [int.from_bytes(raw[_:_ + 4], "little") for _ in range(0, 4 * size, 4)]
+
+def _fixed(
+        builder: Callable[[int], ndarray],
+        load_case: int
+) -> Callable[[], tuple[bytes, ndarray]]:
+    """Return a factory of the records of ``builder`` for the given
+    ``load_case``, as expected by :meth:`MemoryCDB.add_lazy`.
+    """
+    def factory() -> tuple[bytes, ndarray]:
+        records = builder(load_case)
+        return records.tobytes(), full(records.size, records.dtype.itemsize)
+
+    return factory
@@ -0,0 +1,27 @@
+# standard library imports
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Any
+from unittest import TestCase
+
+# third party library imports
+
+# local library specific imports
+from py_sofistik_utils import generate_model, MemoryDll, SOFiSTiKCDBReader
+
+
+def close_model(cdb: SOFiSTiKCDBReader) -> None:
+    """Close ``cdb`` without printing the closing message.
+    """
+    with redirect_stdout(StringIO()):
+        cdb.close()
+
+
+def open_model(test: TestCase, name: str, **kwargs: Any) -> SOFiSTiKCDBReader:
+    """Return an initialized reader ``name`` of the synthetic model built by
+    ``generate_model(**kwargs)``, closed when ``test`` ends.
+    """
+    cdb = SOFiSTiKCDBReader("", name, "", dll=MemoryDll(generate_model(**kwargs)))
+    cdb.initialize()
+    test.addCleanup(close_model, cdb)
+    return cdb
@@ -0,0 +1,129 @@
+# standard library imports
+from os import environ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import skipUnless, TestCase
+from unittest.mock import patch
+
+# third party library imports
+from pandas.testing import assert_frame_equal
+
+# local library specific imports
+from py_sofistik_utils import (
+    batch_extract, ExtractionPlan, generate_model, MemoryDll, SOFiSTiKCDBReader
+)
+from py_sofistik_utils.cdb_reader import batch
+
+
+CDB_PATH = environ.get("SOFISTIK_CDB_PATH")
+DLL_PATH = environ.get("SOFISTIK_DLL_PATH")
+VERSION = environ.get("SOFISTIK_VERSION")
+
+
+class ExtractionPlanTestSuite(TestCase):
+    def test_invalid_table(self) -> None:
+        with self.assertRaises(LookupError):
+            ExtractionPlan("non_existing_table")
+
+    def test_invalid_projection(self) -> None:
+        with self.assertRaises(LookupError):
+            ExtractionPlan("cable_data", columns={"non_existing_table": ["N1"]})
+
+    def test_missing_load_cases(self) -> None:
+        with self.assertRaises(RuntimeError):
+            ExtractionPlan(["cable_data", "cable_result"])
+
+    def test_duplicated_entries(self) -> None:
+        plan = ExtractionPlan(
+            ["cable_result", "cable_result"],
+            [1000, 1001, 1000]
+        )
+        self.assertEqual(plan.tables, ["cable_result"])
+        self.assertEqual(plan.load_cases, [1000, 1001])
+
+
+class WorkerDllTestSuite(TestCase):
+    def test_not_initialized(self) -> None:
+        with patch.object(batch, "_WORKER_DLL", None):
+            with self.assertRaises(RuntimeError):
+                batch.get_worker_dll()
+
+    def test_calling_process(self) -> None:
+        # extracting in the calling process does not leave a worker dll behind
+        dll = MemoryDll(generate_model(n_nodes=20, n_cables=6))
+        with (
+            patch.object(batch, "_WORKER_DLL", None),
+            patch.object(batch, "load_dll", return_value=dll)
+        ):
+            data = batch_extract(
+                ["A.cdb", "B.cdb"], ExtractionPlan("cable_data"), "", max_workers=1
+            )
+            self.assertIsNone(batch._WORKER_DLL)
+
+        self.assertEqual(data["cable_data"]["CDB"].tolist(), ["A"] * 6 + ["B"] * 6)
+
+
+@skipUnless(
+    all([CDB_PATH, DLL_PATH, VERSION]),
+    "SOFiSTiK environment variables not set!"
+)
+class BatchExtractTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.cdb_files = [
+            str(Path(CDB_PATH) / "CABLE_DATA.cdb"),  # type: ignore
+            str(Path(CDB_PATH) / "CABLE_RESULT.cdb")  # type: ignore
+        ]
+        self.plan = ExtractionPlan(
+            "cable_data",
+            columns={"cable_data": ["ELEM_ID", "N1", "N2", "L0"]}
+        )
+
+    def test_merge(self) -> None:
+        for max_workers in [1, 2]:
+            with self.subTest(max_workers=max_workers):
+                data = batch_extract(
+                    self.cdb_files,
+                    self.plan,
+                    DLL_PATH,  # type: ignore
+                    int(VERSION),  # type: ignore
+                    max_workers
+                )
+
+                self.assertEqual(list(data), ["cable_data"])
+                self.assertEqual(
+                    data["cable_data"].columns.to_list(),
+                    ["CDB", "ELEM_ID", "N1", "N2", "L0"]
+                )
+
+                cdb = SOFiSTiKCDBReader(
+                    CDB_PATH,  # type: ignore
+                    "CABLE_DATA",
+                    DLL_PATH,  # type: ignore
+                    int(VERSION)  # type: ignore
+                )
+                cdb.initialize()
+                reference = self.plan.run(cdb)["cable_data"]
+                cdb.close()
+
+                result = data["cable_data"]
+                assert_frame_equal(
+                    result[result["CDB"] == "CABLE_DATA"].drop(columns="CDB"),
+                    reference
+                )
+
+    def test_cache_dir(self) -> None:
+        with TemporaryDirectory() as cache_dir:
+            data = batch_extract(
+                self.cdb_files,
+                self.plan,
+                DLL_PATH,  # type: ignore
+                int(VERSION),  # type: ignore
+                2,
+                cache_dir
+            )
+            self.assertEqual(len(list(Path(cache_dir).glob("*.pkl"))), 2)
+
+        self.assertEqual(
+            data["cable_data"]["CDB"].unique().tolist(),
+            ["CABLE_DATA", "CABLE_RESULT"]
+        )
@@ -0,0 +1,67 @@
+# standard library imports
+from unittest import TestCase
+
+# third party library imports
+from numpy.testing import assert_allclose
+
+# local library specific imports
+from . import open_model
+
+
+class BeamDataAccessorsTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.cdb = open_model(self, "BEAMS", n_nodes=20, n_beams=6, n_groups=2)
+        self.cdb.beam_geo.load()
+        self.data = self.cdb.table_data("beam_data").set_index("ELEM_ID")
+
+    def test_element_accessors(self) -> None:
+        beams = self.cdb.beam_geo
+
+        self.assertEqual(
+            beams.get_element_connectivity(22).tolist(),
+            self.data.loc[22, ["N1", "N2"]].tolist()
+        )
+        self.assertEqual(beams.get_element_length(22), self.data.loc[22, "LENGTH"])
+        self.assertEqual(
+            beams.get_element_properties(22),
+            self.data.loc[22, ["PROP_END_1", "PROP_END_2"]].tolist()
+        )
+
+        for method in (
+                beams.get_element_connectivity,
+                beams.get_element_length,
+                beams.get_element_properties
+        ):
+            with self.assertRaises(RuntimeError):
+                method(99)
+
+    def test_batch_accessors(self) -> None:
+        beams = self.cdb.beam_geo
+        ids = [23, 11, 22, 11]
+
+        self.assertEqual(
+            beams.get_connectivities(ids).tolist(),
+            self.data.loc[ids, ["N1", "N2"]].to_numpy().tolist()
+        )
+        assert_allclose(beams.get_lengths(ids), self.data.loc[ids, "LENGTH"])
+        self.assertEqual(
+            beams.get_properties(ids).tolist(),
+            self.data.loc[ids, ["PROP_END_1", "PROP_END_2"]].to_numpy().tolist()
+        )
+        self.assertEqual(beams.get_connectivities([]).shape, (0, 2))
+
+        with self.assertRaises(RuntimeError):
+            beams.get_lengths([11, 99])
+
+        beams.clear()
+        with self.assertRaises(RuntimeError):
+            beams.get_connectivities([11])
+
+    def test_group_connectivity(self) -> None:
+        connectivity = self.cdb.beam_geo.get_group_connectivity(2)
+
+        self.assertEqual(list(connectivity.columns), ["ELEM_ID", "N1", "N2"])
+        self.assertEqual(connectivity["ELEM_ID"].tolist(), [21, 22, 23])
+
+        with self.assertRaises(RuntimeError):
+            self.cdb.beam_geo.get_group_connectivity(3)
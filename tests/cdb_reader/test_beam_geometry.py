@@ -0,0 +1,61 @@
+# standard library imports
+from unittest import TestCase
+
+# third party library imports
+from numpy import array, float32
+from numpy.testing import assert_allclose
+
+# local library specific imports
+from py_sofistik_utils.cdb_reader import _BeamGeometry
+from . import open_model
+
+
+class BeamGeometryTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.geometry = _BeamGeometry.from_records(
+            [101, 102],
+            [2.0, 4.0],
+            [array([[1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=float32).tobytes()] * 2,
+            [array([0.0, 2.0], dtype=float32).tobytes(), b"\x00" * 8],
+            [[0.0, 1.0, 2.0], [0.0, 4.0]]
+        )
+
+    def test_arrays(self) -> None:
+        self.assertEqual(len(self.geometry), 2)
+        self.assertEqual(self.geometry.trans_matrices.shape, (2, 3, 3))
+        self.assertEqual(self.geometry.spar.tolist(), [[0.0, 2.0], [0.0, 0.0]])
+        self.assertEqual(self.geometry.station_offsets.tolist(), [0, 3, 5])
+        self.assertEqual(self.geometry.station_counts().tolist(), [3, 2])
+        assert_allclose(
+            self.geometry.adimensional_station_values(), [0.0, 0.5, 1.0, 0.0, 1.0]
+        )
+
+    def test_stations(self) -> None:
+        self.assertEqual(self.geometry.get_stations(102).tolist(), [0.0, 4.0])
+        self.assertTrue(self.geometry.get_stations(101).base is not None)
+        stations = self.geometry.split_stations(self.geometry.station_values)
+        self.assertEqual([_.tolist() for _ in stations], [[0.0, 1.0, 2.0], [0.0, 4.0]])
+
+        with self.assertRaises(RuntimeError):
+            self.geometry.get_position(103)
+
+    def test_empty(self) -> None:
+        geometry = _BeamGeometry.from_records([], [], [], [], [])
+        self.assertEqual(len(geometry), 0)
+        self.assertEqual(geometry.split_stations(geometry.station_values), [])
+
+
+class BeamDataGeometryTestSuite(TestCase):
+    def test_views(self) -> None:
+        cdb = open_model(self, "BEAMS", n_nodes=20, n_beams=4)
+        cdb.beam_geo.load()
+
+        geometry = cdb.beam_geo.get_geometry()
+        data = cdb.table_data("beam_data")
+        self.assertEqual(geometry.elem_ids.tolist(), data["ELEM_ID"].tolist())
+        assert_allclose(data["TRANS_MATRIX"].iloc[2], geometry.trans_matrices[2])
+        assert_allclose(data["STATION"].iloc[1], geometry.get_stations(12))
+        assert_allclose(data["ADIMENSIONAL_STATION"].iloc[1], [0.0, 0.5, 1.0])
+
+        cdb.beam_geo.clear()
+        self.assertEqual(len(cdb.beam_geo.get_geometry()), 0)
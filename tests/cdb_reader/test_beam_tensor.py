@@ -0,0 +1,177 @@
+# standard library imports
+from unittest import TestCase
+
+# third party library imports
+from numpy import array, interp, isnan, nan
+from numpy.testing import assert_allclose
+from pandas import DataFrame
+
+# local library specific imports
+from py_sofistik_utils.cdb_reader import _BeamResultTensor
+from . import open_model
+
+
+class BeamResultTensorTestSuite(TestCase):
+    def setUp(self) -> None:
+        # beam 2 has two stations only and no result in load case 20
+        self.tensor = _BeamResultTensor.from_frame(
+            DataFrame(
+                {
+                    "LOAD_CASE":    [10, 10, 10, 10, 10, 20, 20, 20],
+                    "ELEM_ID":      [1, 1, 1, 2, 2, 1, 1, 1],
+                    "STATION":      [0.0, 1.0, 2.0, 0.0, 3.0, 0.0, 1.0, 2.0],
+                    "MY":           [1.0, 2.0, 3.0, 4.0, 5.0, -1.0, 6.0, 0.0]
+                }
+            ),
+            ["MY"]
+        )
+
+    def test_layout(self) -> None:
+        self.assertEqual(self.tensor.values["MY"].shape, (2, 2, 3))
+        self.assertEqual(str(self.tensor.values["MY"].dtype), "float32")
+        self.assertEqual(self.tensor.mask.sum(axis=2).tolist(), [[3, 2], [3, 0]])
+        assert_allclose(self.tensor.stations, [[0.0, 1.0, 2.0], [0.0, 3.0, nan]])
+
+        stations, values = self.tensor.get_diagram("MY", 10, 2)
+        assert_allclose(stations, [0.0, 3.0])
+        assert_allclose(values, [4.0, 5.0])
+
+        with self.assertRaises(LookupError):
+            self.tensor.get_diagram("MY", 30, 2)
+
+        with self.assertRaises(LookupError):
+            self.tensor.get_component("VZ")
+
+    def test_different_stations(self) -> None:
+        with self.assertRaises(RuntimeError):
+            _BeamResultTensor.from_frame(
+                DataFrame(
+                    {
+                        "LOAD_CASE":    [10, 10, 20, 20],
+                        "ELEM_ID":      [1, 1, 1, 1],
+                        "STATION":      [0.0, 1.0, 0.0, 0.5],
+                        "MY":           [1.0, 2.0, 3.0, 4.0]
+                    }
+                ),
+                ["MY"]
+            )
+
+    def test_envelope(self) -> None:
+        minimum, maximum = self.tensor.envelope("MY")
+        assert_allclose(minimum, [[-1.0, 2.0, 0.0], [4.0, 5.0, nan]])
+        assert_allclose(maximum, [[1.0, 6.0, 3.0], [4.0, 5.0, nan]])
+
+    def test_combine(self) -> None:
+        combination = self.tensor.combine("MY", {10: 1.35, 20: 1.5})
+        assert_allclose(combination, [[-0.15, 11.7, 4.05], [5.4, 6.75, nan]], rtol=1E-6)
+        self.assertTrue(isnan(combination[1, 2]))
+
+    def test_interpolate(self) -> None:
+        assert_allclose(
+            self.tensor.interpolate("MY", [1, 1, 1, 2], [0.5, 1.5, 2.0, 1.5], 10),
+            [1.5, 2.5, 3.0, 4.5]
+        )
+        assert_allclose(
+            self.tensor.interpolate("MY", 1, [0.25, 1.0], [20, 20]), [0.75, 6.0]
+        )
+        self.assertTrue(isnan(self.tensor.interpolate("MY", 2, 1.0, 20)))
+
+        with self.assertRaises(LookupError):
+            self.tensor.interpolate("MY", 3, 1.0, 10)
+
+        with self.assertRaises(LookupError):
+            self.tensor.interpolate("MY", 1, 1.0, 30)
+
+
+    def test_interpolate_masked(self) -> None:
+        # the middle station of beam 1 has no result in load case 10
+        self.tensor.mask[0, 0, 1] = False
+        assert_allclose(
+            self.tensor.interpolate("MY", 1, [0.5, 1.5, 3.0], 10), [1.5, 2.5, 4.0]
+        )
+
+
+class BeamResultsTensorTestSuite(TestCase):
+    def test_get_tensor(self) -> None:
+        cdb = open_model(
+            self, "BEAMS", n_nodes=20, n_beams=6, load_cases=[1, 2, 3], n_stations=4
+        )
+        cdb.load_table("beam_result", [1, 2, 3])
+
+        tensor = cdb.beam_res.get_tensor(["N", "MY"], [1, 3])
+        data = cdb.beam_res.get_data()
+        data = data[data["LOAD_CASE"] == 3].sort_values(["ELEM_ID", "STATION"])
+
+        self.assertEqual(tensor.load_cases.tolist(), [1, 3])
+        self.assertEqual(tensor.values["MY"].shape, (2, 6, 4))
+        assert_allclose(tensor.values["MY"][1].ravel(), data["MY"], rtol=1E-6)
+        self.assertTrue(tensor.mask.all())
+
+        with self.assertRaises(LookupError):
+            cdb.beam_res.get_tensor(["NOT_A_COMPONENT"])
+
+        with self.assertRaises(RuntimeError):
+            cdb.beam_res.get_tensor(load_cases=[4])
+
+    def test_interpolate(self) -> None:
+        cdb = open_model(
+            self, "BEAMS", n_nodes=20, n_beams=6, load_cases=[1, 2], n_stations=3
+        )
+        cdb.beam_geo.load()
+        cdb.load_table("beam_result", [1, 2])
+
+        # MY is linear and VZ constant along each beam in the synthetic model
+        data = cdb.beam_res.get_data()
+        data = data[(data["LOAD_CASE"] == 2) & (data["ELEM_ID"] == 12)]
+        forces = cdb.beam_res.interpolate(
+            cdb.beam_geo, [12, 12], [0.25, 0.75], 2, adimensional=True
+        )
+
+        self.assertEqual(list(forces.columns[:3]), ["ELEM_ID", "X", "LOAD_CASE"])
+        self.assertEqual(len(forces.columns), 9)
+        assert_allclose(forces["X"], data["STATION"].iloc[-1] * array([0.25, 0.75]))
+        assert_allclose(
+            forces["MY"],
+            interp(forces["X"], data["STATION"], data["MY"]),
+            rtol=1E-5,
+            atol=1E-5
+        )
+        assert_allclose(forces["VZ"], data["VZ"].iloc[:2], rtol=1E-6)
+
+        with self.assertRaises(RuntimeError):
+            cdb.beam_res.interpolate(cdb.beam_geo, 12, 1.5, 1, adimensional=True)
+
+        with self.assertRaises(RuntimeError):
+            cdb.beam_res.interpolate(cdb.beam_geo, 99, 0.0, 1)
+
+        with self.assertRaises(RuntimeError):
+            cdb.beam_res.interpolate(cdb.beam_geo, 12, 0.0, 3)
+
+    def test_interpolate_cache(self) -> None:
+        cdb = open_model(
+            self, "BEAMS", n_nodes=20, n_beams=6, load_cases=[1, 2], n_stations=3
+        )
+        cdb.beam_geo.load()
+        cdb.load_table("beam_result", [1])
+
+        first = cdb.beam_res.interpolate(cdb.beam_geo, 12, 0.5, 1, ["MY"], True)
+        tensor = cdb.beam_res._tensor
+        cdb.beam_res.interpolate(cdb.beam_geo, 12, 0.25, 1, ["MY"], True)
+        self.assertIs(cdb.beam_res._tensor, tensor)
+
+        with self.subTest(msg="Load"):
+            cdb.load_table("beam_result", [2])
+            self.assertIsNone(cdb.beam_res._tensor)
+            forces = cdb.beam_res.interpolate(cdb.beam_geo, 12, 0.5, [1, 2], ["MY"], True)
+            self.assertEqual(cdb.beam_res._tensor.load_cases.tolist(), [1, 2])
+            assert_allclose(forces["MY"].iloc[0], first["MY"].iloc[0])
+
+        with self.subTest(msg="Clear"):
+            cdb.beam_res.clear(2)
+            self.assertIsNone(cdb.beam_res._tensor)
+            with self.assertRaises(RuntimeError):
+                cdb.beam_res.interpolate(cdb.beam_geo, 12, 0.5, 2, ["MY"], True)
+
+            cdb.beam_res.clear_all()
+            with self.assertRaises(RuntimeError):
+                cdb.beam_res.interpolate(cdb.beam_geo, 12, 0.5, 1, ["MY"], True)
@@ -0,0 +1,155 @@
+# standard library imports
+from contextlib import redirect_stdout
+from io import StringIO
+from json import dumps, loads
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+
+# third party library imports
+
+# local library specific imports
+from benchmarks.compare import BASELINE_FORMAT, compare, main, make_baseline
+
+
+def _result(  # type: ignore[type-arg]
+        case: str,
+        throughput: float,
+        peak_memory: int,
+        status: str = "ok"
+) -> dict:
+    return {
+        "case": case,
+        "scale": 1000,
+        "status": status,
+        "records": 1000,
+        "throughput": throughput,
+        "throughput_unit": "records/s",
+        "peak_memory": peak_memory
+    }
+
+
+class CompareTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.baseline = make_baseline(
+            {
+                "metadata": {},
+                "results": [
+                    _result("node_data.load", 1000.0, 100),
+                    _result("cable_result.load", 1000.0, 100)
+                ]
+            }
+        )
+
+    def _compare(  # type: ignore[type-arg]
+            self,
+            *results: dict[str, Any],
+            **kwargs: Any
+    ) -> dict[str, dict]:
+        run = {"metadata": {}, "results": list(results)}
+        return {_["scenario"]: _ for _ in compare(run, self.baseline, **kwargs)}
+
+    def test_pass(self) -> None:
+        comparison = self._compare(
+            _result("node_data.load", 900.0, 120),
+            _result("cable_result.load", 1500.0, 50)
+        )
+
+        self.assertEqual([_["status"] for _ in comparison.values()], ["ok", "ok"])
+        self.assertAlmostEqual(comparison["node_data.load@1000"]["throughput_ratio"], 0.9)
+        self.assertAlmostEqual(comparison["node_data.load@1000"]["memory_ratio"], 1.2)
+
+    def test_regression(self) -> None:
+        comparison = self._compare(
+            _result("node_data.load", 800.0, 100),
+            _result("cable_result.load", 1000.0, 130)
+        )
+
+        for name in ["node_data.load@1000", "cable_result.load@1000"]:
+            with self.subTest(scenario=name):
+                self.assertEqual(comparison[name]["status"], "regression")
+                self.assertEqual(len(comparison[name]["messages"]), 1)
+
+        with self.subTest(msg="Failed scenario"):
+            comparison = self._compare(_result("node_data.load", 0.0, 0, "error: boom"))
+            self.assertEqual(comparison["node_data.load@1000"]["status"], "error")
+
+    def test_missing_scenario(self) -> None:
+        comparison = self._compare(_result("truss_data.load", 1000.0, 100))
+
+        self.assertEqual(
+            {_: comparison[_]["status"] for _ in comparison},
+            {
+                "truss_data.load@1000": "new",
+                "node_data.load@1000": "missing",
+                "cable_result.load@1000": "missing"
+            }
+        )
+
+    def test_threshold(self) -> None:
+        # a 30% throughput drop fails the default 15% tolerance
+        results = [_result("node_data.load", 700.0, 100)]
+        self.assertEqual(
+            self._compare(*results)["node_data.load@1000"]["status"], "regression"
+        )
+        self.assertEqual(
+            self._compare(*results, throughput=0.35)["node_data.load@1000"]["status"],
+            "ok"
+        )
+
+        with self.subTest(msg="Per scenario tolerance"):
+            self.baseline["tolerances"] = {"node_data.load@1000": {"throughput": 0.5}}
+            self.assertEqual(
+                self._compare(*results)["node_data.load@1000"]["status"], "ok"
+            )
+
+        with self.subTest(msg="Peak memory"):
+            results = [_result("node_data.load", 1000.0, 140)]
+            self.assertEqual(
+                self._compare(*results)["node_data.load@1000"]["status"], "regression"
+            )
+            self.assertEqual(
+                self._compare(*results, memory=0.5)["node_data.load@1000"]["status"],
+                "ok"
+            )
+
+        with self.assertRaises(RuntimeError):
+            compare({"results": []}, {**self.baseline, "format": BASELINE_FORMAT + 1})
+
+    def test_main(self) -> None:
+        with TemporaryDirectory() as folder:
+            results = Path(folder) / "results.json"
+            arguments = [str(results), "--baseline", str(Path(folder) / "baseline.json")]
+
+            with redirect_stdout(StringIO()):
+                for throughput, update, code in [
+                        (1000.0, True, 0), (1000.0, False, 0), (500.0, False, 1)
+                ]:
+                    run = {
+                        "metadata": {},
+                        "results": [_result("node_data.load", throughput, 100)]
+                    }
+                    results.write_text(dumps(run), encoding="utf-8")
+                    self.assertEqual(
+                        main([*arguments, *(["--update"] if update else [])]), code
+                    )
+
+    def test_reference_baseline(self) -> None:
+        path = Path(__file__).parents[2] / "benchmarks" / "baselines.json"
+        baseline = loads(path.read_text(encoding="utf-8"))
+        run = {
+            "metadata": baseline["metadata"],
+            "results": [
+                {
+                    "case": name.rpartition("@")[0],
+                    "scale": int(name.rpartition("@")[2]),
+                    "status": "ok",
+                    **scenario
+                }
+                for name, scenario in baseline["scenarios"].items()
+            ]
+        }
+
+        self.assertEqual(make_baseline(run), baseline)
+        self.assertEqual({_["status"] for _ in compare(run, baseline)}, {"ok"})
@@ -0,0 +1,168 @@
+# standard library imports
+from json import dumps, loads
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+# third party library imports
+from numpy import array, load
+from numpy.testing import assert_allclose
+from pandas import DataFrame
+
+# local library specific imports
+from py_sofistik_utils import generate_model, LoadHook, MemoryDll
+from py_sofistik_utils.cdb_reader.cli import (
+    _to_arrays,
+    parse_load_cases,
+    run_extraction
+)
+
+
+class ParseLoadCasesTestSuite(TestCase):
+    def test_selectors(self) -> None:
+        self.assertEqual(parse_load_cases("1-3,10,2"), [1, 2, 3, 10])
+        self.assertEqual(parse_load_cases("1000"), [1000])
+        self.assertIsNone(parse_load_cases("all"))
+
+        for selector in ["", "1-", "a", "10-1"]:
+            with self.subTest(selector=selector):
+                with self.assertRaises(RuntimeError):
+                    parse_load_cases(selector)
+
+
+class RunExtractionTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.output = TemporaryDirectory()
+        self.dll = MemoryDll(
+            generate_model(n_nodes=20, n_cables=6, load_cases=[1, 2, 5], n_groups=2)
+        )
+        self.dll.initialize()
+
+    def tearDown(self) -> None:
+        self.output.cleanup()
+
+    def extract(self, **kwargs) -> dict:  # type: ignore[no-untyped-def, type-arg]
+        return run_extraction(
+            ["models/MODEL.cdb"],
+            ["node_data", "cable_result"],
+            self.output.name,
+            file_format="npz",
+            dll=self.dll,
+            **kwargs
+        )
+
+    def test_partitions(self) -> None:
+        manifest = self.extract(columns={"cable_result": ["ELEM_ID", "AXIAL_FORCE"]})
+
+        self.assertEqual(
+            list(manifest["partitions"]),
+            [
+                "MODEL/cable_result/LC=1",
+                "MODEL/cable_result/LC=2",
+                "MODEL/cable_result/LC=5",
+                "MODEL/node_data/data"
+            ]
+        )
+
+        with load(Path(self.output.name) / "MODEL/cable_result/LC=5.npz") as data:
+            self.assertEqual(list(data), ["ELEM_ID", "AXIAL_FORCE"])
+            self.assertEqual(len(data["ELEM_ID"]), 6)
+
+        with load(Path(self.output.name) / "MODEL/node_data/data.npz") as data:
+            self.assertEqual(len(data["ID"]), 20)
+
+    def test_resume(self) -> None:
+        self.extract(load_cases=[1, 2])
+
+        path = Path(self.output.name) / "manifest.json"
+        manifest = loads(path.read_text(encoding="utf-8"))
+        del manifest["partitions"]["MODEL/cable_result/LC=2"]
+        path.write_text(dumps(manifest), encoding="utf-8")
+        (Path(self.output.name) / "MODEL/cable_result/LC=2.npz").unlink()
+        (Path(self.output.name) / "MODEL/cable_result/LC=1.npz").unlink()
+
+        manifest = self.extract(load_cases=[1, 2], resume=True)
+        self.assertEqual(len(manifest["partitions"]), 3)
+        folder = Path(self.output.name) / "MODEL/cable_result"
+        self.assertTrue((folder / "LC=2.npz").exists())
+        self.assertFalse((folder / "LC=1.npz").exists())
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.extract(max_workers=2)
+
+        with self.assertRaises(LookupError):
+            run_extraction(["MODEL.cdb"], ["not_a_table"], self.output.name, [1])
+
+    def test_load_cases(self) -> None:
+        # load cases are listed from the keys 12/LC, whatever their numbers
+        self.dll = MemoryDll(
+            generate_model(n_nodes=20, n_cables=6, load_cases=[3, 100000, 250000])
+        )
+        self.dll.initialize()
+
+        manifest = self.extract()
+        self.assertEqual(
+            [_["load_case"] for _ in manifest["partitions"].values()],
+            [100000, 250000, 3, None]
+        )
+
+    def test_group_data(self) -> None:
+        class Hook(LoadHook):
+            def __init__(self) -> None:
+                super().__init__()
+                self.keys: list[tuple[int, int]] = []
+
+            def on_start(self, kwh: int, kwl: int) -> None:
+                self.keys.append((kwh, kwl))
+
+        hook = Hook()
+        self.dll.add_hook(hook)
+        manifest = run_extraction(
+            ["MODEL.cdb"],
+            ["cable_result"],
+            self.output.name,
+            file_format="npz",
+            dll=self.dll
+        )
+
+        self.assertEqual(len(manifest["partitions"]), 3)
+        self.assertEqual(hook.keys.count((11, 0)), 1)
+        with load(Path(self.output.name) / "MODEL/cable_result/LC=2.npz") as data:
+            self.assertEqual(data["LOAD_CASE"].tolist(), [2] * 6)
+
+    def test_array_columns(self) -> None:
+        self.dll = MemoryDll(generate_model(n_nodes=20, n_beams=4, n_stations=3))
+        self.dll.initialize()
+
+        run_extraction(
+            ["MODEL.cdb"],
+            ["beam_data"],
+            self.output.name,
+            file_format="npz",
+            dll=self.dll
+        )
+        with load(Path(self.output.name) / "MODEL/beam_data/data.npz") as data:
+            self.assertEqual(data["STATION"].shape, (4, 3))
+            self.assertEqual(data["TRANS_MATRIX"].shape, (4, 3, 3))
+
+
+class ToArraysTestSuite(TestCase):
+    def test_columns(self) -> None:
+        arrays = _to_arrays(
+            DataFrame(
+                {
+                    "ID": [1, 2],
+                    "NAME": ["A", "B"],
+                    "STATION": [array([0.0, 1.0]), array([0.0, 0.5, 1.0])]
+                }
+            )
+        )
+
+        self.assertEqual(list(arrays), ["ID", "NAME", "STATION_OFFSETS", "STATION"])
+        self.assertEqual(arrays["NAME"].tolist(), ["A", "B"])
+        self.assertEqual(arrays["STATION_OFFSETS"].tolist(), [0, 2, 5])
+        assert_allclose(arrays["STATION"], [0.0, 1.0, 0.0, 0.5, 1.0])
+
+        with self.assertRaises(RuntimeError):
+            _to_arrays(DataFrame({"STATION": [array([0.0, 1.0]), "A"]}))
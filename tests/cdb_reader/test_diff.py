@@ -0,0 +1,108 @@
+# standard library imports
+from unittest import TestCase
+
+# third party library imports
+from numpy import nan
+from pandas import DataFrame
+
+# local library specific imports
+from py_sofistik_utils import diff_frames, diff_tables
+from . import open_model
+
+
+class DiffFramesTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.first = DataFrame(
+            {
+                "LOAD_CASE":    [1, 1, 1, 2],
+                "GROUP":        [1, 1, 2, 1],
+                "ELEM_ID":      [11, 12, 21, 11],
+                "N":            [10.0, 20.0, 30.0, nan],
+                "M":            [1.0, 2.0, 3.0, 4.0]
+            }
+        )
+
+    def test_tolerances(self) -> None:
+        second = self.first.copy()
+        second["N"] = [10.0, 20.1, 31.0, nan]
+
+        with self.subTest(msg="Exact"):
+            diff = diff_frames(self.first, second)
+            self.assertEqual(diff.differences["ELEM_ID"].tolist(), [12, 21])
+            self.assertEqual(diff.differences["DELTA"].round(6).tolist(), [0.1, 1.0])
+
+        with self.subTest(msg="Absolute"):
+            diff = diff_frames(self.first, second, atol=0.5)
+            self.assertEqual(diff.differences["ELEM_ID"].tolist(), [21])
+
+        with self.subTest(msg="Relative"):
+            diff = diff_frames(self.first, second, rtol=0.05)
+            self.assertFalse(diff.has_differences())
+
+        with self.subTest(msg="Summary"):
+            summary = diff_frames(self.first, second).summary
+            self.assertEqual(summary["GROUP"].tolist(), [1, 2, 1, 2])
+            self.assertEqual(summary["COLUMN"].tolist(), ["N", "N", "M", "M"])
+            self.assertEqual(summary["COMPARED"].tolist(), [3, 1, 3, 1])
+            self.assertEqual(summary["DIFFERENT"].tolist(), [1, 1, 0, 0])
+            self.assertAlmostEqual(summary["MAX_ABS_DELTA"].iloc[1], 1.0)
+
+    def test_alignment(self) -> None:
+        second = self.first.iloc[[3, 2, 0]].copy()
+        second.loc[0, "N"] = nan
+
+        diff = diff_frames(self.first, second)
+        self.assertEqual(
+            diff.only_first.to_dict("list"),
+            {"LOAD_CASE": [1], "ELEM_ID": [12]}
+        )
+        self.assertTrue(diff.only_second.empty)
+        self.assertEqual(diff.differences["COLUMN"].tolist(), ["N"])
+
+    def test_invalid_keys(self) -> None:
+        with self.assertRaises(RuntimeError):
+            diff_frames(self.first, self.first, keys=["LOAD_CASE"])
+
+        with self.assertRaises(LookupError):
+            diff_frames(self.first, self.first, columns=["NOT_A_COLUMN"])
+
+
+class DiffTablesTestSuite(TestCase):
+    def test_revisions(self) -> None:
+        readers = [
+            open_model(self, name, n_nodes=40, n_cables=20, n_groups=2, seed=seed)
+            for name, seed in [("FIRST", 0), ("SECOND", 1)]
+        ]
+        for reader in readers:
+            reader.load_table("cable_result", 1)
+
+        with self.subTest(msg="Same"):
+            diff = diff_tables(readers[0], readers[0], "cable_result")
+            self.assertFalse(diff.has_differences())
+
+        with self.subTest(msg="Different"):
+            diff = diff_tables(readers[0], readers[1], "cable_result", ["AXIAL_FORCE"])
+            self.assertEqual(len(diff.differences), 20)
+            self.assertEqual(diff.summary["GROUP"].tolist(), [1, 2])
+
+    def test_beam_data(self) -> None:
+        # STATION holds the station arrays of each beam and is not a key
+        readers = [
+            open_model(self, name, n_nodes=20, n_beams=6, n_groups=2)
+            for name in ["FIRST", "SECOND"]
+        ]
+        for reader in readers:
+            reader.load_table("beam_data")
+
+        diff = diff_tables(readers[0], readers[1], "beam_data")
+        self.assertFalse(diff.has_differences())
+        self.assertIn("LENGTH", diff.summary["COLUMN"].tolist())
+
+        second = readers[1].table_data("beam_data").copy()
+        second.loc[2, "LENGTH"] += 1.0
+        diff = diff_frames(readers[0].table_data("beam_data"), second)
+        self.assertEqual(diff.differences["ELEM_ID"].tolist(), [second["ELEM_ID"][2]])
+        self.assertEqual(diff.differences["COLUMN"].tolist(), ["LENGTH"])
+
+        with self.assertRaises(RuntimeError):
+            diff_frames(second, second, keys=["ELEM_ID", "STATION"])
@@ -0,0 +1,84 @@
+# standard library imports
+from unittest import TestCase
+
+# third party library imports
+
+# local library specific imports
+from py_sofistik_utils.cdb_reader._internals.group_lc_data import map_element_groups
+from . import open_model
+
+
+class GroupLCDataTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.cdb = open_model(
+            self,
+            "GROUPS",
+            n_nodes=20,
+            n_beams=6,
+            n_trusses=4,
+            load_cases=[1, 2],
+            n_groups=2,
+            n_secondary_groups=2
+        )
+        self.cdb.grp_lc_data.load(1)
+        self.cdb.sec_grp_lc_data.load(1)
+
+    def test_lookups(self) -> None:
+        groups = self.cdb.grp_lc_data
+
+        self.assertEqual(groups.get_active_groups(1), [1, 2])
+        self.assertEqual(groups.get_beam_id_range(1, 2), range(21, 24))
+        self.assertEqual(groups.get_truss_id_range(1, 1), range(11, 13))
+        self.assertEqual(groups.get_cable_id_range(1, 1), range(0))
+        self.assertTrue(groups.group_is_active(1, 1))
+
+        with self.assertRaises(RuntimeError):
+            groups.get_beam_id_range(1, 3)
+
+        with self.assertRaises(RuntimeError):
+            groups.get_active_groups(2)
+
+        groups.clear(1)
+        with self.assertRaises(RuntimeError):
+            groups.group_is_active(1, 1)
+
+    def test_secondary_lookups(self) -> None:
+        groups = self.cdb.sec_grp_lc_data
+
+        self.assertEqual(groups.get_active_groups(1), ["S000", "S001"])
+        self.assertEqual(groups.get_beam_id_range(1, "s000"), range(11, 14))
+        self.assertEqual(groups.get_beam_id_range(1, "S999"), range(0))
+
+        with self.assertRaises(RuntimeError):
+            groups.group_is_active(1, "S999")
+
+    def test_element_groups(self) -> None:
+        ids = [22, 11, 5, 13, 24, 23]
+
+        self.assertEqual(
+            self.cdb.grp_lc_data.get_element_groups(1, ids, "beam").tolist(),
+            [2, 1, 0, 1, 0, 2]
+        )
+        self.assertEqual(
+            self.cdb.grp_lc_data.get_element_groups(1, ids, "quad", -1).tolist(),
+            [-1] * 6
+        )
+        self.assertEqual(
+            self.cdb.sec_grp_lc_data.get_element_groups(1, ids, "beam").tolist(),
+            ["S001", "S000", "", "S000", "", "S001"]
+        )
+
+        with self.assertRaises(LookupError):
+            self.cdb.grp_lc_data.get_element_groups(1, ids, "plate")
+
+    def test_overlapping_ranges(self) -> None:
+        groups = {
+            1: [1, 1, 10, 20, 11] + [0] * 12 + [True],
+            2: [1, 2, 15, 30, 16] + [0] * 12 + [True],
+            3: [1, 3, 16, 17, 2] + [0] * 12 + [False]
+        }
+
+        self.assertEqual(
+            map_element_groups(groups, [9, 10, 14, 15, 16, 30, 31], "beam", 0).tolist(),
+            [0, 1, 1, 2, 2, 2, 0]
+        )
@@ -0,0 +1,92 @@
+# standard library imports
+from os import environ
+from unittest import skipUnless, TestCase
+
+# third party library imports
+
+# local library specific imports
+from py_sofistik_utils import CancellationToken, LoadHook, SOFiSTiKCDBReader
+
+
+CDB_PATH = environ.get("SOFISTIK_CDB_PATH")
+DLL_PATH = environ.get("SOFISTIK_DLL_PATH")
+VERSION = environ.get("SOFISTIK_VERSION")
+
+
+class _RecordingHook(LoadHook):
+    def __init__(self, batch_size: int = 1000) -> None:
+        super().__init__(batch_size)
+        self.events: list[tuple[str, int, int, int]] = []
+
+    def on_batch(self, kwh: int, kwl: int, records: int, elapsed: float) -> None:
+        self.events.append(("batch", kwh, kwl, records))
+
+    def on_end(self, kwh: int, kwl: int, records: int, elapsed: float) -> None:
+        self.events.append(("end", kwh, kwl, records))
+
+    def on_start(self, kwh: int, kwl: int) -> None:
+        self.events.append(("start", kwh, kwl, 0))
+
+
+class LoadHookTestSuite(TestCase):
+    def test_invalid_batch_size(self) -> None:
+        with self.assertRaises(RuntimeError):
+            LoadHook(0)
+
+    def test_cancellation_token(self) -> None:
+        token = CancellationToken()
+        token.on_start(162, 1000)
+        token.on_batch(162, 1000, 1000, 0.0)
+
+        token.cancel()
+        self.assertTrue(token.is_cancelled())
+        with self.assertRaises(RuntimeError):
+            token.on_batch(162, 1000, 2000, 0.0)
+
+        token.reset()
+        token.on_start(162, 1000)
+
+
+@skipUnless(
+    all([CDB_PATH, DLL_PATH, VERSION]),
+    "SOFiSTiK environment variables not set!"
+)
+class SOFiSTiKCDBReaderHooksTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.cdb = SOFiSTiKCDBReader(
+            CDB_PATH,  # type: ignore
+            "CABLE_RESULT",
+            DLL_PATH,  # type: ignore
+            int(VERSION)  # type: ignore
+        )
+        self.cdb.initialize()
+
+    def tearDown(self) -> None:
+        self.cdb.close()
+
+    def test_events(self) -> None:
+        hook = _RecordingHook(batch_size=1)
+        self.cdb.add_hook(hook)
+        self.cdb.cable.result.load(1000)
+        self.cdb.remove_hook(hook)
+
+        self.assertEqual(hook.events[0], ("start", 162, 1000, 0))
+        end = [_ for _ in hook.events if _[0] == "end" and _[1] == 162]
+        self.assertEqual(len(end), 1)
+
+        batches = [_ for _ in hook.events if _[0] == "batch" and _[1] == 162]
+        self.assertEqual(len(batches), end[0][3])
+
+        with self.subTest(msg="Removed"):
+            with self.assertRaises(LookupError):
+                self.cdb.remove_hook(hook)
+
+    def test_cancellation(self) -> None:
+        token = CancellationToken(batch_size=1)
+        token.cancel()
+        self.cdb.add_hook(token)
+
+        with self.assertRaises(RuntimeError):
+            self.cdb.cable.result.load(1000)
+
+        self.cdb.remove_hook(token)
@@ -0,0 +1,118 @@
+# standard library imports
+from os import environ
+from unittest import skipUnless, TestCase
+
+# third party library imports
+
+# local library specific imports
+from py_sofistik_utils import SOFiSTiKCDBReader
+from py_sofistik_utils.cdb_reader._internals.instrumentation import _Instrumentation
+
+
+CDB_PATH = environ.get("SOFISTIK_CDB_PATH")
+DLL_PATH = environ.get("SOFISTIK_DLL_PATH")
+VERSION = environ.get("SOFISTIK_VERSION")
+
+
+class InstrumentationTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.instrumentation = _Instrumentation()
+
+    def test_disabled(self) -> None:
+        with self.instrumentation.phase(160, 0, "read"):
+            pass
+
+        self.assertTrue(self.instrumentation.report().empty)
+
+    def test_report(self) -> None:
+        self.instrumentation.set_enabled(True)
+
+        with self.instrumentation.phase(160, 1000, "read"):
+            self.instrumentation.add_get(160, 1000, 0, 120, 0.0)
+            self.instrumentation.add_get(160, 1000, 0, 120, 0.0)
+            self.instrumentation.add_get(160, 1000, 2, 0, 0.0)
+        with self.instrumentation.phase(160, -1, "group"):
+            pass
+
+        report = self.instrumentation.report()
+        self.assertEqual(report["KWL"].to_list(), [-1, 1000])
+
+        row = report.iloc[1]
+        with self.subTest(msg="Counters"):
+            self.assertEqual(row["GET_CALLS"], 3)
+            self.assertEqual(row["RECORDS"], 2)
+            self.assertEqual(row["BYTES"], 240)
+
+        with self.subTest(msg="Times"):
+            self.assertGreaterEqual(row["DECODE_TIME"], 0.0)
+            self.assertAlmostEqual(
+                row["TOTAL_TIME"],
+                row[["FFI_TIME", "DECODE_TIME", "GROUP_TIME", "FRAME_TIME",
+                     "MERGE_TIME"]].sum()
+            )
+
+        self.instrumentation.clear()
+        self.assertTrue(self.instrumentation.report().empty)
+
+    def test_memory(self) -> None:
+        self.instrumentation.set_enabled(True, memory=True)
+
+        with self.instrumentation.phase(162, 1000, "read"):
+            retained = bytearray(1_000_000)
+        with self.instrumentation.phase(162, 1000, "frame"):
+            temporary = bytearray(4_000_000)
+            del temporary
+
+        self.instrumentation.set_enabled(False)
+        row = self.instrumentation.report().iloc[0]
+
+        with self.subTest(msg="Phases"):
+            self.assertGreaterEqual(row["READ_PEAK_MEMORY"], 1_000_000)
+            self.assertGreaterEqual(row["FRAME_PEAK_MEMORY"], 4_000_000)
+            self.assertEqual(row["GROUP_PEAK_MEMORY"], 0)
+
+        with self.subTest(msg="Key"):
+            self.assertGreaterEqual(row["PEAK_MEMORY"], 5_000_000)
+            self.assertGreaterEqual(row["RETAINED_MEMORY"], 1_000_000)
+            self.assertLess(row["RETAINED_MEMORY"], 2_000_000)
+
+        del retained
+
+    def test_invalid_phase(self) -> None:
+        self.instrumentation.set_enabled(True)
+        with self.assertRaises(ValueError):
+            self.instrumentation.phase(160, 0, "non_existing_phase")
+
+
+@skipUnless(
+    all([CDB_PATH, DLL_PATH, VERSION]),
+    "SOFiSTiK environment variables not set!"
+)
+class SOFiSTiKCDBReaderInstrumentationTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.cdb = SOFiSTiKCDBReader(
+            CDB_PATH,  # type: ignore
+            "CABLE_RESULT",
+            DLL_PATH,  # type: ignore
+            int(VERSION)  # type: ignore
+        )
+        self.cdb.initialize()
+
+    def tearDown(self) -> None:
+        self.cdb.close()
+
+    def test_report(self) -> None:
+        self.cdb.set_instrumentation(True)
+        self.cdb.cable.result.load(1000)
+        self.cdb.set_instrumentation(False)
+
+        report = self.cdb.get_instrumentation_report()
+        row = report[(report["KWH"] == 162) & (report["KWL"] == 1000)]
+        self.assertEqual(len(row), 1)
+        self.assertGreater(row["RECORDS"].item(), 0)
+        self.assertGreater(row["BYTES"].item(), 0)
+
+        with self.subTest(msg="Disabled"):
+            self.cdb.clear_instrumentation()
+            self.cdb.cable.result.load(1000)
+            self.assertTrue(self.cdb.get_instrumentation_report().empty)
@@ -0,0 +1,190 @@
+# standard library imports
+from contextlib import redirect_stdout
+from ctypes import byref, c_int, sizeof
+from io import StringIO
+from unittest import TestCase
+
+# third party library imports
+from numpy import dtype, zeros
+
+# local library specific imports
+from py_sofistik_utils import MemoryCDB, MemoryDll
+from py_sofistik_utils.cdb_reader._internals.sofistik_dll import _LAST_OPENED
+from py_sofistik_utils.cdb_reader._internals.sofistik_classes import (
+    CBEAM,
+    CBEAM_SCT,
+    CNODE
+)
+
+
+class MemoryDllTestSuite(TestCase):
+    def setUp(self) -> None:
+        nodes = zeros(3, dtype=dtype(CNODE))
+        nodes["m_nr"] = [1, 2, 3]
+
+        self.cdb = MemoryCDB()
+        self.cdb.add_records(20, 0, nodes)
+        self.cdb.add_records(100, 0, [CBEAM(m_nr=7), CBEAM_SCT(m_nq=4, m_x=1.5)])
+
+        self.dll = MemoryDll(self.cdb)
+        self.dll.initialize()
+        self.dll.open_cdb("MEMORY", 93)
+
+    def test_index(self) -> None:
+        self.assertEqual(self.dll.index, 1)
+        self.assertEqual(_LAST_OPENED[id(self.dll._dll)], 1)
+
+    def test_key_exist(self) -> None:
+        self.assertTrue(self.dll.key_exist(20, 0))
+        self.assertFalse(self.dll.key_exist(20, 1))
+
+    def test_get_keys(self) -> None:
+        self.cdb.add_records(12, 100000, zeros(1, dtype=dtype(CNODE)))
+        self.assertEqual(self.dll.get_keys(), [(12, 100000), (20, 0), (100, 0)])
+        self.assertEqual(self.dll.get_keys(100), [(100, 0)])
+
+    def test_get(self) -> None:
+        node = CNODE()
+        length = c_int(sizeof(node))
+
+        ids: list[int] = []
+        for pos in [0, 1, -1, 1]:
+            self.assertEqual(
+                self.dll.get(1, 20, 0, byref(node), byref(length), pos),
+                0
+            )
+            ids.append(node.m_nr)
+        self.assertEqual(ids, [1, 2, 2, 3])
+
+        with self.subTest(msg="End of key"):
+            self.assertEqual(self.dll.get(1, 20, 0, byref(node), byref(length), 1), 2)
+
+        with self.subTest(msg="Missing key"):
+            self.assertEqual(self.dll.get(1, 20, 1, byref(node), byref(length), 0), 3)
+
+    def test_records_of_different_types(self) -> None:
+        beam = CBEAM()
+        beam_sct = CBEAM_SCT()
+        length = c_int(sizeof(beam))
+
+        self.dll.get(1, 100, 0, byref(beam), byref(length), 0)
+        self.assertEqual(beam.m_nr, 7)
+
+        # the section record is shorter than CBEAM and starts with m_id = 0
+        length = c_int(sizeof(beam))
+        self.dll.get(1, 100, 0, byref(beam), byref(length), 1)
+        self.assertEqual(beam.m_nr, 0)
+        self.assertEqual(length.value, sizeof(beam_sct))
+
+        length = c_int(sizeof(beam_sct))
+        self.dll.get(1, 100, 0, byref(beam_sct), byref(length), -1)
+        self.assertEqual(beam_sct.m_nq, 4)
+        self.assertEqual(beam_sct.m_x, 1.5)
+
+        with self.subTest(msg="Truncated record"):
+            length = c_int(4)
+            self.assertEqual(
+                self.dll.get(1, 100, 0, byref(beam), byref(length), 0),
+                1
+            )
+
+
+class SharedMemoryDllTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.cdbs = [MemoryCDB(), MemoryCDB()]
+        self.cdbs[0].add_records(20, 0, zeros(2, dtype=dtype(CNODE)))
+        self.cdbs[1].add_records(24, 1, zeros(2, dtype=dtype(CNODE)))
+        self.cdbs[1].add_buffer(24, 2, b"", [])
+
+        self.dlls = [MemoryDll(_, shared=True) for _ in self.cdbs]
+        for dll, name in zip(self.dlls, ["FIRST", "SECOND"]):
+            dll.initialize()
+            dll.open_cdb(name)
+
+    def tearDown(self) -> None:
+        with redirect_stdout(StringIO()):
+            for dll in self.dlls:
+                dll.close()
+
+    def test_indices(self) -> None:
+        self.assertIs(self.dlls[0]._dll, self.dlls[1]._dll)
+        self.assertNotEqual(self.dlls[0].index, self.dlls[1].index)
+
+        node = CNODE()
+        length = c_int(sizeof(node))
+        for dll, key, other in zip(self.dlls, [(20, 0), (24, 1)], [(24, 1), (20, 0)]):
+            with self.subTest(index=dll.index):
+                self.assertEqual(
+                    dll.get(dll.index, *key, byref(node), byref(length), 0), 0
+                )
+                self.assertEqual(
+                    dll.get(dll.index, *other, byref(node), byref(length), 0), 3
+                )
+
+    def test_key_probe(self) -> None:
+        # sof_cdb_kexist applies to the second file, the first one is probed
+        for dll, key, exists in [
+                (self.dlls[0], (20, 0), True),
+                (self.dlls[0], (24, 1), False),
+                (self.dlls[1], (24, 1), True),
+                (self.dlls[1], (24, 2), False),
+                (self.dlls[1], (20, 0), False)
+        ]:
+            with self.subTest(index=dll.index, key=key):
+                self.assertEqual(dll.key_exist(*key), exists)
+
+    def test_close_order(self) -> None:
+        library = self.dlls[0]._dll
+        first, second = self.dlls[0].index, self.dlls[1].index
+
+        with redirect_stdout(StringIO()):
+            self.dlls[1].close()
+        self.assertEqual(self.dlls[1].index, 0)
+        self.assertEqual(library.sof_cdb_status(first), 3)
+        self.assertEqual(library.sof_cdb_status(second), 0)
+        self.assertTrue(self.dlls[0].key_exist(20, 0))
+
+        # closing again, i.e. sof_cdb_close(0), must not close the other file
+        self.dlls[1].close()
+        self.assertEqual(library.sof_cdb_status(first), 3)
+
+        with redirect_stdout(StringIO()):
+            self.dlls[0].close()
+        self.assertEqual(library.sof_cdb_status(first), 0)
+
+    def test_close_echo(self) -> None:
+        for dll, echo_level in zip(self.dlls, [0, 1]):
+            dll.set_echo_level(echo_level)
+            with self.subTest(echo_level=echo_level):
+                for expected in [echo_level > 0, False]:
+                    with redirect_stdout(StringIO()) as output:
+                        dll.close()
+                    self.assertEqual(bool(output.getvalue()), expected)
+
+
+class MemoryCDBTestSuite(TestCase):
+    def test_invalid_buffer(self) -> None:
+        with self.assertRaises(RuntimeError):
+            MemoryCDB().add_buffer(20, 0, bytes(10), [4, 4])
+
+    def test_lazy_keys(self) -> None:
+        calls: list[int] = []
+
+        def factory(kwl: int):  # type: ignore[no-untyped-def]
+            def build() -> tuple[bytes, list[int]]:
+                calls.append(kwl)
+                return bytes(8), [4, 4]
+            return build
+
+        cdb = MemoryCDB(cache_size=1)
+        cdb.add_lazy(24, 1, factory(1))
+        cdb.add_lazy(24, 2, factory(2))
+        self.assertEqual(cdb.keys(), [(24, 1), (24, 2)])
+        self.assertEqual(calls, [])
+
+        for kwl in [1, 1, 2, 1]:
+            self.assertEqual(cdb.records(24, kwl)[1].tolist(), [0, 4, 8])
+        self.assertEqual(calls, [1, 2, 1])
+
+        with self.assertRaises(LookupError):
+            cdb.records(24, 3)
@@ -0,0 +1,101 @@
+# standard library imports
+from unittest import TestCase
+
+# third party library imports
+from numpy import arange, sqrt
+from numpy.random import default_rng
+from numpy.testing import assert_allclose
+
+# local library specific imports
+from py_sofistik_utils.cdb_reader import _NodeIndex
+from . import open_model
+
+
+class NodeIndexTestSuite(TestCase):
+    def setUp(self) -> None:
+        rng = default_rng(0)
+        self.ids = arange(1, 801) * 3
+        self.coordinates = rng.random((800, 3)) * [100.0, 40.0, 10.0]
+        # a flat cluster, e.g. a slab, next to the scattered nodes
+        self.coordinates[:200, 2] = 5.0
+        self.index = _NodeIndex(self.ids, self.coordinates)
+        self.points = rng.random((300, 3)) * [160.0, 100.0, 70.0] - [30.0, 30.0, 30.0]
+
+    def _get_distances(self):  # type: ignore[no-untyped-def]
+        return ((self.points[:, None] - self.coordinates[None]) ** 2).sum(axis=2)
+
+    def test_nearest(self) -> None:
+        distances = self._get_distances()
+        ids, nearest = self.index.nearest(self.points)
+
+        assert_allclose(nearest, sqrt(distances.min(axis=1)))
+        self.assertEqual(ids.tolist(), self.ids[distances.argmin(axis=1)].tolist())
+
+        with self.assertRaises(RuntimeError):
+            _NodeIndex([], []).nearest([0.0, 0.0, 0.0])
+
+    def test_nearest_off_model(self) -> None:
+        # points far above and beside the model, more than a chunk of them, the
+        # farthest ones compared with all the nodes
+        rng = default_rng(1)
+        self.points = rng.random((600, 3)) * [100.0, 40.0, 0.0]
+        self.points[:200, 2] = 500.0
+        self.points[200:400, 0] += 2000.0
+        self.points[400:, 2] = -1E6
+        distances = self._get_distances()
+        ids, nearest = self.index.nearest(self.points)
+
+        assert_allclose(nearest, sqrt(distances.min(axis=1)))
+        self.assertEqual(ids.tolist(), self.ids[distances.argmin(axis=1)].tolist())
+
+    def test_within_radius(self) -> None:
+        distances = self._get_distances()
+        radius = arange(300) % 10 + 0.5
+        found = self.index.within_radius(self.points, radius)
+
+        self.assertEqual(len(found), 300)
+        for i, ids in enumerate(found):
+            self.assertEqual(
+                sorted(ids.tolist()), self.ids[distances[i] <= radius[i] ** 2].tolist()
+            )
+
+    def test_within_box(self) -> None:
+        upper = self.points + 15.0
+        found = self.index.within_box(self.points, upper)
+
+        for i, ids in enumerate(found):
+            is_inside = (
+                (self.coordinates >= self.points[i]) & (self.coordinates <= upper[i])
+            ).all(axis=1)
+            self.assertEqual(sorted(ids.tolist()), self.ids[is_inside].tolist())
+
+        self.assertEqual(
+            [_.tolist() for _ in _NodeIndex([], []).within_box([0.0] * 3, [1.0] * 3)],
+            [[]]
+        )
+
+    def test_cell_size(self) -> None:
+        index = _NodeIndex(self.ids, self.coordinates, cell_size=100.0)
+        assert_allclose(index.nearest(self.points)[1], self.index.nearest(self.points)[1])
+
+        with self.assertRaises(RuntimeError):
+            _NodeIndex(self.ids, self.coordinates, cell_size=0.0)
+
+
+class NodesSpatialIndexTestSuite(TestCase):
+    def test_get_spatial_index(self) -> None:
+        cdb = open_model(self, "NODES", n_nodes=50, load_cases=[1])
+
+        index = cdb.nodes.get_spatial_index()
+        coordinates = cdb.nodes.data.get_all_coordinates()
+        self.assertEqual(len(index), 50)
+
+        ids, distances = index.nearest(coordinates[["X0", "Y0", "Z0"]].to_numpy())
+        self.assertEqual(ids.tolist(), coordinates["ID"].tolist())
+        assert_allclose(distances, 0.0)
+
+        deflected = cdb.nodes.get_spatial_index(1)
+        configuration = cdb.nodes.get_deflected_configuration(1)
+        ids, distances = deflected.nearest(configuration[["X", "Y", "Z"]].to_numpy())
+        self.assertEqual(ids.tolist(), configuration["ID"].tolist())
+        assert_allclose(distances, 0.0)
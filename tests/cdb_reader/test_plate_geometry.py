@@ -0,0 +1,62 @@
+# standard library imports
+from unittest import TestCase
+
+# third party library imports
+from numpy import isnan, sqrt
+from numpy.testing import assert_allclose
+
+# local library specific imports
+from py_sofistik_utils.cdb_reader import _PlateGeometry
+from . import open_model
+
+
+class PlateGeometryTestSuite(TestCase):
+    def setUp(self) -> None:
+        # a 2 x 1 rectangle, a right triangle with N3 == N4 and a collapsed quad
+        self.geometry = _PlateGeometry.from_nodes(
+            [1, 2, 3],
+            [[10, 20, 30, 40], [10, 20, 40, 40], [10, 10, 10, 10]],
+            [40, 30, 20, 10],
+            [[0.0, 1.0, 0.0], [2.0, 1.0, 0.0], [2.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+        )
+
+    def test_quad_and_triangle(self) -> None:
+        assert_allclose(self.geometry.areas, [2.0, 1.0, 0.0])
+        assert_allclose(
+            self.geometry.centroids[:2], [[1.0, 0.5, 0.0], [2 / 3, 1 / 3, 0.0]]
+        )
+        assert_allclose(self.geometry.normals[:2], [[0.0, 0.0, 1.0], [0.0, 0.0, 1.0]])
+        assert_allclose(self.geometry.diagonals[:2], [[sqrt(5), sqrt(5)], [1.0, sqrt(5)]])
+        self.assertTrue(self.geometry.diagonals.flags.c_contiguous)
+        assert_allclose(self.geometry.characteristic_sizes()[:2], [sqrt(2), 1.0])
+
+    def test_degenerate(self) -> None:
+        self.assertTrue(isnan(self.geometry.normals[2]).all())
+        assert_allclose(self.geometry.centroids[2], [0.0, 0.0, 0.0])
+
+        with self.assertRaises(RuntimeError):
+            _PlateGeometry.from_nodes(
+                [1], [[10, 20, 30, 50]], [10, 20, 30], [[0.0] * 3] * 3
+            )
+
+
+class PlateDataGeometryTestSuite(TestCase):
+    def test_get_geometry(self) -> None:
+        cdb = open_model(self, "QUADS", n_nodes=30, n_quads=8)
+        cdb.plate_data.load()
+
+        nodes = cdb.nodes.data
+        geometry = cdb.plate_data.get_geometry(nodes)
+        self.assertTrue(nodes.is_loaded())
+        self.assertEqual(len(geometry), 8)
+
+        # unit squares of the synthetic grid, in the XY plane
+        assert_allclose(geometry.areas, 1.0, rtol=1E-6)
+        assert_allclose(geometry.normals[:, 2], 1.0, rtol=1E-6)
+        assert_allclose(geometry.diagonals, sqrt(2.0), rtol=1E-6)
+
+        first = cdb.plate_data.get_element_connectivity(
+            int(geometry.elem_ids[0])
+        ).iloc[0, 1:].tolist()
+        coordinates = nodes.get_all_coordinates().set_index("ID").loc[first]
+        assert_allclose(geometry.centroids[0], coordinates.mean().to_numpy(), rtol=1E-6)
@@ -0,0 +1,110 @@
+# standard library imports
+from contextlib import redirect_stdout
+from io import StringIO
+from subprocess import run
+from sys import executable
+from unittest import TestCase
+
+# third party library imports
+
+# local library specific imports
+from py_sofistik_utils import generate_model, MemoryDll, SOFiSTiKCDBReader
+
+
+class SOFiSTiKCDBReaderLazyTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.cdb = SOFiSTiKCDBReader(
+            "",
+            "LAZY",
+            "",
+            dll=MemoryDll(generate_model(n_nodes=10, n_cables=4))
+        )
+        self.cdb.initialize()
+
+    def tearDown(self) -> None:
+        self.cdb.close()
+
+    def test_sub_readers(self) -> None:
+        self.assertNotIn("cable", vars(self.cdb))
+
+        cable = self.cdb.cable
+        self.assertIs(self.cdb.cable, cable)
+        self.assertNotIn("result", vars(cable))
+
+        cable.data.load()
+        self.assertEqual(cable.data.get(11, "L0"), self.cdb.cable.data.get(11, "L0"))
+
+    def test_clear(self) -> None:
+        self.cdb.clear()
+        self.assertNotIn("cable", vars(self.cdb))
+        self.assertNotIn("nodes", vars(self.cdb))
+
+        self.cdb.cable.data.load()
+        self.cdb.clear()
+        self.assertTrue(self.cdb.cable.data.data().empty)
+
+    def test_import(self) -> None:
+        code = (
+            "import sys\n"
+            "import py_sofistik_utils\n"
+            "reader = py_sofistik_utils.SOFiSTiKCDBReader('', 'LAZY', '')\n"
+            "reader.load_case\n"
+            "print('pandas' in sys.modules)\n"
+        )
+        output = run([executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), "False")
+
+
+class SOFiSTiKCDBReaderSideBySideTestSuite(TestCase):
+    def test_interleaved_loads(self) -> None:
+        readers = [
+            SOFiSTiKCDBReader(
+                "",
+                name,
+                "",
+                dll=MemoryDll(generate_model(n_nodes=10, n_cables=n_cables, seed=seed))
+            )
+            for name, n_cables, seed in [("FIRST", 4, 0), ("SECOND", 6, 1)]
+        ]
+        for reader in readers:
+            reader.initialize()
+
+        for reader in readers:
+            reader.cable.data.load()
+
+        self.assertEqual(len(readers[0].cable.data.data()), 4)
+        self.assertEqual(len(readers[1].cable.data.data()), 6)
+
+        for reader in readers:
+            reader.close()
+
+    def test_shared_handle(self) -> None:
+        readers = [
+            SOFiSTiKCDBReader(
+                "",
+                name,
+                "",
+                dll=MemoryDll(
+                    generate_model(n_nodes=10, n_cables=n_cables, seed=seed),
+                    shared=True
+                )
+            )
+            for name, n_cables, seed in [("FIRST", 4, 0), ("SECOND", 6, 1)]
+        ]
+        for reader in readers:
+            reader.initialize()
+
+        self.assertIs(readers[0]._dll._dll, readers[1]._dll._dll)
+        self.assertNotEqual(readers[0]._dll.index, readers[1]._dll.index)
+
+        # the first reader is closed first, the second one keeps its file open
+        readers[0].cable.data.load()
+        with redirect_stdout(StringIO()):
+            readers[0].close()
+        readers[1].cable.data.load()
+
+        self.assertEqual(len(readers[0].cable.data.data()), 4)
+        self.assertEqual(len(readers[1].cable.data.data()), 6)
+
+        with redirect_stdout(StringIO()):
+            readers[1].close()
@@ -0,0 +1,226 @@
+# standard library imports
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from json import dumps, loads
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+# third party library imports
+from numpy import array, nan
+from pandas import DataFrame
+
+# local library specific imports
+from py_sofistik_utils import generate_model, LoadHook, MemoryDll, QueryService, serve
+from py_sofistik_utils.cdb_reader.service import _to_rows
+
+
+class _CountingHook(LoadHook):
+    def __init__(self) -> None:
+        super().__init__()
+        self.starts = 0
+
+    def on_start(self, kwh: int, kwl: int) -> None:
+        self.starts += 1
+
+
+class QueryServiceTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.hook = _CountingHook()
+        self.service = QueryService(dll_factory=self.dll)
+
+    def tearDown(self) -> None:
+        with redirect_stdout(StringIO()):
+            self.service.close()
+
+    def dll(self, cdb: str) -> MemoryDll:
+        dll = MemoryDll(
+            generate_model(n_nodes=20, n_cables=6, load_cases=[1, 2, 3], n_groups=2)
+        )
+        dll.add_hook(self.hook)
+        return dll
+
+    def test_results(self) -> None:
+        data = self.service.results(
+            "MODEL.cdb", "cable_result", [1, 3], ids=[11, 12], columns=["AXIAL_FORCE"]
+        )
+        self.assertEqual(
+            list(data.columns), ["LOAD_CASE", "GROUP", "ELEM_ID", "AXIAL_FORCE"]
+        )
+        self.assertEqual(data["LOAD_CASE"].tolist(), [1, 1, 3, 3])
+        self.assertEqual(
+            self.service.cached(),
+            [("MODEL.cdb", "cable_result", 1), ("MODEL.cdb", "cable_result", 3)]
+        )
+
+        with self.assertRaises(RuntimeError):
+            self.service.results("MODEL.cdb", "cable_result")
+
+        with self.assertRaises(LookupError):
+            self.service.results(
+                "MODEL.cdb", "cable_result", [1], columns=["NOT_A_COLUMN"]
+            )
+
+    def test_envelope(self) -> None:
+        data = self.service.results("MODEL.cdb", "cable_result", [1, 2, 3])
+        envelope = self.service.envelope(
+            "MODEL.cdb", "cable_result", [1, 2, 3], ["AXIAL_FORCE"]
+        )
+        self.assertEqual(len(envelope), 6)
+        self.assertEqual(
+            envelope["AXIAL_FORCE_MAX"].tolist(),
+            data.groupby("ELEM_ID")["AXIAL_FORCE"].max().tolist()
+        )
+
+    def test_group(self) -> None:
+        data = self.service.group("MODEL.cdb", "cable_data", 1)
+        self.assertFalse(data.empty)
+        self.assertTrue((data["GROUP"] == 1).all())
+
+    def test_coalescing(self) -> None:
+        with ThreadPoolExecutor(8) as executor:
+            frames = list(
+                executor.map(
+                    lambda _: self.service.results("MODEL.cdb", "cable_result", [2]),
+                    range(16)
+                )
+            )
+
+        starts = self.hook.starts
+        self.service.results("MODEL.cdb", "cable_result", [2])
+        self.assertEqual(self.hook.starts, starts)
+        self.assertTrue(all(_.equals(frames[0]) for _ in frames))
+        self.assertEqual(len(self.service.cached()), 1)
+
+    def test_cache_size(self) -> None:
+        self.service = QueryService(dll_factory=self.dll, cache_size=2)
+        self.service.results("MODEL.cdb", "cable_result", [1, 2, 3])
+        self.service.results("MODEL.cdb", "cable_result", [2])
+        self.service.results("MODEL.cdb", "cable_result", [1])
+
+        self.assertEqual(
+            self.service.cached(),
+            [("MODEL.cdb", "cable_result", 1), ("MODEL.cdb", "cable_result", 2)]
+        )
+
+    def test_root(self) -> None:
+        with TemporaryDirectory() as folder:
+            opened: list[str] = []
+
+            def dll(cdb: str) -> MemoryDll:
+                opened.append(cdb)
+                return self.dll(cdb)
+
+            self.service = QueryService(dll_factory=dll, root=folder)
+            self.service.group("models/../MODEL.cdb", "cable_data", 1)
+            self.service.group(str(Path(folder) / "MODEL.cdb"), "cable_data", 1)
+
+            self.assertEqual(opened, [str(Path(folder).resolve() / "MODEL.cdb")])
+            self.assertEqual(self.service.cached(), [("MODEL.cdb", "cable_data", None)])
+
+            for cdb in ["../MODEL.cdb", str(Path(folder).parent / "MODEL.cdb")]:
+                with self.subTest(cdb=cdb):
+                    with self.assertRaises(RuntimeError):
+                        self.service.group(cdb, "cable_data", 1)
+
+
+class ServeTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.service = QueryService(
+            dll_factory=lambda _: MemoryDll(
+                generate_model(n_nodes=20, n_cables=6, n_beams=2)
+            )
+        )
+        self.server = serve(self.service, port=0)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        with redirect_stdout(StringIO()):
+            self.service.close()
+
+    def post(self, body: dict) -> dict:  # type: ignore[type-arg]
+        request = Request(
+            f"{self.url}/query",
+            data=dumps(body).encode("UTF-8"),
+            headers={"Content-Type": "application/json"}
+        )
+        with urlopen(request, timeout=10) as response:
+            return loads(response.read())  # type: ignore[no-any-return]
+
+    def test_query(self) -> None:
+        response = self.post(
+            {
+                "query": "results",
+                "cdb": "MODEL.cdb",
+                "table": "cable_result",
+                "load_cases": [1],
+                "ids": [11],
+                "columns": ["AXIAL_FORCE"]
+            }
+        )
+        self.assertEqual(
+            response["columns"], ["LOAD_CASE", "GROUP", "ELEM_ID", "AXIAL_FORCE"]
+        )
+        self.assertEqual(len(response["data"]), 1)
+
+        with urlopen(f"{self.url}/status", timeout=10) as response:
+            self.assertEqual(
+                loads(response.read())["cached"], [["MODEL.cdb", "cable_result", 1]]
+            )
+
+    def test_errors(self) -> None:
+        with self.assertRaises(HTTPError) as context:
+            self.post({"query": "results", "cdb": "MODEL.cdb", "table": "not_a_table"})
+        self.assertEqual(context.exception.code, 400)
+        context.exception.close()
+
+        with self.assertRaises(HTTPError) as context:
+            self.post({"query": "results", "cdb": "../MODEL.cdb", "table": "cable_data"})
+        self.assertEqual(context.exception.code, 400)
+        context.exception.close()
+
+    def test_array_cells(self) -> None:
+        response = self.post(
+            {"query": "results", "cdb": "MODEL.cdb", "table": "beam_data"}
+        )
+        row = dict(zip(response["columns"], response["data"][0]))
+
+        self.assertIsInstance(row["ELEM_ID"], int)
+        self.assertIsInstance(row["GROUP"], int)
+        self.assertEqual(len(row["STATION"]), 3)
+        self.assertEqual(len(row["TRANS_MATRIX"]), 3)
+
+    def test_internal_error(self) -> None:
+        def fail(cdb: str) -> MemoryDll:
+            raise ZeroDivisionError("no model")
+
+        self.server.service = QueryService(dll_factory=fail)  # type: ignore[attr-defined]
+        with self.assertRaises(HTTPError) as context:
+            self.post({"query": "results", "cdb": "MODEL.cdb", "table": "cable_data"})
+        self.assertEqual(context.exception.code, 500)
+        self.assertIn("ZeroDivisionError", loads(context.exception.read())["error"])
+        context.exception.close()
+
+
+class ToRowsTestSuite(TestCase):
+    def test_conversion(self) -> None:
+        data = DataFrame(
+            {
+                "ELEM_ID": [101, 102],
+                "VALUE": [1.5, nan],
+                "STATION": [array([0.0, nan]), array([1.0])]
+            }
+        )
+        rows = _to_rows(data)
+
+        self.assertEqual(rows, [[101, 1.5, [0.0, None]], [102, None, [1.0]]])
+        self.assertIsInstance(rows[0][0], int)
+        self.assertEqual(loads(dumps(rows, allow_nan=False)), rows)
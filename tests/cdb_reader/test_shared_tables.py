@@ -0,0 +1,97 @@
+# standard library imports
+from concurrent.futures import ProcessPoolExecutor
+from gc import collect
+from pickle import dumps, loads
+from unittest import TestCase
+
+# third party library imports
+from numpy import arange, float64, frombuffer, ndarray, shares_memory
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+# local library specific imports
+from py_sofistik_utils import SharedTable, SharedTableHandle
+from py_sofistik_utils.cdb_reader.shared_tables import _PENDING_BLOCKS
+
+
+def _sum_coordinates(handle: SharedTableHandle) -> float:
+    with handle.attach() as view:
+        return float(view.data()[["X0", "Y0", "Z0"]].to_numpy().sum())
+
+
+class SharedTableTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.data = DataFrame(
+            {
+                "ID": arange(1, 1001),
+                "X0": arange(1000, dtype=float64),
+                "Y0": arange(1000, dtype=float64) * 2.0,
+                "Z0": arange(1000, dtype=float64) * 3.0,
+                "KFIX": ["PP"] * 1000,
+                "IS_USED": [True, False] * 500
+            }
+        )
+
+    def test_attach(self) -> None:
+        with SharedTable(self.data) as table:
+            handle = loads(dumps(table.handle()))
+            self.assertEqual(handle.columns, ["ID", "X0", "Y0", "Z0", "IS_USED"])
+            self.assertEqual(len(handle), 1000)
+
+            with handle.attach(index=["ID"]) as view:
+                data = view.data()
+                assert_frame_equal(
+                    data.reset_index(drop=True),
+                    self.data.drop(columns="KFIX")
+                )
+                self.assertEqual(data.index.name, "ID")
+
+                # the columns are backed by the shared memory, not copied
+                with self.subTest(msg="Zero-copy"):
+                    block = frombuffer(view._blocks[1].buf, dtype=float64)
+                    self.assertTrue(shares_memory(data["X0"].to_numpy(), block))
+
+                    ndarray(1000, dtype=float64, buffer=table._blocks[1].buf)[0] = 5.0
+                    self.assertEqual(data["X0"].iloc[0], 5.0)
+                    del block
+
+    def test_close_with_live_frame(self) -> None:
+        with SharedTable(self.data) as table:
+            view = table.handle().attach()
+            data = view.data()
+            view.close()
+
+            # the frame keeps its block mapped until it is released
+            self.assertEqual(data["X0"].sum(), self.data["X0"].sum())
+            self.assertEqual(len(_PENDING_BLOCKS), 5)
+
+            del data
+            collect()
+            with table.handle().attach() as view:
+                self.assertEqual(len(view.data()), 1000)
+            self.assertEqual(_PENDING_BLOCKS, [])
+
+    def test_invalid_columns(self) -> None:
+        with self.subTest(msg="Missing column"):
+            with self.assertRaises(LookupError):
+                SharedTable(self.data, ["NON-EXISTING"])
+
+        with self.subTest(msg="Not shareable column"):
+            with self.assertRaises(RuntimeError):
+                SharedTable(self.data, ["KFIX"])
+
+    def test_empty_table(self) -> None:
+        with SharedTable(self.data[0:0]) as table:
+            with table.handle().attach() as view:
+                self.assertTrue(view.data().empty)
+
+    def test_worker_processes(self) -> None:
+        expected = float(self.data[["X0", "Y0", "Z0"]].to_numpy().sum())
+
+        with SharedTable(self.data) as table:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                results = list(
+                    executor.map(_sum_coordinates, [table.handle()] * 4)
+                )
+
+        self.assertEqual(results, [expected] * 4)
@@ -0,0 +1,53 @@
+# standard library imports
+from contextlib import nullcontext
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+# third party library imports
+
+# local library specific imports
+from py_sofistik_utils.cdb_reader._internals.sofistik_dll import (
+    clear_dll_cache,
+    SofDll
+)
+
+
+class SofDllHandleCacheTestSuite(TestCase):
+    def setUp(self) -> None:
+        clear_dll_cache()
+        self.folder = TemporaryDirectory()
+        for file in ["libmmd.dll", "libifcoremd.dll", "sof_cdb_w-2023.dll"]:
+            (Path(self.folder.name) / file).touch()
+
+    def tearDown(self) -> None:
+        clear_dll_cache()
+        self.folder.cleanup()
+
+    def test_shared_handle(self) -> None:
+        with (
+            patch("os.add_dll_directory", return_value=nullcontext(), create=True),
+            patch("ctypes.cdll.LoadLibrary", side_effect=lambda _: object()) as load
+        ):
+            first = SofDll(self.folder.name, version=2023)
+            second = SofDll(self.folder.name + "/", version=2023)
+            first.load_dll()
+            second.load_dll()
+
+            self.assertEqual(load.call_count, 1)
+            self.assertIs(first._dll, second._dll)
+
+            with self.subTest(msg="Cleared"):
+                clear_dll_cache()
+                SofDll(self.folder.name, version=2023).load_dll()
+                self.assertEqual(load.call_count, 2)
+
+    def test_missing_files(self) -> None:
+        (Path(self.folder.name) / "libmmd.dll").unlink()
+        with self.assertRaises(RuntimeError):
+            SofDll(self.folder.name, version=2023).load_dll()
+
+        with self.subTest(msg="Not cached"):
+            (Path(self.folder.name) / "libmmd.dll").touch()
+            self.assertTrue(SofDll._check_files(self.folder.name, ["libmmd.dll"]))
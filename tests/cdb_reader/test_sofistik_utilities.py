@@ -5,10 +5,14 @@ from unittest import TestCase
 
 # local library specific imports
 from py_sofistik_utils.cdb_reader._internals.sofistik_utilities import (
+    decode_beam_end_release,
+    decode_beam_end_releases,
     decode_cdb_status,
     decode_nodal_boundary_condition,
+    decode_nodal_boundary_conditions,
     get_element_type,
     long_to_str,
+    longs_to_str
 )
 
 
@@ -36,6 +40,20 @@ class SOFiSTiKUtilitiesTestSuite(TestCase):
         with self.subTest():
             self.assertEqual(decode_cdb_status(3), status_list[1] + "\n" + status_list[0])
 
+    def test_decode_beam_end_releases(self) -> None:
+        """Tests for the `decode_beam_end_release` and `decode_beam_end_releases`
+        functions.
+        """
+        itp2s = [0, 1, 16, 48, 127, 144]
+        releases = ["", "N", "MY", "MYMZ", "NVYVZMTMYMZMB", "MY"]
+
+        for index, itp2 in enumerate(itp2s):
+            with self.subTest(itp2 = itp2):
+                self.assertEqual(decode_beam_end_release(itp2), releases[index])
+
+        with self.subTest():
+            self.assertEqual(decode_beam_end_releases(itp2s).tolist(), releases)
+
     def test_decode_nodal_boundary_condition(self) -> None:
         """Tests for the `decode_nodal_boundary_condition` function. Results have been
         taken from:
@@ -49,6 +67,18 @@ class SOFiSTiKUtilitiesTestSuite(TestCase):
             with self.subTest(kfix = kfix):
                 self.assertEqual(decode_nodal_boundary_condition(kfix), nodal_bcs[index])
 
+    def test_decode_nodal_boundary_conditions(self) -> None:
+        """Tests for the `decode_nodal_boundary_conditions` function, which must
+        match `decode_nodal_boundary_condition` for every `kfix`.
+        """
+        kfixs = list(range(2048))
+        decoded = decode_nodal_boundary_conditions(kfixs)
+
+        self.assertEqual(
+            list(decoded), [decode_nodal_boundary_condition(_) for _ in kfixs]
+        )
+        self.assertEqual(decoded.codes.tolist(), [_ & 63 for _ in kfixs])
+
     def test_get_element_type(self) -> None:
         """Tests for the `get_element_type` function.
         Refer to section 018/-2 in SOFiHELP CDBase.
@@ -71,3 +101,21 @@ class SOFiSTiKUtilitiesTestSuite(TestCase):
         for index, expected_str in enumerate(expected_strings):
             with self.subTest(index = index):
                 self.assertEqual(long_to_str(long_to_convert[index]), expected_str)
+
+    def test_longs_to_str(self) -> None:
+        """Test for the `longs_to_str` function, which must match `long_to_str`
+        value by value.
+        """
+        longs = [[538985306, 538986067], [542400332, 0], [0x00410042, -1]]
+        expected = ["".join(long_to_str(_) for _ in row) for row in longs]
+
+        with self.subTest(msg="Rows"):
+            self.assertEqual(longs_to_str(longs).tolist(), expected)
+
+        with self.subTest(msg="Values"):
+            self.assertEqual(
+                longs_to_str([538985306, 0x00410042]).tolist(), ["ZC  ", "BA"]
+            )
+
+        with self.subTest(msg="Empty"):
+            self.assertEqual(longs_to_str([]).size, 0)
@@ -0,0 +1,158 @@
+# standard library imports
+from unittest import TestCase
+
+# third party library imports
+from numpy import array, float64
+from numpy.linalg import norm
+from numpy.testing import assert_allclose
+
+# local library specific imports
+from py_sofistik_utils import generate_model, MemoryDll, SOFiSTiKCDBReader
+
+
+class SyntheticModelTestSuite(TestCase):
+    def setUp(self) -> None:
+        self.cdb = SOFiSTiKCDBReader(
+            "",
+            "SYNTHETIC",
+            "",
+            dll=MemoryDll(
+                generate_model(
+                    n_nodes=100,
+                    n_beams=20,
+                    n_trusses=10,
+                    n_cables=10,
+                    n_springs=5,
+                    n_quads=8,
+                    load_cases=[1, 2],
+                    n_stations=4,
+                    n_groups=2,
+                    n_secondary_groups=3,
+                    n_properties=2
+                )
+            )
+        )
+        self.cdb.initialize()
+
+    def tearDown(self) -> None:
+        self.cdb.close()
+
+    def test_tables(self) -> None:
+        sizes = {
+            "beam_data": 20,
+            "beam_load": 2 * 20,
+            "beam_result": 2 * 20 * 4,
+            "beam_stress": 2 * 20 * 4,
+            "cable_data": 10,
+            "cable_load": 2 * 10,
+            "cable_result": 2 * 10,
+            "group_data": 2,
+            "group_lc_data": 2 * 2,
+            "node_data": 100,
+            "node_result": 2 * 100,
+            "plate_data": 8,
+            "sec_group_lc_data": 2 * 3,
+            "spring_data": 5,
+            "spring_result": 2 * 5,
+            "truss_data": 10,
+            "truss_load": 2 * 10,
+            "truss_result": 2 * 10
+        }
+        for table, size in sizes.items():
+            with self.subTest(table=table):
+                self.cdb.load_table(table, [1, 2])
+                self.assertEqual(len(self.cdb.table_data(table)), size)
+
+    def test_groups(self) -> None:
+        self.cdb.load_table("truss_data")
+        data = self.cdb.table_data("truss_data", ["GROUP", "ELEM_ID"])
+
+        self.assertEqual(data["GROUP"].tolist(), [1] * 5 + [2] * 5)
+        self.assertEqual(data["ELEM_ID"].tolist(), [*range(11, 16), *range(21, 26)])
+
+    def test_group_names(self) -> None:
+        self.cdb.load_table("group_data")
+        self.cdb.load_table("sec_group_lc_data", 2)
+
+        self.assertEqual(
+            self.cdb.table_data("group_data")["GROUP_NAME"].tolist(),
+            ["GROUP 1", "GROUP 2"]
+        )
+        self.assertEqual(
+            self.cdb.table_data("sec_group_lc_data")["GROUP"].tolist(),
+            ["S000", "S001", "S002"]
+        )
+
+    def test_consistency(self) -> None:
+        self.cdb.load_table("node_data")
+        self.cdb.load_table("cable_data")
+        nodes = self.cdb.table_data("node_data").set_index("ID")
+        cables = self.cdb.table_data("cable_data")
+
+        with self.subTest(msg="Element lengths"):
+            xyz = nodes[["X0", "Y0", "Z0"]]
+            delta = (
+                xyz.loc[cables["N2"]].to_numpy() - xyz.loc[cables["N1"]].to_numpy()
+            )
+            assert_allclose(norm(delta, axis=1), cables["L0"], rtol=1E-6)
+
+        with self.subTest(msg="Beam forces"):
+            self.cdb.load_table("beam_result", 1)
+            beam = self.cdb.table_data("beam_result")
+            beam = beam[beam["ELEM_ID"] == 101]
+            assert_allclose(
+                beam["MY"].to_numpy() - beam["MY"].iloc[0],
+                beam["VZ"].to_numpy() * beam["STATION"].to_numpy(),
+                atol=1E-5
+            )
+
+    def test_boundary_conditions(self) -> None:
+        self.cdb.load_table("node_data")
+        nodes = self.cdb.table_data("node_data")
+        supports = nodes["ID"][nodes["KFIX"] == "PP"].tolist()
+
+        self.assertEqual(set(nodes["KFIX"]), {"PP", "FREE"})
+        self.assertEqual(self.cdb.nodes.data.get_supported_nodes("PZ").tolist(), supports)
+        self.assertEqual(self.cdb.nodes.data.get_supported_nodes("MX").size, 0)
+        self.assertEqual(
+            str(self.cdb.nodes.data.get_supported_nodes("MX").dtype), "int64"
+        )
+        self.assertEqual(self.cdb.nodes.data.get_boundary_condition(supports[0]), "PP")
+
+        with self.assertRaises(LookupError):
+            self.cdb.nodes.data.get_supported_nodes("UX")
+
+    def test_beam_releases(self) -> None:
+        self.cdb.load_table("beam_data")
+        beams = self.cdb.table_data("beam_data")
+        hinged = beams["ELEM_ID"].to_numpy()[1::2].tolist()
+
+        self.assertEqual(str(beams["RELEASES_END_2"].dtype), "int8")
+        self.assertEqual(self.cdb.beam_geo.get_released_elements("MY").tolist(), hinged)
+        self.assertEqual(self.cdb.beam_geo.get_released_elements("MY", 1).size, 0)
+        self.assertEqual(self.cdb.beam_geo.get_released_elements("MZ").size, 0)
+        self.assertEqual(self.cdb.beam_geo.get_element_releases(hinged[0]), ("", "MY"))
+
+        with self.assertRaises(LookupError):
+            self.cdb.beam_geo.get_released_elements("MY", 3)
+
+    def test_load_cases(self) -> None:
+        self.cdb.load_case.load(2)
+        self.assertEqual(self.cdb.load_case._name[2], "LC 2")
+        assert_allclose(
+            self.cdb.load_case._factors[2],
+            array([1.0, 0.0, 0.0, 0.0], dtype=float64)
+        )
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(RuntimeError):
+            generate_model(n_nodes=2)
+
+        with self.assertRaises(RuntimeError):
+            generate_model(n_groups=1000)
+
+        with self.assertRaises(RuntimeError):
+            generate_model(n_secondary_groups=1001)
+
+        with self.assertRaises(RuntimeError):
+            generate_model(n_properties=0)